@@ -0,0 +1,69 @@
+import argparse
+import sys
+
+from benchmarks import cases  # noqa: F401 (registers the benchmarks)
+from benchmarks.runner import (
+    DEFAULT_BASELINE_PATH,
+    DEFAULT_REPEAT,
+    DEFAULT_THRESHOLD,
+    compare,
+    load,
+    run,
+    save,
+)
+
+
+def main(arguments=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Run the benchmarks and compare them against the baseline",
+    )
+    parser.add_argument(
+        "--baseline",
+        default=DEFAULT_BASELINE_PATH,
+        help=f"Baseline results (default: {DEFAULT_BASELINE_PATH})",
+    )
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="Store the results as the new baseline instead of comparing",
+    )
+    parser.add_argument(
+        "--require-baseline",
+        action="store_true",
+        help="Fail when there is no baseline to compare against (e.g. in CI) instead of only warning",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help=f"Relative slowdown that counts as a regression (default: {DEFAULT_THRESHOLD})",
+    )
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument(
+        "--filter", default=None, help="Only run benchmarks containing this text"
+    )
+    parser.add_argument("--output", default=None, help="Also store the results here")
+    args = parser.parse_args(arguments)
+
+    results = run(args.filter, args.repeat)
+    if args.output:
+        save(args.output, results)
+    if args.save_baseline:
+        save(args.baseline, results)
+        print(f"Baseline stored in {args.baseline}")
+        return 0
+
+    baseline = load(args.baseline)
+    if baseline is None:
+        print(f"No baseline in {args.baseline}, run with --save-baseline to create it")
+        return 2 if args.require_baseline else 0
+    regressions = compare(baseline, results, args.threshold)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    print(f"{len(regressions)} regression(s) above {args.threshold:.0%}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,294 @@
+import atexit
+import json
+import os
+from datetime import datetime
+from functools import lru_cache
+from typing import List
+
+import requests
+
+from models.commit_model import CommitDetail
+from models.repo_model import Repository
+from models.timestamps import parse_epoch
+from models.user_model import AuthorizedUserProfile
+from schemas.commits_schema import list_commits_schema
+from schemas.repos_schema import list_repositories_schema
+from schemas.user_schema import negative_response_schema, user_profile_schema
+from utils.http_client import GitHubClient
+from utils.local_api_data import Dataset, public_profile
+from utils.lazy_models import lazy_from_dict_many
+from utils.local_api_server import LocalGitHubAPI
+from utils.pagination import MAX_PER_PAGE, iter_items, iter_pages
+from utils.schema_validator import (
+    IdentityMap,
+    from_dict,
+    from_dict_many,
+    validate_json_schema,
+)
+from utils.synthetic_data import SyntheticDataGenerator
+from utils.timestamps import datetime64_column
+
+from benchmarks.runner import benchmark, memory_benchmark
+
+SEED = 0
+SIZES = (1, 100, 10_000)
+MEMORY_SIZE = 10_000
+VALIDATION_SIZE = 100
+FETCHED_COMMITS = 10_000
+ACCOUNT_LOGIN = "benchmark-account"
+
+_generator = SyntheticDataGenerator(SEED)
+
+
+@lru_cache(maxsize=None)
+def account() -> dict:
+    return _generator.user(0, login=ACCOUNT_LOGIN)
+
+
+@lru_cache(maxsize=None)
+def _encoded_items(kind: str) -> List[bytes]:
+    """
+    Returns the JSON of the largest batch of synthetic items of a kind, one item per element.
+    """
+    count = max(SIZES)
+    if kind == "repositories":
+        items = _generator.repositories(account(), count)
+    elif kind == "commits":
+        repo = next(_generator.repositories(account(), 1))
+        items = _generator.commits(repo, count)
+    else:
+        items = (_generator.user(index) for index in range(count))
+    return [json.dumps(item).encode() for item in items]
+
+
+def payload(kind: str, count: int) -> bytes:
+    """
+    Returns the JSON array of the first count synthetic items of a kind: repositories, commits or profiles.
+    """
+    return b"[" + b",".join(_encoded_items(kind)[:count]) + b"]"
+
+
+# Schema validation
+
+
+def _validation(data, schema):
+    return lambda: validate_json_schema(data, schema)
+
+
+@benchmark("validate_json_schema/USER_PROFILE_SCHEMA/private")
+def validate_private_profile():
+    return _validation(account(), user_profile_schema())
+
+
+@benchmark("validate_json_schema/USER_PROFILE_SCHEMA/public")
+def validate_public_profile():
+    return _validation(public_profile(account()), user_profile_schema())
+
+
+@benchmark("validate_json_schema/NEGATIVE_RESPONSE_SCHEMA")
+def validate_negative_response():
+    error = {
+        "message": "Not Found",
+        "documentation_url": "https://docs.github.com/rest",
+        "status": "404",
+    }
+    return _validation(error, negative_response_schema())
+
+
+@benchmark(f"validate_json_schema/LIST_REPOSITORIES_SCHEMA/{VALIDATION_SIZE}")
+def validate_repositories():
+    return _validation(
+        json.loads(payload("repositories", VALIDATION_SIZE)), list_repositories_schema()
+    )
+
+
+@benchmark(f"validate_json_schema/LIST_COMMITS_SCHEMA/{VALIDATION_SIZE}")
+def validate_commits():
+    return _validation(
+        json.loads(payload("commits", VALIDATION_SIZE)), list_commits_schema()
+    )
+
+
+# Model conversion. from_dict leaves its input untouched, so the decoded items are reused by every call
+
+
+def _register_conversions(kind: str, dataclass_type):
+    for size in SIZES:
+
+        def setup(size=size):
+            items = json.loads(payload(kind, size))
+            return lambda: [from_dict(item, dataclass_type) for item in items]
+
+        benchmark(f"from_dict/{dataclass_type.__name__}/{size}")(setup)
+
+        def setup_many(size=size):
+            items = json.loads(payload(kind, size))
+            return lambda: from_dict_many(items, dataclass_type)
+
+        benchmark(f"from_dict_many/{dataclass_type.__name__}/{size}")(setup_many)
+
+        def setup_interned(size=size):
+            items = json.loads(payload(kind, size))
+            return lambda: from_dict_many(items, dataclass_type, IdentityMap())
+
+        benchmark(f"from_dict_many/{dataclass_type.__name__}/{size}/interned")(
+            setup_interned
+        )
+
+
+_register_conversions("repositories", Repository)
+_register_conversions("commits", CommitDetail)
+_register_conversions("profiles", AuthorizedUserProfile)
+
+
+# Reading a couple of fields of every model, converted eagerly or wrapped in lazy proxies
+
+
+def _register_field_reads(kind: str, dataclass_type, read):
+    size = max(SIZES)
+
+    def setup_eager():
+        items = json.loads(payload(kind, size))
+        return lambda: [read(model) for model in from_dict_many(items, dataclass_type)]
+
+    benchmark(f"read_fields/{dataclass_type.__name__}/{size}/from_dict_many")(
+        setup_eager
+    )
+
+    def setup_lazy():
+        items = json.loads(payload(kind, size))
+        return lambda: [
+            read(model) for model in lazy_from_dict_many(items, dataclass_type)
+        ]
+
+    benchmark(f"read_fields/{dataclass_type.__name__}/{size}/lazy_from_dict_many")(
+        setup_lazy
+    )
+
+
+_register_field_reads(
+    "repositories", Repository, lambda repo: (repo.name, repo.owner.login)
+)
+_register_field_reads(
+    "commits", CommitDetail, lambda commit: (commit.sha, commit.commit.author.date)
+)
+
+
+# Model memory: bytes kept alive per converted instance, nested model objects and the strings they hold
+# included. The decoded items are dropped once converted, as they would be after a response is processed
+
+
+def _register_memory(kind: str, dataclass_type):
+    def setup():
+        content = payload(kind, MEMORY_SIZE)
+        return lambda: from_dict_many(json.loads(content), dataclass_type)
+
+    memory_benchmark(f"memory/{dataclass_type.__name__}")(setup)
+
+    def setup_interned():
+        content = payload(kind, MEMORY_SIZE)
+        return lambda: from_dict_many(
+            json.loads(content), dataclass_type, IdentityMap()
+        )
+
+    memory_benchmark(f"memory/{dataclass_type.__name__}/interned")(setup_interned)
+
+
+_register_memory("repositories", Repository)
+_register_memory("commits", CommitDetail)
+_register_memory("profiles", AuthorizedUserProfile)
+
+
+# Timestamp parsing of the committer dates of the largest batch of commits. parse_epoch is timed without its
+# cache, which the warm-up call would otherwise fill
+
+
+def _commit_dates() -> List[str]:
+    return [
+        item["commit"]["committer"]["date"]
+        for item in json.loads(payload("commits", max(SIZES)))
+    ]
+
+
+@benchmark(f"timestamps/strptime/{max(SIZES)}")
+def parse_dates_with_strptime():
+    dates = _commit_dates()
+    return lambda: [datetime.strptime(date, "%Y-%m-%dT%H:%M:%SZ") for date in dates]
+
+
+@benchmark(f"timestamps/parse_epoch/{max(SIZES)}")
+def parse_dates_to_epochs():
+    dates = _commit_dates()
+    parse = parse_epoch.__wrapped__
+    return lambda: [parse(date) for date in dates]
+
+
+@benchmark(f"timestamps/datetime64_column/{max(SIZES)}")
+def parse_date_column():
+    dates = _commit_dates()
+    return lambda: datetime64_column(dates)
+
+
+# Response decoding
+
+
+def _response(content: bytes) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response._content = content
+    response.encoding = "utf-8"
+    return response
+
+
+@benchmark(f"decode/repositories/{MAX_PER_PAGE}")
+def decode_repositories_page():
+    return _response(payload("repositories", MAX_PER_PAGE)).json
+
+
+@benchmark(f"decode/commits/{MAX_PER_PAGE}")
+def decode_commits_page():
+    return _response(payload("commits", MAX_PER_PAGE)).json
+
+
+# Paginated fetching against the local stand-in of the API
+
+
+@lru_cache(maxsize=None)
+def local_api() -> LocalGitHubAPI:
+    os.environ.setdefault("GITHUB_TOKEN", "benchmark-token")
+    dataset = Dataset()
+    dataset.add_user(account(), token=os.environ["GITHUB_TOKEN"])
+    repo = dataset.add_repository(next(_generator.repositories(account(), 1)))
+    for item in _generator.commits(repo, FETCHED_COMMITS):
+        dataset.add_commit(repo["full_name"], item)
+
+    api = LocalGitHubAPI(dataset, rate_limit=10**9).start()
+    atexit.register(api.stop)
+    return api
+
+
+def _fetch_commits(max_workers: int):
+    api = local_api()
+    repo = api.dataset.repositories[0]
+    url = f"{api.url}/repos/{repo['full_name']}/commits"
+    client = GitHubClient(use_cache=False)
+    headers = client.auth_headers(scheme="Bearer")
+
+    def fetch():
+        pages = iter_pages(
+            client, url, {"per_page": MAX_PER_PAGE}, headers, max_workers=max_workers
+        )
+        count = sum(1 for _ in iter_items(pages))
+        assert count == FETCHED_COMMITS, count
+
+    return fetch
+
+
+@benchmark(f"fetch/commits/{FETCHED_COMMITS}/serial")
+def fetch_commits_serially():
+    return _fetch_commits(max_workers=1)
+
+
+@benchmark(f"fetch/commits/{FETCHED_COMMITS}/prefetch")
+def fetch_commits_prefetched():
+    return _fetch_commits(max_workers=4)
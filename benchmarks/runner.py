@@ -0,0 +1,187 @@
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Callable, List, Optional
+
+DEFAULT_BASELINE_PATH = "benchmarks/baseline.json"
+DEFAULT_THRESHOLD = 0.25
+DEFAULT_REPEAT = 5
+
+# Minimum duration of one timed repetition; fast benchmarks are looped until they reach it
+MIN_REPETITION_SECONDS = 0.05
+
+
+@dataclass
+class Benchmark:
+    name: str
+    setup: Callable[
+        [], Callable[[], object]
+    ]  # returns the function to time, with its data ready
+    per_call_setup: bool = (
+        False  # whether setup must run before every call (e.g. the call mutates its data)
+    )
+    memory: bool = False  # whether to measure bytes per returned object instead of time
+
+
+_BENCHMARKS: List[Benchmark] = []
+
+
+def benchmark(name: str, per_call_setup: bool = False):
+    """
+    Registers a benchmark. The decorated function prepares the data and returns the function to time.
+    """
+
+    def register(setup):
+        _BENCHMARKS.append(Benchmark(name, setup, per_call_setup))
+        return setup
+
+    return register
+
+
+def memory_benchmark(name: str):
+    """
+    Registers a memory benchmark. The decorated function prepares the data and returns the function whose
+    returned list of objects is measured, in bytes allocated per object.
+    """
+
+    def register(setup):
+        _BENCHMARKS.append(Benchmark(name, setup, memory=True))
+        return setup
+
+    return register
+
+
+def benchmarks(name_filter: str = None) -> List[Benchmark]:
+    return [case for case in _BENCHMARKS if not name_filter or name_filter in case.name]
+
+
+def _time(case: Benchmark, number: int, function: Callable = None) -> float:
+    if case.per_call_setup:
+        functions = [case.setup() for _ in range(number)]
+    else:
+        functions = [function] * number
+    started = time.perf_counter()
+    for call in functions:
+        call()
+    return time.perf_counter() - started
+
+
+def measure(case: Benchmark, repeat: int = DEFAULT_REPEAT) -> dict:
+    """
+    Times a benchmark and returns the median and minimum seconds per call over repeat repetitions.
+    Every repetition loops over the call until it lasts at least MIN_REPETITION_SECONDS.
+    """
+    function = None if case.per_call_setup else case.setup()
+    # Warm-up, e.g. to compile or fill caches like a long-running suite would
+    (function or case.setup())()
+
+    number = 1
+    elapsed = _time(case, number, function)
+    while elapsed < MIN_REPETITION_SECONDS:
+        number *= 2
+        elapsed = _time(case, number, function)
+    timings = [elapsed / number]
+    timings += [_time(case, number, function) / number for _ in range(repeat - 1)]
+
+    return {
+        "median": statistics.median(timings),
+        "min": min(timings),
+        "repeat": repeat,
+        "number": number,
+    }
+
+
+def measure_memory(case: Benchmark) -> dict:
+    """
+    Returns the bytes allocated per object by the function of a memory benchmark: everything the call
+    allocates and keeps alive (nested objects included), except the list holding the objects.
+    """
+    function = case.setup()
+    # Warm-up, so that caches filled on the first call are not measured
+    function()
+    gc.collect()
+
+    tracemalloc.start()
+    try:
+        objects = function()
+        allocated, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    per_object = (allocated - sys.getsizeof(objects)) / len(objects)
+    return {
+        "median": per_object,
+        "min": per_object,
+        "repeat": 1,
+        "number": len(objects),
+        "unit": "B",
+    }
+
+
+def run(name_filter: str = None, repeat: int = DEFAULT_REPEAT, log=print) -> dict:
+    """
+    Runs the registered benchmarks and returns the results document.
+    """
+    results = {}
+    for case in benchmarks(name_filter):
+        results[case.name] = (
+            measure_memory(case) if case.memory else measure(case, repeat)
+        )
+        log(f"{case.name:<60} {_format(results[case.name])}")
+    return {
+        "metadata": {
+            "created_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+
+
+def compare(
+    baseline: dict, current: dict, threshold: float = DEFAULT_THRESHOLD
+) -> List[str]:
+    """
+    Compares results against a baseline and returns the regressions: benchmarks whose median grew by more
+    than threshold (e.g. 0.25 for 25%). Benchmarks missing from either side are ignored.
+    """
+    regressions = []
+    for name, result in current["results"].items():
+        reference = baseline.get("results", {}).get(name)
+        if not reference or not reference["median"]:
+            continue
+        change = result["median"] / reference["median"] - 1
+        if change > threshold:
+            regressions.append(
+                f"{name}: {_format(result)} vs baseline {_format(reference)} (+{change:.0%})"
+            )
+    return regressions
+
+
+def load(path: str) -> Optional[dict]:
+    try:
+        with open(path, encoding="utf-8") as results_file:
+            return json.load(results_file)
+    except FileNotFoundError:
+        return None
+
+
+def save(path: str, results: dict):
+    with open(path, "w", encoding="utf-8") as results_file:
+        json.dump(results, results_file, indent=2, sort_keys=True)
+        results_file.write("\n")
+
+
+def _format(result: dict) -> str:
+    value = result["median"]
+    if result.get("unit") == "B":
+        return f"{value:.0f} B"
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if value >= scale:
+            return f"{value / scale:.3f} {unit}"
+    return f"{value / 1e-9:.1f} ns"
@@ -4,7 +4,10 @@ import os
 import pytest
 from dotenv import load_dotenv
 
+from utils import api_repos, api_users
 from utils.api_users import update_user_profile
+from utils.journal import MODES
+from utils.schema_validator import SamplingPolicy, sampling
 
 ALLURE_RESULTS_DIR = "allure-results"
 
@@ -12,6 +15,69 @@ ALLURE_RESULTS_DIR = "allure-results"
 load_dotenv()
 
 
+def pytest_addoption(parser):
+    parser.addoption(
+        "--api-mode",
+        choices=MODES,
+        default=None,
+        help="live: call the API, record: also append every request to the journal, "
+        "replay: answer every request from the journal without network (default: GITHUB_API_MODE or live)",
+    )
+    parser.addoption(
+        "--api-journal",
+        default=None,
+        help="Path of the request journal (default: GITHUB_API_JOURNAL or journal/requests.jsonl)",
+    )
+    parser.addoption(
+        "--local-api",
+        action="store_true",
+        default=False,
+        help="Run against the local stand-in of the GitHub API instead of api.github.com",
+    )
+    parser.addoption(
+        "--validation-sample",
+        type=SamplingPolicy.parse,
+        default=None,
+        metavar="FIRST,LAST,RANDOM[,SEED]",
+        help="Validate only the first, the last and a seeded random sample of the items of large arrays "
+        "(default: every item, unless a test is marked with validation_sample)",
+    )
+
+
+def pytest_configure(config):
+    """
+    Exposes the journal options through the environment, where the default API client reads them.
+    """
+    if config.getoption("--api-mode"):
+        os.environ["GITHUB_API_MODE"] = config.getoption("--api-mode")
+    if config.getoption("--api-journal"):
+        os.environ["GITHUB_API_JOURNAL"] = config.getoption("--api-journal")
+
+    config.addinivalue_line(
+        "markers",
+        "validation_sample(first=10, last=10, random=50, seed=0): validate only a sample of the items "
+        "of large arrays in this test",
+    )
+
+    # Replayed requests are matched on the auth class only, so any token will do
+    if os.getenv("GITHUB_API_MODE") == "replay":
+        os.environ.setdefault("GITHUB_TOKEN", "replay-token")
+
+    # The stand-in authenticates GITHUB_TOKEN as aleixbernardo, so any token will do as well
+    if config.getoption("--local-api"):
+        from utils.local_api_server import LocalGitHubAPI
+
+        os.environ.setdefault("GITHUB_TOKEN", "local-token")
+        config.local_api = LocalGitHubAPI().start()
+        api_repos.BASE_URL = api_users.BASE_URL = config.local_api.url
+
+
+def pytest_unconfigure(config):
+    local_api = getattr(config, "local_api", None)
+    if local_api is not None:
+        local_api.stop()
+
+
 @pytest.fixture(scope="session", autouse=True)
 def clean_allure_results():
     """
@@ -26,6 +92,21 @@ def clean_allure_results():
     os.makedirs(ALLURE_RESULTS_DIR)
 
 
+@pytest.fixture(scope="function", autouse=True)
+def validation_sampling(request):
+    """
+    Applies the sampling policy of the test (validation_sample marker) or of the run (--validation-sample)
+    to validate_json_schema. Without either, every item of every array is validated.
+    """
+    marker = request.node.get_closest_marker("validation_sample")
+    if marker is not None:
+        policy = SamplingPolicy(*marker.args, **marker.kwargs)
+    else:
+        policy = request.config.getoption("--validation-sample")
+    with sampling(policy):
+        yield policy
+
+
 @pytest.fixture(scope="function", autouse=False)
 def reset_github_profile_attributes():
     """
@@ -2,15 +2,16 @@ from dataclasses import dataclass
 from typing import List, Optional
 
 from models.user_model import UserProfile
+from models.timestamps import parse_epoch
 
 
-@dataclass
+@dataclass(slots=True)
 class Tree:
     url: str
     sha: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Verification:
     verified: bool
     reason: str
@@ -19,14 +20,18 @@ class Verification:
     verified_at: Optional[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class CommitInfo:
     name: str
     email: str
     date: str
 
+    @property
+    def date_epoch(self) -> int:
+        return parse_epoch(self.date)
 
-@dataclass
+
+@dataclass(slots=True)
 class Commit:
     url: str
     author: CommitInfo
@@ -37,14 +42,14 @@ class Commit:
     verification: Verification
 
 
-@dataclass
+@dataclass(slots=True)
 class Parent:
     url: str
     html_url: str
     sha: str
 
 
-@dataclass
+@dataclass(slots=True)
 class CommitDetail:
     url: str
     sha: str
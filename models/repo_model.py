@@ -1,10 +1,11 @@
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from typing import Optional, List
 
 from models.user_model import UserProfile
+from models.timestamps import parse_epoch
 
 
-@dataclass
+@dataclass(slots=True)
 class Permissions:
     admin: bool
     maintain: bool
@@ -13,7 +14,50 @@ class Permissions:
     pull: bool
 
 
-@dataclass
+# The API URLs of a repository that are its url followed by a fixed suffix (URI templates included). Repository
+# keeps them as regular fields, but only stores the values that differ from the derived ones (see _DerivedURL).
+# Assigning url does not change them (see _BaseURL)
+URL_SUFFIXES = {
+    "forks_url": "/forks",
+    "keys_url": "/keys{/key_id}",
+    "collaborators_url": "/collaborators{/collaborator}",
+    "teams_url": "/teams",
+    "hooks_url": "/hooks",
+    "issue_events_url": "/issues/events{/number}",
+    "events_url": "/events",
+    "assignees_url": "/assignees{/user}",
+    "branches_url": "/branches{/branch}",
+    "tags_url": "/tags",
+    "blobs_url": "/git/blobs{/sha}",
+    "git_tags_url": "/git/tags{/sha}",
+    "git_refs_url": "/git/refs{/sha}",
+    "trees_url": "/git/trees{/sha}",
+    "statuses_url": "/statuses/{sha}",
+    "languages_url": "/languages",
+    "stargazers_url": "/stargazers",
+    "contributors_url": "/contributors",
+    "subscribers_url": "/subscribers",
+    "subscription_url": "/subscription",
+    "commits_url": "/commits{/sha}",
+    "git_commits_url": "/git/commits{/sha}",
+    "comments_url": "/comments{/number}",
+    "issue_comment_url": "/issues/comments{/number}",
+    "contents_url": "/contents/{+path}",
+    "compare_url": "/compare/{base}...{head}",
+    "merges_url": "/merges",
+    "archive_url": "/{archive_format}{/ref}",
+    "downloads_url": "/downloads",
+    "issues_url": "/issues{/number}",
+    "pulls_url": "/pulls{/number}",
+    "milestones_url": "/milestones{/number}",
+    "notifications_url": "/notifications{?since,all,participating}",
+    "labels_url": "/labels{/name}",
+    "releases_url": "/releases{/id}",
+    "deployments_url": "/deployments",
+}
+
+
+@dataclass(slots=True)
 class Repository:
     id: int
     node_id: str
@@ -95,3 +139,99 @@ class Repository:
     watchers: int
     default_branch: str
     permissions: Permissions
+
+    @property
+    def created_at_epoch(self) -> int:
+        return parse_epoch(self.created_at)
+
+    @property
+    def updated_at_epoch(self) -> int:
+        return parse_epoch(self.updated_at)
+
+    @property
+    def pushed_at_epoch(self) -> Optional[int]:
+        return parse_epoch(self.pushed_at)
+
+    def to_dict(self) -> dict:
+        """
+        Returns the repository as the API represents it, the same as dataclasses.asdict(repository).
+        """
+        return asdict(self)
+
+
+# Stored in the slot of a URL field whose value is the derived one
+_DERIVED = object()
+
+
+class _DerivedURL:
+    """
+    Replaces the slot descriptor of a URL field listed in URL_SUFFIXES. A value equal to the repository url
+    followed by the suffix of the field is not stored but rebuilt on access, so dataclasses.fields, asdict,
+    replace, copy and pickle see the field and its value as usual.
+    """
+
+    __slots__ = ("slot", "suffix")
+
+    def __init__(self, slot, suffix: str):
+        self.slot = slot
+        self.suffix = suffix
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        value = self.slot.__get__(instance, owner)
+        return instance.url + self.suffix if value is _DERIVED else value
+
+    def __set__(self, instance, value):
+        # url is a field declared before every URL field, so __init__ and copying both assign it first
+        try:
+            derived = instance.url + self.suffix
+        except AttributeError:
+            derived = None
+        self.slot.__set__(instance, _DERIVED if value == derived else value)
+
+    def __delete__(self, instance):
+        self.slot.__delete__(instance)
+
+
+class _BaseURL:
+    """
+    Replaces the slot descriptor of the url field. Before url changes, the URL fields that are still derived
+    from it are given their value, so that assigning url leaves them unchanged as for a plain dataclass.
+    """
+
+    __slots__ = ("slot", "derived")
+
+    def __init__(self, slot, derived: List[_DerivedURL]):
+        self.slot = slot
+        self.derived = derived
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        return self.slot.__get__(instance, owner)
+
+    def __set__(self, instance, value):
+        try:
+            previous = self.slot.__get__(instance)
+        except AttributeError:
+            # Not set yet: __init__ or copying, before any URL field
+            previous = value
+        if value != previous:
+            for field in self.derived:
+                try:
+                    if field.slot.__get__(instance) is _DERIVED:
+                        field.slot.__set__(instance, previous + field.suffix)
+                except AttributeError:
+                    pass
+        self.slot.__set__(instance, value)
+
+    def __delete__(self, instance):
+        self.slot.__delete__(instance)
+
+
+for _name, _suffix in URL_SUFFIXES.items():
+    setattr(Repository, _name, _DerivedURL(vars(Repository)[_name], _suffix))
+Repository.url = _BaseURL(
+    vars(Repository)["url"], [vars(Repository)[_name] for _name in URL_SUFFIXES]
+)
@@ -0,0 +1,52 @@
+from datetime import date, datetime, timezone
+from functools import lru_cache
+from math import floor
+from typing import Optional
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+@lru_cache(maxsize=65536)
+def parse_epoch(value: Optional[str]) -> Optional[int]:
+    """
+    Parses an ISO 8601 timestamp into seconds since the epoch, or None for None.
+
+    Timestamps in the format the API returns them (YYYY-MM-DDTHH:MM:SSZ) are read by position, several
+    times faster than datetime.strptime; other forms (offsets, fractions of a second or plain dates) go through
+    datetime.fromisoformat, naive ones being taken as UTC. Results are cached, as the same timestamp often
+    appears many times in a response, e.g. as both the author and the committer date of a commit.
+
+    Raises an exception: ValueError if the value is not a valid timestamp.
+    """
+    if value is None:
+        return None
+    if (
+        len(value) == 20
+        and value[4] == "-"
+        and value[7] == "-"
+        and value[10] == "T"
+        and value[13] == ":"
+        and value[16] == ":"
+        and value[19] == "Z"
+        # int() would also accept signs, spaces and non-ASCII digits in the fields
+        and value.isascii()
+        and value[:4].isdigit()
+        and value[5:7].isdigit()
+        and value[8:10].isdigit()
+        and value[11:13].isdigit()
+        and value[14:16].isdigit()
+        and value[17:19].isdigit()
+    ):
+        hour, minute, second = int(value[11:13]), int(value[14:16]), int(value[17:19])
+        if hour > 23 or minute > 59 or second > 59:
+            raise ValueError(f"Invalid timestamp: {value!r}")
+        # date validates the day against the month and year
+        days = (
+            date(int(value[:4]), int(value[5:7]), int(value[8:10])).toordinal()
+            - _EPOCH_ORDINAL
+        )
+        return days * 86400 + hour * 3600 + minute * 60 + second
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return floor(parsed.timestamp())
@@ -1,8 +1,10 @@
 from dataclasses import dataclass
 from typing import Optional, Dict
 
+from models.timestamps import parse_epoch
 
-@dataclass
+
+@dataclass(slots=True)
 class UserProfile:
     login: str
     id: int
@@ -38,8 +40,16 @@ class UserProfile:
     created_at: Optional[str] = None
     updated_at: Optional[str] = None  # Add default for missing field
 
+    @property
+    def created_at_epoch(self) -> Optional[int]:
+        return parse_epoch(self.created_at)
+
+    @property
+    def updated_at_epoch(self) -> Optional[int]:
+        return parse_epoch(self.updated_at)
+
 
-@dataclass
+@dataclass(slots=True)
 class AuthorizedUserProfile(UserProfile):
     # Private fields (only available when authenticated)
     private_gists: Optional[int] = None
@@ -0,0 +1,57 @@
+import threading
+
+from referencing import Registry
+from referencing.jsonschema import DRAFT202012
+
+from schemas.loader import lazy_attributes, load_schema
+
+# Subschemas used by several API schemas (schemas/data/definitions.json). They are referenced with $ref and
+# resolved through the shared registry, so every validator shares a single copy of each
+DEFINITIONS_URI = "https://github-testing.local/schemas/definitions.json"
+
+_registry = None
+_registry_lock = threading.Lock()
+
+
+def definitions_schema() -> dict:
+    """
+    Returns the schema holding the shared subschemas under $defs.
+    """
+    return load_schema("definitions")
+
+
+def schema_registry() -> Registry:
+    """
+    Returns the registry the $refs of every schema are resolved against, built the first time it is needed.
+    """
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = (
+                    Registry()
+                    .with_resource(
+                        DEFINITIONS_URI,
+                        DRAFT202012.create_resource(definitions_schema()),
+                    )
+                    .crawl()
+                )
+    return _registry
+
+
+def definition_ref(name: str) -> dict:
+    """
+    Returns a $ref to a subschema of the definitions schema.
+    """
+    return {"$ref": f"{DEFINITIONS_URI}#/$defs/{name}"}
+
+
+SIMPLE_USER = definition_ref("simple-user")
+EMPTY_OBJECT = definition_ref("empty-object")
+GIT_USER = definition_ref("git-user")
+PLAN = definition_ref("plan")
+
+__getattr__ = lazy_attributes(
+    __name__,
+    {"DEFINITIONS_SCHEMA": definitions_schema, "SCHEMA_REGISTRY": schema_registry},
+)
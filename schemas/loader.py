@@ -0,0 +1,48 @@
+import json
+import os
+import threading
+from typing import Dict
+
+SCHEMAS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
+# Loaded schemas by name. Every caller gets the same dict, so validators compiled for it are shared too
+_schemas: Dict[str, dict] = {}
+_schemas_lock = threading.Lock()
+
+
+def load_schema(name: str) -> dict:
+    """
+    Returns a JSON Schema stored in schemas/data, reading the file only the first time it is requested
+    in the process. Schemas are shared and must be treated as immutable.
+
+    Parameters:
+    - name (str): The file name of the schema without the .json extension, e.g. 'list_commits'.
+
+    Returns:
+    - dict: The schema.
+    - Raises an exception: FileNotFoundError if there is no schema with that name.
+    """
+    schema = _schemas.get(name)
+    if schema is not None:
+        return schema
+
+    with _schemas_lock:
+        if name not in _schemas:
+            path = os.path.join(SCHEMAS_DIR, f"{name}.json")
+            with open(path, encoding="utf-8") as schema_file:
+                _schemas[name] = json.load(schema_file)
+    return _schemas[name]
+
+
+def lazy_attributes(module_name: str, accessors: Dict[str, callable]):
+    """
+    Returns a module __getattr__ resolving the former schema constants (e.g. LIST_COMMITS_SCHEMA) through
+    their accessor functions, so existing imports keep working and load the schema on first use.
+    """
+
+    def __getattr__(name: str):
+        if name in accessors:
+            return accessors[name]()
+        raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+
+    return __getattr__
@@ -0,0 +1,71 @@
+import json
+import os
+from collections import deque
+
+import pytest
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+from utils.local_api_server import LocalGitHubAPI
+
+
+class FakeAdapter(BaseAdapter):
+    """
+    Transport adapter that answers with scripted responses instead of opening connections, and keeps
+    the requests it was sent. The last scripted response is repeated once the others are used up.
+    A scripted exception is raised instead of answering.
+    """
+
+    def __init__(self, responses):
+        super().__init__()
+        self.responses = deque(responses)
+        self.requests = []
+
+    def send(self, request, **kwargs):
+        self.requests.append(request)
+        scripted = self.responses.popleft() if len(self.responses) > 1 else self.responses[0]
+        if isinstance(scripted, BaseException):
+            raise scripted
+
+        status_code, headers, body = scripted
+        response = requests.Response()
+        response.status_code = status_code
+        response.headers = CaseInsensitiveDict(headers)
+        response._content = body if isinstance(body, bytes) else json.dumps(body).encode()
+        response.encoding = "utf-8"
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        return response
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def fake_adapter():
+    """
+    Returns a function that mounts a FakeAdapter with the given responses on the session of a client
+    (in the calling thread) and returns the adapter.
+    """
+
+    def mount(client, *responses) -> FakeAdapter:
+        adapter = FakeAdapter(responses)
+        client.session.mount("https://", adapter)
+        client.session.mount("http://", adapter)
+        return adapter
+
+    return mount
+
+
+@pytest.fixture(scope="module")
+def local_api():
+    """
+    Serves the default dataset of the local stand-in and points the API helpers at it.
+    """
+    monkeypatch = pytest.MonkeyPatch()
+    monkeypatch.setenv("GITHUB_TOKEN", os.getenv("GITHUB_TOKEN") or "local-token")
+    with LocalGitHubAPI() as api, api.patch_base_urls():
+        yield api
+    monkeypatch.undo()
@@ -0,0 +1,105 @@
+import asyncio
+
+import allure
+
+from utils import api_repos_async, api_users_async
+from utils.api_repos import get_commits_of_repository
+from utils.api_users import get_user_profile
+from utils.async_client import (
+    AsyncGitHubClient,
+    close_default_async_client,
+    gather_limited,
+    get_default_async_client,
+)
+
+
+def _run(helper, *args, **kwargs):
+    """
+    Runs an async helper on a new event loop with its own client, closed afterwards.
+    """
+
+    async def main():
+        async with AsyncGitHubClient() as client:
+            result = helper(*args, client=client, **kwargs)
+            if hasattr(result, "__aiter__"):
+                return [item async for item in result]
+            return await result
+
+    return asyncio.run(main())
+
+
+@allure.epic("GitHub API")
+@allure.feature("Async Client")
+class TestAsyncGitHubClient:
+    @allure.story("Answer like the synchronous helpers")
+    def test_user_profile_matches_sync_helper(self, local_api):
+        response = _run(api_users_async.get_user_profile, "octocat")
+
+        assert response.status_code == 200
+        assert response.json() == get_user_profile("octocat").json()
+
+    @allure.story("Fetch many resources concurrently")
+    def test_user_profiles_keep_request_order(self, local_api):
+        usernames = ["octocat", "aleixbernardo", "mbernardo95", "user-that-does-not-exist"]
+
+        responses = _run(api_users_async.get_user_profiles, usernames, limit=2)
+
+        assert [response.status_code for response in responses] == [200, 200, 200, 404]
+        assert [response.json().get("login") for response in responses[:3]] == usernames[:3]
+
+    @allure.story("Iterate over every commit")
+    def test_commit_iterator_follows_next_links(self, local_api):
+        expected = get_commits_of_repository("octocat", "Hello-World", per_page=100).json()
+
+        commits = _run(api_repos_async.iter_commits_of_repository, "octocat", "Hello-World", per_page=1)
+
+        assert [commit["sha"] for commit in commits] == [commit["sha"] for commit in expected]
+
+    @allure.story("Revalidate with ETag")
+    def test_repeated_request_is_served_from_cache(self, local_api):
+        async def main():
+            async with AsyncGitHubClient() as client:
+                first = await api_repos_async.get_commits_of_repository("octocat", "Hello-World", client=client)
+                second = await api_repos_async.get_commits_of_repository("octocat", "Hello-World", client=client)
+            return first, second
+
+        first, second = asyncio.run(main())
+
+        assert not getattr(first, "from_cache", False)
+        assert second.from_cache is True
+        assert second.json() == first.json()
+
+    @allure.story("Bound the concurrency")
+    def test_gather_limited_runs_at_most_limit_coroutines(self):
+        running, peak = 0, 0
+
+        async def task(number):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return number
+
+        results = asyncio.run(gather_limited((task(number) for number in range(10)), limit=3))
+
+        assert results == list(range(10))
+        assert peak == 3
+
+    @allure.story("Close the default client of an event loop")
+    def test_default_client_is_closed_and_forgotten(self, local_api):
+        async def main():
+            try:
+                profile = await api_users_async.get_user_profile("octocat")
+                client = get_default_async_client()
+            finally:
+                await close_default_async_client()
+            replaced = get_default_async_client() is not client
+            await close_default_async_client()
+            return profile, client, replaced
+
+        profile, client, replaced = asyncio.run(main())
+
+        assert profile.status_code == 200
+        assert client._http.is_closed
+        assert replaced
@@ -0,0 +1,96 @@
+import allure
+import pytest
+
+from utils.http_cache import ConditionalRequestCache
+from utils.http_client import GitHubClient
+
+URL = "https://api.github.com/users/octocat"
+BODY = {"login": "octocat"}
+
+
+@pytest.fixture
+def client():
+    client = GitHubClient(rate_limit=False, retry=False)
+    yield client
+    client.close()
+
+
+@allure.epic("GitHub API")
+@allure.feature("Conditional Requests")
+class TestConditionalRequestCache:
+    @allure.story("Serve a 304 revalidation from the cache")
+    def test_not_modified_is_served_from_cache(self, client, fake_adapter):
+        adapter = fake_adapter(
+            client,
+            (200, {"ETag": 'W/"v1"', "Content-Type": "application/json", "X-RateLimit-Remaining": "10"}, BODY),
+            (304, {"ETag": 'W/"v1"', "X-RateLimit-Remaining": "9"}, b""),
+        )
+
+        first = client.get(URL)
+        second = client.get(URL)
+
+        assert "If-None-Match" not in adapter.requests[0].headers
+        assert adapter.requests[1].headers["If-None-Match"] == 'W/"v1"'
+        assert second.status_code == 200
+        assert second.from_cache is True
+        assert second.json() == first.json() == BODY
+        # Fresh headers come from the 304, entity headers from the cached response
+        assert second.headers["X-RateLimit-Remaining"] == "9"
+        assert second.headers["Content-Type"] == "application/json"
+
+    @allure.story("Revalidate with Last-Modified")
+    def test_last_modified_is_sent_as_if_modified_since(self, client, fake_adapter):
+        last_modified = "Wed, 21 Oct 2015 07:28:00 GMT"
+        adapter = fake_adapter(client, (200, {"Last-Modified": last_modified}, BODY))
+
+        client.get(URL)
+        client.get(URL)
+
+        assert adapter.requests[1].headers["If-Modified-Since"] == last_modified
+
+    @allure.story("Replace the cached response when it changed")
+    def test_modified_response_replaces_the_entry(self, client, fake_adapter):
+        fake_adapter(
+            client,
+            (200, {"ETag": '"v1"'}, BODY),
+            (200, {"ETag": '"v2"'}, {"login": "octocat", "name": "The Octocat"}),
+            (304, {}, b""),
+        )
+
+        client.get(URL)
+        changed = client.get(URL)
+        cached = client.get(URL)
+
+        assert not getattr(changed, "from_cache", False)
+        assert cached.json() == changed.json()
+
+    @allure.story("Never share responses between tokens")
+    def test_entries_are_keyed_by_token(self):
+        cache = ConditionalRequestCache()
+        anonymous = cache.key(URL)
+        token = cache.key(URL, headers={"Authorization": "token first"})
+        other_token = cache.key(URL, headers={"Authorization": "token second"})
+
+        assert len({anonymous, token, other_token}) == 3
+        assert "first" not in repr(token)
+
+    @allure.story("Cache only responses with validators")
+    def test_response_without_validators_is_not_cached(self):
+        cache = ConditionalRequestCache()
+
+        assert cache.store(cache.key(URL), {"Content-Type": "application/json"}, b"{}") is False
+        assert len(cache) == 0
+
+    @allure.story("Evict the least recently used entry")
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = ConditionalRequestCache(max_entries=2)
+        first, second, third = (cache.key(URL, params={"page": page}) for page in (1, 2, 3))
+        cache.store(first, {"ETag": '"1"'}, b"1")
+        cache.store(second, {"ETag": '"2"'}, b"2")
+        cache.get(first)
+
+        cache.store(third, {"ETag": '"3"'}, b"3")
+
+        assert cache.get(first) is not None
+        assert cache.get(second) is None
+        assert cache.get(third) is not None
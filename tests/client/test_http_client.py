@@ -0,0 +1,80 @@
+import threading
+
+import allure
+import pytest
+
+from utils import api_users
+from utils.api_repos import get_commits_of_repository
+from utils.api_users import get_user_profile
+from utils.http_client import (
+    GitHubClient,
+    build_auth_headers,
+    get_default_client,
+    set_default_client,
+)
+
+
+@pytest.fixture
+def client():
+    client = GitHubClient(use_cache=False, rate_limit=False, retry=False)
+    yield client
+    client.close()
+
+
+@allure.epic("GitHub API")
+@allure.feature("HTTP Client")
+class TestGitHubClient:
+    @allure.story("Send the helper requests through the given client")
+    def test_helper_uses_injected_client(self, client, fake_adapter, monkeypatch):
+        monkeypatch.setenv("GITHUB_TOKEN", "client-token")
+        adapter = fake_adapter(client, (200, {}, {"login": "octocat"}))
+
+        response = get_user_profile("octocat", client=client)
+
+        assert response.json() == {"login": "octocat"}
+        assert [request.url for request in adapter.requests] == [f"{api_users.BASE_URL}/users/octocat"]
+        assert adapter.requests[0].headers["Authorization"] == "token client-token"
+
+    @allure.story("Send the helper requests through the default client")
+    def test_helper_uses_default_client(self, client, fake_adapter, monkeypatch):
+        monkeypatch.setenv("GITHUB_TOKEN", "client-token")
+        adapter = fake_adapter(client, (200, {}, []))
+        previous = get_default_client()
+        set_default_client(client)
+        try:
+            get_commits_of_repository("octocat", "Hello-World", per_page=5)
+        finally:
+            set_default_client(previous)
+
+        assert len(adapter.requests) == 1
+        assert "per_page=5" in adapter.requests[0].url
+        assert adapter.requests[0].headers["Authorization"] == "Bearer client-token"
+
+    @allure.story("Share one connection pool between threads")
+    def test_threads_get_own_sessions_on_one_pool(self, client):
+        sessions = []
+        thread = threading.Thread(target=lambda: sessions.append(client.session))
+        thread.start()
+        thread.join()
+
+        assert client.session is client.session
+        assert sessions[0] is not client.session
+        assert sessions[0].get_adapter("https://api.github.com") is client.session.get_adapter(
+            "https://api.github.com"
+        )
+
+    @allure.story("Build the authorization headers once per token")
+    def test_auth_headers_are_built_once_per_token(self, monkeypatch):
+        monkeypatch.setenv("GITHUB_TOKEN", "client-token")
+
+        assert build_auth_headers() is build_auth_headers()
+        assert build_auth_headers(scheme="Bearer") == {"Authorization": "Bearer client-token"}
+        assert build_auth_headers(random_token=True) != build_auth_headers(random_token=True)
+        assert build_auth_headers(include_token=False) == {}
+
+    @allure.story("Require a token")
+    def test_missing_token_raises(self, monkeypatch):
+        monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+
+        with pytest.raises(ValueError, match="GITHUB_TOKEN is missing"):
+            build_auth_headers()
@@ -0,0 +1,126 @@
+import json
+
+import allure
+import pytest
+
+from utils.http_client import GitHubClient
+from utils.journal import RECORD, REPLAY, Journal, JournalMissError, auth_class
+
+URL = "https://api.github.com/user"
+TOKEN = "journal-token"
+
+
+@pytest.fixture(autouse=True)
+def github_token(monkeypatch):
+    monkeypatch.setenv("GITHUB_TOKEN", TOKEN)
+
+
+@pytest.fixture
+def journal_path(tmp_path):
+    return str(tmp_path / "journal" / "requests.jsonl")
+
+
+def _record(journal_path, *exchanges):
+    """
+    Records (method, params, headers, status_code, body) exchanges of URL to the journal.
+    """
+    journal = Journal(journal_path, RECORD)
+    for method, params, headers, status_code, body in exchanges:
+        journal.record(method, URL, params, headers, None, status_code, {"ETag": '"e"'}, json.dumps(body))
+    return journal
+
+
+@allure.epic("GitHub API")
+@allure.feature("Record and Replay")
+class TestJournal:
+    @allure.story("Never write the token")
+    def test_record_writes_auth_class_only(self, journal_path):
+        _record(journal_path, ("GET", {"page": 1}, {"Authorization": f"token {TOKEN}"}, 200, {"login": "aleix"}))
+
+        with open(journal_path, encoding="utf-8") as journal_file:
+            text = journal_file.read()
+        entry = json.loads(text)
+
+        assert TOKEN not in text
+        assert entry["auth"] == "token"
+        assert entry["params"] == {"page": "1"}
+        assert json.loads(entry["body"]) == {"login": "aleix"}
+
+    @allure.story("Replay recorded responses in order")
+    def test_replay_serves_responses_in_order_and_repeats_the_last(self, journal_path):
+        headers = {"Authorization": f"token {TOKEN}"}
+        _record(
+            journal_path,
+            ("GET", None, headers, 200, {"name": "before"}),
+            ("GET", None, headers, 200, {"name": "after"}),
+        )
+        journal = Journal(journal_path, REPLAY)
+
+        bodies = [json.loads(journal.replay("GET", URL, headers=headers)["body"])["name"] for _ in range(3)]
+
+        assert bodies == ["before", "after", "after"]
+
+    @allure.story("Match requests on their auth class")
+    def test_replay_matches_the_auth_class(self, journal_path):
+        _record(
+            journal_path,
+            ("GET", None, {"Authorization": f"token {TOKEN}"}, 200, {"login": "aleix"}),
+            ("GET", None, {"Authorization": "token random"}, 401, {"message": "Bad credentials"}),
+        )
+        journal = Journal(journal_path, REPLAY)
+
+        # Any token other than GITHUB_TOKEN replays the response recorded with an invalid token
+        invalid = journal.replay("GET", URL, headers={"Authorization": "token another-random"})
+        valid = journal.replay("GET", URL, headers={"Authorization": f"Bearer {TOKEN}"})
+
+        assert invalid["status_code"] == 401
+        assert valid["status_code"] == 200
+        with pytest.raises(JournalMissError):
+            journal.replay("GET", URL)
+
+    @allure.story("Fail on requests that were never recorded")
+    def test_replay_miss_raises(self, journal_path):
+        _record(journal_path, ("GET", {"page": 1}, None, 200, []))
+        journal = Journal(journal_path, REPLAY)
+
+        with pytest.raises(JournalMissError, match="params=\\{'page': '2'\\} auth=none"):
+            journal.replay("GET", URL, params={"page": 2})
+        with pytest.raises(JournalMissError):
+            journal.replay("PATCH", URL, params={"page": 1})
+
+    @allure.story("Match on the URL path and query")
+    def test_replay_ignores_the_host_and_merges_the_query(self, journal_path):
+        _record(journal_path, ("GET", {"page": 2, "per_page": 100}, None, 200, []))
+        journal = Journal(journal_path, REPLAY)
+
+        entry = journal.replay("GET", "http://127.0.0.1:8000/user?per_page=100", params={"page": 2})
+
+        assert entry["status_code"] == 200
+
+    @allure.story("Record and replay through the client")
+    def test_client_replays_without_network(self, journal_path, fake_adapter):
+        recording = GitHubClient(use_cache=False, rate_limit=False, retry=False, journal=Journal(journal_path, RECORD))
+        try:
+            fake_adapter(recording, (200, {"X-RateLimit-Remaining": "10"}, {"login": "aleix"}))
+            recorded = recording.get(URL, headers=recording.auth_headers())
+        finally:
+            recording.close()
+
+        replaying = GitHubClient(journal=Journal(journal_path, REPLAY))
+        try:
+            adapter = fake_adapter(replaying, (500, {}, {}))
+            replayed = replaying.get(URL, headers=replaying.auth_headers())
+        finally:
+            replaying.close()
+
+        assert adapter.requests == []
+        assert replayed.from_journal is True
+        assert replayed.status_code == recorded.status_code
+        assert replayed.json() == recorded.json()
+        assert replayed.headers["X-RateLimit-Remaining"] == "10"
+
+    @allure.story("Classify the authorization header")
+    def test_auth_class(self):
+        assert auth_class(None) == "none"
+        assert auth_class({"Authorization": f"token {TOKEN}"}) == "token"
+        assert auth_class({"Authorization": "token something-else"}) == "invalid"
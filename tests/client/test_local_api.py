@@ -0,0 +1,123 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import allure
+import pytest
+
+from utils.api_repos import get_commits_of_repository, iter_commits_of_repository
+from utils.api_users import get_logged_user_profile, update_user_profile
+from utils.http_client import GitHubClient
+from utils.local_api_data import commit, default_dataset, fake_sha, simple_user
+from utils.local_api_server import LocalGitHubAPI
+
+COMMIT_COUNT = 250
+
+
+@pytest.fixture(scope="module")
+def local_api():
+    """
+    Serves the default dataset plus octocat/linguist with a long linear history, and points the helpers at it.
+    """
+    monkeypatch = pytest.MonkeyPatch()
+    monkeypatch.setenv("GITHUB_TOKEN", os.getenv("GITHUB_TOKEN") or "local-token")
+    dataset = default_dataset()
+    octocat = simple_user("octocat", 583231)
+    signature = {"name": "octocat", "email": "octocat@github.com", "date": "2020-01-01T00:00:00Z"}
+    shas = [fake_sha("linguist", number) for number in range(COMMIT_COUNT)]
+    for number in reversed(range(COMMIT_COUNT)):
+        dataset.add_commit(
+            "octocat/linguist",
+            commit(
+                "octocat/linguist",
+                shas[number],
+                f"Commit {number}",
+                signature,
+                signature,
+                octocat,
+                octocat,
+                parents=shas[number - 1 : number] if number else [],
+            ),
+        )
+
+    with LocalGitHubAPI(dataset) as api, api.patch_base_urls():
+        yield api
+    monkeypatch.undo()
+
+
+@allure.epic("GitHub API")
+@allure.feature("Local GitHub API")
+class TestLocalGitHubAPI:
+    @allure.story("Paginate with Link headers")
+    def test_link_header_pages_through_all_commits(self, local_api):
+        response = get_commits_of_repository("octocat", "linguist", per_page=100, page=2)
+
+        assert response.status_code == 200
+        assert len(response.json()) == 100
+        assert set(response.links) == {"prev", "next", "last", "first"}
+        assert "page=3" in response.links["last"]["url"]
+
+    @pytest.mark.parametrize("max_workers", [1, 4])
+    @allure.story("Iterate over every page")
+    def test_iterator_returns_every_commit_in_order(self, local_api, max_workers):
+        client = GitHubClient()
+        try:
+            commits = list(
+                iter_commits_of_repository("octocat", "linguist", per_page=30, max_workers=max_workers, client=client)
+            )
+        finally:
+            client.close()
+
+        assert [item["commit"]["message"] for item in commits] == [
+            f"Commit {number}" for number in reversed(range(COMMIT_COUNT))
+        ]
+
+    @allure.story("Revalidate with ETag")
+    def test_repeated_request_is_revalidated_with_etag(self, local_api):
+        client = GitHubClient()
+        try:
+            first = get_commits_of_repository("octocat", "hello-world", client=client)
+            second = get_commits_of_repository("octocat", "hello-world", client=client)
+        finally:
+            client.close()
+
+        assert not getattr(first, "from_cache", False)
+        assert second.from_cache is True
+        assert second.json() == first.json()
+
+    @allure.story("Report the rate limit")
+    def test_rate_limit_headers_count_down(self, local_api):
+        first = get_commits_of_repository("octocat", "hello-world", per_page=1)
+        second = get_commits_of_repository("octocat", "hello-world", per_page=2)
+
+        assert first.headers["X-RateLimit-Limit"] == "5000"
+        assert int(second.headers["X-RateLimit-Remaining"]) < int(first.headers["X-RateLimit-Remaining"])
+
+    @allure.story("Ignore unknown profile fields")
+    def test_update_ignores_unknown_fields(self, local_api):
+        response = update_user_profile({"bio": "Tester", "favourite_colour": "green"})
+
+        assert response.status_code == 200
+        assert response.json()["bio"] == "Tester"
+        assert "favourite_colour" not in response.json()
+
+    @allure.story("Never serve a half-updated profile")
+    def test_concurrent_updates_and_reads_are_consistent(self, local_api):
+        # Without the rate limit scheduler, which spaces mutating requests
+        client = GitHubClient(use_cache=False, rate_limit=False)
+
+        def update(number: int):
+            body = {"name": f"Name {number}", "bio": f"Name {number}"}
+            return update_user_profile(body, client=client).json()
+
+        def read(_):
+            return get_logged_user_profile(client=client).json()
+
+        try:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                updates = executor.map(update, range(40))
+                reads = executor.map(read, range(40))
+                profiles = list(updates) + list(reads)
+        finally:
+            client.close()
+
+        assert all(profile["name"] == profile["bio"] for profile in profiles)
@@ -0,0 +1,98 @@
+import allure
+import pytest
+import requests
+
+from utils.api_repos import (
+    get_commits_of_repository,
+    get_repositories_from_logged_user,
+    get_repositories_from_user,
+    iter_commits_of_repository,
+    iter_repositories_from_logged_user,
+    iter_repositories_from_user,
+)
+from utils.http_client import GitHubClient
+
+
+@pytest.fixture
+def client():
+    client = GitHubClient()
+    yield client
+    client.close()
+
+
+@allure.epic("GitHub API")
+@allure.feature("Pagination")
+class TestPagination:
+    @allure.story("Iterate over every repository of a user")
+    def test_user_repositories_follow_next_links(self, local_api, client):
+        expected = get_repositories_from_user("octocat", per_page=100, client=client).json()
+
+        repositories = list(iter_repositories_from_user("octocat", per_page=3, max_workers=1, client=client))
+
+        assert len(expected) > 3
+        assert [repo["full_name"] for repo in repositories] == [repo["full_name"] for repo in expected]
+
+    @allure.story("Iterate over every repository of the logged user")
+    def test_logged_user_repositories_follow_next_links(self, local_api, client):
+        expected = get_repositories_from_logged_user(per_page=100, client=client).json()
+
+        repositories = list(iter_repositories_from_logged_user(per_page=2, max_workers=1, client=client))
+
+        assert [repo["id"] for repo in repositories] == [repo["id"] for repo in expected]
+
+    @allure.story("Iterate over every commit of a repository")
+    def test_commits_follow_next_links(self, local_api, client):
+        expected = get_commits_of_repository("octocat", "Hello-World", per_page=100, client=client).json()
+
+        commits = list(iter_commits_of_repository("octocat", "Hello-World", per_page=1, max_workers=1, client=client))
+
+        assert [commit["sha"] for commit in commits] == [commit["sha"] for commit in expected]
+
+    @allure.story("Fetch pages lazily")
+    def test_pages_are_fetched_as_items_are_consumed(self, local_api, client):
+        repositories = iter_repositories_from_user("octocat", per_page=3, max_workers=1, client=client)
+        remaining = _remaining_quota(local_api)
+
+        first = next(repositories)
+
+        assert first["owner"]["login"] == "octocat"
+        # One request for the first page, plus the quota check itself
+        assert remaining - _remaining_quota(local_api) == 2
+
+    @allure.story("Prefetch the remaining pages")
+    def test_prefetched_pages_keep_page_order(self, local_api, client):
+        expected = get_repositories_from_user("octocat", per_page=100, client=client).json()
+
+        repositories = list(iter_repositories_from_user("octocat", per_page=2, max_workers=4, client=client))
+
+        assert [repo["full_name"] for repo in repositories] == [repo["full_name"] for repo in expected]
+
+    @allure.story("Reuse the prefetch threads of the client")
+    def test_repeated_iteration_keeps_sessions_bounded(self, local_api):
+        client = GitHubClient(prefetch_workers=2)
+        try:
+            for _ in range(20):
+                list(iter_repositories_from_user("octocat", per_page=2, client=client))
+                next(iter_commits_of_repository("octocat", "Hello-World", per_page=1, client=client))
+
+            # The calling thread plus the prefetch threads
+            assert len(client._sessions) <= 1 + client.prefetch_workers
+        finally:
+            client.close()
+
+    @allure.story("Fail on error pages")
+    def test_missing_user_raises(self, local_api, client):
+        with pytest.raises(requests.HTTPError):
+            list(iter_repositories_from_user("user-that-does-not-exist", client=client))
+
+
+def _remaining_quota(local_api) -> int:
+    """
+    Returns the quota of the token left on the local stand-in, which counts every request it answers.
+    """
+    client = GitHubClient(use_cache=False)
+    try:
+        response = client.get(f"{local_api.url}/users/octocat", headers=client.auth_headers())
+    finally:
+        client.close()
+    return int(response.headers["X-RateLimit-Remaining"])
@@ -0,0 +1,114 @@
+from email.utils import formatdate
+
+import allure
+import pytest
+
+from utils.rate_limit import RateLimitScheduler, retry_after_seconds
+
+URL = "https://api.github.com/users/octocat"
+TOKEN = {"Authorization": "token first"}
+OTHER_TOKEN = {"Authorization": "token second"}
+NOW = 1_700_000_000.0
+
+
+class FakeClock:
+    """
+    Clock that only moves when the scheduler sleeps, so delays can be asserted exactly.
+    """
+
+    def __init__(self, now: float = NOW):
+        self.now = now
+        self.slept = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def _scheduler(clock, **kwargs) -> RateLimitScheduler:
+    return RateLimitScheduler(clock=clock, sleep=clock.sleep, **kwargs)
+
+
+def _rate_limit_headers(remaining: int, reset: float, limit: int = 5000) -> dict:
+    return {
+        "X-RateLimit-Limit": str(limit),
+        "X-RateLimit-Remaining": str(remaining),
+        "X-RateLimit-Reset": str(int(reset)),
+    }
+
+
+@allure.epic("GitHub API")
+@allure.feature("Rate Limit")
+class TestRateLimitScheduler:
+    @allure.story("Send requests without waiting while there is quota")
+    def test_requests_are_not_delayed_by_default(self, clock):
+        scheduler = _scheduler(clock)
+        scheduler.update(URL, TOKEN, 200, _rate_limit_headers(4000, NOW + 3600))
+
+        assert [scheduler.reserve("GET", URL, TOKEN) for _ in range(20)] == [0.0] * 20
+
+    @allure.story("Pace requests with a token bucket")
+    def test_token_bucket_spaces_requests_after_the_burst(self, clock):
+        scheduler = _scheduler(clock, requests_per_second=10, burst=2)
+
+        delays = [scheduler.reserve("GET", URL, TOKEN) for _ in range(4)]
+
+        assert delays == pytest.approx([0.0, 0.0, 0.1, 0.2])
+
+    @allure.story("Wait for the reset when the quota is exhausted")
+    def test_exhausted_quota_waits_until_reset(self, clock):
+        scheduler = _scheduler(clock)
+        scheduler.update(URL, TOKEN, 200, _rate_limit_headers(0, NOW + 60))
+
+        scheduler.wait("GET", URL, TOKEN)
+
+        assert clock.slept == [60.0]
+        # Other tokens have their own quota
+        assert scheduler.reserve("GET", URL, OTHER_TOKEN) == 0.0
+
+    @allure.story("Spread the last requests until the reset")
+    def test_low_quota_is_spread_until_reset(self, clock):
+        scheduler = _scheduler(clock, low_water_mark=100)
+        scheduler.update(URL, TOKEN, 200, _rate_limit_headers(10, NOW + 100))
+
+        delays = [scheduler.reserve("GET", URL, TOKEN) for _ in range(3)]
+
+        # 10 requests left for 100 seconds: one every 10 seconds
+        assert delays == pytest.approx([0.0, 10.0, 20.0])
+
+    @allure.story("Space mutating requests")
+    def test_mutating_requests_are_spaced(self, clock):
+        scheduler = _scheduler(clock, mutating_interval=1.0)
+
+        delays = [scheduler.reserve("PATCH", URL, TOKEN) for _ in range(3)]
+
+        assert delays == [0.0, 1.0, 2.0]
+        assert scheduler.reserve("GET", URL, TOKEN) == 0.0
+
+    @pytest.mark.parametrize(
+        "retry_after", ["30", formatdate(NOW + 30, usegmt=True)], ids=["seconds", "http-date"]
+    )
+    @allure.story("Honour Retry-After")
+    def test_retry_after_blocks_the_token(self, clock, retry_after):
+        scheduler = _scheduler(clock)
+
+        scheduler.update(URL, TOKEN, 429, {"Retry-After": retry_after})
+
+        assert scheduler.reserve("GET", URL, TOKEN) == pytest.approx(30.0)
+        assert scheduler.reserve("GET", URL, OTHER_TOKEN) == 0.0
+
+    @allure.story("Parse Retry-After")
+    def test_retry_after_seconds(self):
+        assert retry_after_seconds("120") == 120.0
+        assert retry_after_seconds(formatdate(NOW + 45, usegmt=True), now=NOW) == pytest.approx(45.0)
+        assert retry_after_seconds(formatdate(NOW - 45, usegmt=True), now=NOW) == 0.0
+        assert retry_after_seconds("soon") is None
+        assert retry_after_seconds(None) is None
@@ -0,0 +1,148 @@
+import random
+import time
+from email.utils import formatdate
+
+import allure
+import pytest
+import requests
+
+from utils.http_client import GitHubClient
+from utils.retry import RetryPolicy
+
+URL = "https://api.github.com/users/octocat"
+
+
+class FakeResponse:
+    def __init__(self, status_code: int, headers: dict = None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+def _sender(*outcomes):
+    """
+    Returns a send() that answers with the given responses or raises the given exceptions, in order,
+    and counts its calls.
+    """
+    outcomes = list(outcomes)
+
+    def send():
+        send.calls += 1
+        outcome = outcomes.pop(0) if len(outcomes) > 1 else outcomes[0]
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome
+
+    send.calls = 0
+    return send
+
+
+def _policy(**kwargs) -> RetryPolicy:
+    slept = []
+    policy = RetryPolicy(rng=random.Random(0), sleep=slept.append, **kwargs)
+    policy.slept = slept
+    return policy
+
+
+@allure.epic("GitHub API")
+@allure.feature("Retry")
+class TestRetryPolicy:
+    @allure.story("Stop after max_attempts")
+    def test_attempts_are_bounded(self):
+        policy = _policy(max_attempts=3)
+        send = _sender(FakeResponse(503))
+
+        response = policy.call("GET", URL, send)
+
+        assert send.calls == 3
+        assert response.status_code == 503
+        assert [attempt.status_code for attempt in response.attempts] == [503, 503, 503]
+        assert len(policy.slept) == 2
+
+    @allure.story("Return the first successful response")
+    def test_transient_failure_is_retried_until_success(self):
+        policy = _policy()
+        send = _sender(FakeResponse(502), FakeResponse(504), FakeResponse(200))
+
+        response = policy.call("GET", URL, send)
+
+        assert send.calls == 3
+        assert response.status_code == 200
+        assert [attempt.delay for attempt in response.attempts] == policy.slept + [0.0]
+
+    @allure.story("Back off with full jitter")
+    def test_backoff_stays_within_the_exponential_ceiling(self):
+        policy = _policy(base_delay=0.5, max_delay=4.0)
+
+        for retry_number in range(1, 8):
+            ceiling = min(4.0, 0.5 * 2 ** (retry_number - 1))
+            delays = [policy.backoff(retry_number) for _ in range(200)]
+            assert all(0 <= delay <= ceiling for delay in delays)
+            assert max(delays) > ceiling / 2
+
+    @allure.story("Stop when the retry budget is spent")
+    def test_retry_budget_bounds_the_total_wait(self):
+        policy = _policy(max_attempts=10, retry_budget=5.0)
+        send = _sender(FakeResponse(429, {"Retry-After": "2"}))
+
+        response = policy.call("GET", URL, send)
+
+        assert policy.slept == [2.0, 2.0]
+        assert sum(policy.slept) <= 5.0
+        assert len(response.attempts) == 3
+
+    @pytest.mark.parametrize("http_date", [False, True], ids=["seconds", "http-date"])
+    @allure.story("Wait at least Retry-After")
+    def test_retry_after_is_honoured(self, http_date):
+        retry_after = formatdate(time.time() + 20, usegmt=True) if http_date else "20"
+        policy = _policy()
+        send = _sender(FakeResponse(403, {"Retry-After": retry_after}), FakeResponse(200))
+
+        policy.call("GET", URL, send)
+
+        assert 18 <= policy.slept[0] <= 20
+
+    @allure.story("Retry only rate limit 403s")
+    def test_forbidden_without_rate_limit_is_not_retried(self):
+        policy = _policy()
+        send = _sender(FakeResponse(403, {"X-RateLimit-Remaining": "4999"}))
+
+        policy.call("GET", URL, send)
+
+        assert send.calls == 1
+
+    @allure.story("Do not retry non-idempotent requests unless asked")
+    def test_patch_is_retried_only_on_opt_in(self):
+        policy = _policy()
+
+        send = _sender(FakeResponse(503), FakeResponse(200))
+        assert policy.call("PATCH", URL, send).status_code == 503
+        assert send.calls == 1
+
+        send = _sender(FakeResponse(503), FakeResponse(200))
+        assert policy.call("PATCH", URL, send, retry_non_idempotent=True).status_code == 200
+        assert send.calls == 2
+
+    @allure.story("Retry transport errors")
+    def test_transport_error_is_raised_with_its_attempts(self):
+        policy = _policy(max_attempts=2)
+        send = _sender(requests.ConnectionError("connection reset"))
+
+        with pytest.raises(requests.ConnectionError) as error:
+            policy.call("GET", URL, send, transport_errors=(requests.ConnectionError,))
+
+        assert send.calls == 2
+        assert [attempt.error for attempt in error.value.attempts] == [
+            "ConnectionError('connection reset')"
+        ] * 2
+
+    @allure.story("Retry through the client")
+    def test_client_retries_transient_statuses(self, fake_adapter):
+        client = GitHubClient(use_cache=False, rate_limit=False, retry_policy=_policy())
+        try:
+            adapter = fake_adapter(client, (503, {}, {}), (200, {}, {"login": "octocat"}))
+            response = client.get(URL)
+        finally:
+            client.close()
+
+        assert len(adapter.requests) == 2
+        assert response.json() == {"login": "octocat"}
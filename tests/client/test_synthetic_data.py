@@ -0,0 +1,55 @@
+import os
+
+import allure
+
+from schemas.commits_schema import list_commits_schema
+from schemas.repos_schema import list_repositories_schema
+from schemas.user_schema import user_profile_schema
+from utils.api_repos import iter_commits_of_repository, iter_repositories_from_logged_user
+from utils.local_api_server import LocalGitHubAPI
+from utils.schema_validator import validate_json_schema
+from utils.synthetic_data import SyntheticDataGenerator, generate, load_dataset
+
+
+@allure.epic("GitHub API")
+@allure.feature("Synthetic Data")
+class TestSyntheticData:
+    @allure.story("Generated objects match the schemas")
+    def test_generated_objects_are_schema_valid(self):
+        generator = SyntheticDataGenerator(seed=1)
+        account = generator.user(0)
+        repositories = list(generator.repositories(account, 50))
+
+        validate_json_schema(account, user_profile_schema())
+        for profile in generator.users(20):
+            validate_json_schema(profile, user_profile_schema())
+        validate_json_schema(repositories, list_repositories_schema())
+        validate_json_schema(list(generator.commits(repositories[0], 200)), list_commits_schema())
+
+    @allure.story("Generated data is reproducible")
+    def test_same_seed_generates_same_commit_history(self):
+        repo = next(SyntheticDataGenerator(seed=2).repositories(SyntheticDataGenerator(seed=2).user(0), 1))
+
+        first = list(SyntheticDataGenerator(seed=2).commits(repo, 300))
+        second = list(SyntheticDataGenerator(seed=2).commits(repo, 300))
+        other_seed = list(SyntheticDataGenerator(seed=3).commits(repo, 300))
+
+        assert first == second
+        assert first != other_seed
+        assert all(
+            item["parents"][0]["sha"] == parent["sha"] for item, parent in zip(first, first[1:])
+        )
+
+    @allure.story("Serve a generated dataset")
+    def test_generated_dataset_is_served_by_local_api(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("GITHUB_TOKEN", os.getenv("GITHUB_TOKEN") or "local-token")
+        written = generate(str(tmp_path), seed=4, users=5, repositories=120, commits=250)
+
+        with LocalGitHubAPI(load_dataset(str(tmp_path))) as api, api.patch_base_urls():
+            repositories = list(iter_repositories_from_logged_user())
+            commits = list(
+                iter_commits_of_repository("synthetic-account", api.dataset.repositories[0]["name"])
+            )
+
+        assert len(repositories) == written["repositories.ndjson"] == 120
+        assert len(commits) == 250
@@ -1,5 +1,4 @@
 import string
-from datetime import datetime
 from pprint import pprint
 
 import allure
@@ -9,10 +8,11 @@ from error_messages.messages import ErrorMessages
 from models.commit_model import CommitDetail
 from models.repo_model import Repository
 from models.user_model import AuthorizedUserProfile, UserProfile
-from schemas.commits_schema import LIST_COMMITS_SCHEMA
-from schemas.user_schema import USER_PROFILE_SCHEMA, NEGATIVE_RESPONSE_SCHEMA
+from schemas.commits_schema import list_commits_schema
+from schemas.user_schema import negative_response_schema, user_profile_schema
 from utils.api_repos import get_commits_of_repository
-from utils.schema_validator import validate_json_schema, from_dict
+from utils.schema_validator import validate_json_schema, from_dict, from_dict_many
+from models.timestamps import parse_epoch
 
 @pytest.mark.epic('GitHub API')
 @pytest.mark.feature('GitHub Commits')
@@ -26,7 +26,7 @@ class TestGitHubCommits:
         assert response.status_code == 200, f"Expected 200, got {response.status_code}"
 
         data = response.json()
-        validate_json_schema(data, LIST_COMMITS_SCHEMA)
+        validate_json_schema(data, list_commits_schema())
 
         for commit in data:
             commit_object = from_dict(commit, CommitDetail)
@@ -45,7 +45,7 @@ class TestGitHubCommits:
         assert response.status_code == 200, f"Expected 200, got {response.status_code}"
 
         data = response.json()
-        validate_json_schema(data, LIST_COMMITS_SCHEMA)
+        validate_json_schema(data, list_commits_schema())
 
     @pytest.mark.parametrize("repo_name", ["hello-world", "boysenberry-repo-1"])
     @pytest.mark.security
@@ -59,7 +59,7 @@ class TestGitHubCommits:
         assert response.status_code == 401, f"Expected 401, got {response.status_code}"
 
         data = response.json()
-        validate_json_schema(data, NEGATIVE_RESPONSE_SCHEMA)
+        validate_json_schema(data, negative_response_schema())
 
         assert data["message"] == ErrorMessages.INVALID_CREDENTIALS
 
@@ -72,7 +72,7 @@ class TestGitHubCommits:
         assert response.status_code == 200, f"Expected 200, got {response.status_code}"
 
         data = response.json()
-        validate_json_schema(data, LIST_COMMITS_SCHEMA)
+        validate_json_schema(data, list_commits_schema())
 
         assert len(data) == expected_count, f"Expected {expected_count}, got {len(data)}"
     @pytest.mark.story('Get List of Commits Non existent User or Repo')
@@ -108,10 +108,10 @@ class TestGitHubCommits:
         assert response.status_code == 200, f"Expected 200, got {response.status_code}"
 
         data = response.json()
-        commit_objects = [from_dict(commit, CommitDetail) for commit in data]
+        commit_objects = from_dict_many(data, CommitDetail)
 
         assert len(data) == 1
-        assert all(commit.committer["login"] == committer for commit in commit_objects)
+        assert all(commit.committer.login == committer for commit in commit_objects)
 
     @pytest.mark.parametrize("author", ["octocat", "Spaceghost", "Cameron423698"])
     @pytest.mark.story('Get List of Commits Filtering by Author')
@@ -122,10 +122,10 @@ class TestGitHubCommits:
         assert response.status_code == 200, f"Expected 200, got {response.status_code}"
 
         data = response.json()
-        commit_objects = [from_dict(commit, CommitDetail) for commit in data]
+        commit_objects = from_dict_many(data, CommitDetail)
 
         assert len(data) == 1
-        assert all(commit.author["login"] == author for commit in commit_objects)
+        assert all(commit.author.login == author for commit in commit_objects)
 
     @pytest.mark.parametrize(
         "since_value, number_commits",
@@ -137,13 +137,12 @@ class TestGitHubCommits:
         response = get_commits_of_repository("octocat", repo="hello-world", since=since_value, per_page=50)
         data = response.json()
 
-        commits_obj = [from_dict(commit, CommitDetail) for commit in data]
+        commits_obj = from_dict_many(data, CommitDetail)
         assert len(commits_obj) == number_commits
 
-        before_value_dt = datetime.strptime(since_value, "%Y-%m-%dT%H:%M:%SZ")
+        since_epoch = parse_epoch(since_value)
         for commit in commits_obj:
-            commit_date_dt = datetime.strptime(commit.commit.committer.date, "%Y-%m-%dT%H:%M:%SZ")
-            assert commit_date_dt >= before_value_dt
+            assert commit.commit.committer.date_epoch >= since_epoch
 
     @pytest.mark.parametrize(
         "invalid_date, expected_error_message",
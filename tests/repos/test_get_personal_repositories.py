@@ -1,6 +1,5 @@
 import os
 import string
-from datetime import datetime
 from pprint import pprint
 
 import allure
@@ -10,10 +9,12 @@ import requests
 from error_messages.messages import ErrorMessages
 from models.repo_model import Repository
 from models.user_model import AuthorizedUserProfile, UserProfile
-from schemas.repos_schema import LIST_REPOSITORIES_SCHEMA
-from schemas.user_schema import USER_PROFILE_SCHEMA, NEGATIVE_RESPONSE_SCHEMA
+from schemas.repos_schema import list_repositories_schema
+from schemas.user_schema import negative_response_schema, user_profile_schema
 from utils.api_repos import get_repositories_from_logged_user
-from utils.schema_validator import validate_json_schema, from_dict
+from utils import api_repos
+from utils.schema_validator import validate_json_schema, from_dict_many
+from models.timestamps import parse_epoch
 
 @pytest.mark.epic('GitHub API')
 @pytest.mark.feature('Get Personal Repositories')
@@ -29,7 +30,7 @@ class TestPersonalRepositories:
 
         with allure.step("Validate JSON schema of the response"):
             data = response.json()
-            validate_json_schema(data, LIST_REPOSITORIES_SCHEMA)
+            validate_json_schema(data, list_repositories_schema())
 
             assert len(data) == 9
 
@@ -46,7 +47,7 @@ class TestPersonalRepositories:
 
         with allure.step("Validate JSON schema of the response"):
             data = response.json()
-            validate_json_schema(data, NEGATIVE_RESPONSE_SCHEMA)
+            validate_json_schema(data, negative_response_schema())
 
         with allure.step(
             f"Send GET request to get the personal repositories with random token"
@@ -60,7 +61,7 @@ class TestPersonalRepositories:
 
         with allure.step("Validate JSON schema of the response"):
             data = response.json()
-            validate_json_schema(data, NEGATIVE_RESPONSE_SCHEMA)
+            validate_json_schema(data, negative_response_schema())
 
 
     test_cases = [
@@ -87,7 +88,7 @@ class TestPersonalRepositories:
 
         with allure.step("Validate JSON schema of the response"):
             data = response.json()
-            validate_json_schema(data, LIST_REPOSITORIES_SCHEMA)
+            validate_json_schema(data, list_repositories_schema())
 
         with allure.step(f"Check the number of repos in page {page} is {expected_count}"):
             assert (
@@ -122,7 +123,7 @@ class TestPersonalRepositories:
 
         with allure.step("Validate JSON schema of the response"):
             data = response.json()
-            validate_json_schema(data, LIST_REPOSITORIES_SCHEMA)
+            validate_json_schema(data, list_repositories_schema())
 
         with allure.step(f"Convert JSON response to list of Repo objects"):
             repo_objects = [Repository(**repo) for repo in data]
@@ -173,10 +174,10 @@ class TestPersonalRepositories:
 
         with allure.step("Validate JSON schema of the response"):
             data = response.json()
-            validate_json_schema(data, LIST_REPOSITORIES_SCHEMA)
+            validate_json_schema(data, list_repositories_schema())
 
         with allure.step(f"Convert JSON response to list of Repo objects"):
-            repo_objects = [from_dict(repo, Repository) for repo in data]
+            repo_objects = from_dict_many(data, Repository)
 
         with allure.step(
             f"Validate that repositories are filtered by type '{type_value}' ({description})"
@@ -234,10 +235,10 @@ class TestPersonalRepositories:
 
         with allure.step("Validate JSON schema of the response"):
             data = response.json()
-            validate_json_schema(data, LIST_REPOSITORIES_SCHEMA)
+            validate_json_schema(data, list_repositories_schema())
 
         with allure.step(f"Convert JSON response to list of Repo objects"):
-            repo_objects = [from_dict(repo, Repository) for repo in data]
+            repo_objects = from_dict_many(data, Repository)
 
         with allure.step(
             f"Validate that repositories are filtered by type '{visibility_value}' ({description})"
@@ -283,10 +284,10 @@ class TestPersonalRepositories:
 
         with allure.step("Validate JSON schema of the response"):
             data = response.json()
-            validate_json_schema(data, LIST_REPOSITORIES_SCHEMA)
+            validate_json_schema(data, list_repositories_schema())
 
         with allure.step(f"Convert JSON response to list of Repo objects"):
-            repo_objects = [from_dict(repo, Repository) for repo in data]
+            repo_objects = from_dict_many(data, Repository)
 
         with allure.step(
             f"Validate that repositories are filtered by affiliation_value '{affiliation_value}' ({description})"
@@ -368,15 +369,14 @@ class TestPersonalRepositories:
             data = response.json()
 
         with allure.step(f"Convert JSON response to list of Repo objects"):
-            repo_objects = [from_dict(repo, Repository) for repo in data]
+            repo_objects = from_dict_many(data, Repository)
             assert len(repo_objects) == number_repos
 
         with allure.step("Check all dates are after the since value"):
-            since_value_dt = datetime.strptime(since_value, "%Y-%m-%dT%H:%M:%SZ")
+            since_value_epoch = parse_epoch(since_value)
             for repo in repo_objects:
-                repo_updated_dt = datetime.strptime(repo.updated_at, "%Y-%m-%dT%H:%M:%SZ")
                 assert (
-                    repo_updated_dt > since_value_dt
+                    repo.updated_at_epoch > since_value_epoch
                 ), f"Repo updated_at {repo.updated_at} is not after {since_value}"
 
 
@@ -405,21 +405,20 @@ class TestPersonalRepositories:
             data = response.json()
 
         with allure.step(f"Convert JSON response to list of Repo objects"):
-            repo_objects = [from_dict(repo, Repository) for repo in data]
+            repo_objects = from_dict_many(data, Repository)
             assert len(repo_objects) == number_repos
 
         with allure.step("Check all dates are after the since value"):
-            before_value_dt = datetime.strptime(before_value, "%Y-%m-%dT%H:%M:%SZ")
+            before_value_epoch = parse_epoch(before_value)
             for repo in repo_objects:
-                repo_updated_dt = datetime.strptime(repo.updated_at, "%Y-%m-%dT%H:%M:%SZ")
                 assert (
-                    repo_updated_dt < before_value_dt
+                    repo.updated_at_epoch < before_value_epoch
                 ), f"Repo updated_at {repo.updated_at} is not before {before_value}"
 
     @pytest.mark.story('Get Personal Repositories not modified response')
     def test_get_personal_repositories_not_modified_etag(self):
         token = os.getenv("GITHUB_TOKEN")
-        url = "https://api.github.com/user/repos"
+        url = f"{api_repos.BASE_URL}/user/repos"
         headers = {
             "Authorization": f"token {token}",
             "Accept": "application/vnd.github+json",
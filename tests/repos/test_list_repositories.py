@@ -7,10 +7,10 @@ import pytest
 from error_messages.messages import ErrorMessages
 from models.repo_model import Repository
 from models.user_model import AuthorizedUserProfile, UserProfile
-from schemas.repos_schema import LIST_REPOSITORIES_SCHEMA
-from schemas.user_schema import USER_PROFILE_SCHEMA, NEGATIVE_RESPONSE_SCHEMA
+from schemas.repos_schema import list_repositories_schema
+from schemas.user_schema import negative_response_schema, user_profile_schema
 from utils.api_repos import get_repositories_from_user
-from utils.schema_validator import validate_json_schema, from_dict
+from utils.schema_validator import validate_json_schema, from_dict, from_dict_many
 
 
 @allure.epic("GitHub API Testing")
@@ -29,7 +29,7 @@ class TestGitHubRepositories:
 
         with allure.step("Validate JSON schema of the response"):
             data = response.json()
-            validate_json_schema(data, LIST_REPOSITORIES_SCHEMA)
+            validate_json_schema(data, list_repositories_schema())
 
     @allure.story("Retrieve repositories with and without authorization")
     @pytest.mark.parametrize("username", ["octocat", "aleixbernardo"])
@@ -66,7 +66,7 @@ class TestGitHubRepositories:
 
         with allure.step("Validate JSON schema"):
             data = response.json()
-            validate_json_schema(data, LIST_REPOSITORIES_SCHEMA)
+            validate_json_schema(data, list_repositories_schema())
 
         with allure.step("Check repository count is correct"):
             assert len(data) == 1
@@ -95,7 +95,7 @@ class TestGitHubRepositories:
         with allure.step("Validate HTTP status and JSON schema"):
             assert response.status_code == 200
             data = response.json()
-            validate_json_schema(data, LIST_REPOSITORIES_SCHEMA)
+            validate_json_schema(data, list_repositories_schema())
 
         with allure.step(f"Check repository count for page {page}"):
             assert len(data) == expected_count, f"Expected {expected_count}, got {len(data)}"
@@ -120,7 +120,7 @@ class TestGitHubRepositories:
 
         with allure.step("Convert to repository objects and validate sorting"):
             data = response.json()
-            repo_objects = [from_dict(repo, Repository) for repo in data]
+            repo_objects = from_dict_many(data, Repository)
 
             field_ordering = sort + "_at" if sort != "full_name" else sort
             sorted_repo_objects = sorted(
@@ -150,7 +150,7 @@ class TestGitHubRepositories:
 
         with allure.step(f"Validate repositories match filter '{type_value}'"):
             data = response.json()
-            repo_objects = [from_dict(repo, Repository) for repo in data]
+            repo_objects = from_dict_many(data, Repository)
 
             if type_value == "owner":
                 assert all(repo.owner.login == "octocat" for repo in repo_objects)
@@ -3,7 +3,7 @@ import pytest
 
 from error_messages.messages import ErrorMessages
 from models.user_model import UserProfile, AuthorizedUserProfile
-from schemas.user_schema import USER_PROFILE_SCHEMA, NEGATIVE_RESPONSE_SCHEMA
+from schemas.user_schema import negative_response_schema, user_profile_schema
 from utils.api_users import get_logged_user_profile, update_user_profile
 from utils.schema_validator import validate_json_schema
 
@@ -30,7 +30,7 @@ class TestPersonalProfile:
             "Validate JSON schema of the response"
         ):
             data = response.json()
-            validate_json_schema(data, USER_PROFILE_SCHEMA)
+            validate_json_schema(data, user_profile_schema())
 
         with allure.step("Convert JSON response to UserProfile object and verify data"):
             # Create an instance of UserProfile using the response data
@@ -70,7 +70,7 @@ class TestPersonalProfile:
             "Validate JSON schema of the response for the negative response"
         ):
             data = response.json()
-            validate_json_schema(data, NEGATIVE_RESPONSE_SCHEMA)
+            validate_json_schema(data, negative_response_schema())
 
         with allure.step("Check error message is the expected"):
             assert data["message"] == ErrorMessages.MISSING_TOKEN_ERROR
@@ -92,7 +92,7 @@ class TestPersonalProfile:
             "Validate JSON schema of the response for the negative response"
         ):
             data = response.json()
-            validate_json_schema(data, NEGATIVE_RESPONSE_SCHEMA)
+            validate_json_schema(data, negative_response_schema())
 
         with allure.step("Check error message is the expected"):
             assert data["message"] == ErrorMessages.INVALID_CREDENTIALS
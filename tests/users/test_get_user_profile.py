@@ -4,7 +4,7 @@ import pytest
 
 from error_messages.messages import ErrorMessages
 from models.user_model import AuthorizedUserProfile, UserProfile
-from schemas.user_schema import USER_PROFILE_SCHEMA, NEGATIVE_RESPONSE_SCHEMA
+from schemas.user_schema import negative_response_schema, user_profile_schema
 from utils.api_users import get_user_profile
 from utils.schema_validator import validate_json_schema
 
@@ -25,7 +25,7 @@ class TestUserProfile:
 
         with allure.step("Validate JSON schema of the response"):
             data = response.json()
-            validate_json_schema(data, USER_PROFILE_SCHEMA)
+            validate_json_schema(data, user_profile_schema())
 
         with allure.step("Convert JSON response to UserProfile object and verify data"):
             # Create an instance of UserProfile using the response data
@@ -54,7 +54,7 @@ class TestUserProfile:
 
         with allure.step("Validate JSON schema of the response"):
             data = response.json()
-            validate_json_schema(data, USER_PROFILE_SCHEMA)
+            validate_json_schema(data, user_profile_schema())
 
         with allure.step("Convert JSON response to UserProfile object and verify data"):
             # Create an instance of UserProfile using the response data
@@ -91,7 +91,7 @@ class TestUserProfile:
 
         with allure.step("Validate JSON schema of the response"):
             data = response.json()
-            validate_json_schema(data, NEGATIVE_RESPONSE_SCHEMA)
+            validate_json_schema(data, negative_response_schema())
 
         with allure.step("Check error message is the expected"):
             assert data["message"] == ErrorMessages.NOT_FOUND
@@ -6,8 +6,9 @@ import requests
 
 from error_messages.messages import ErrorMessages
 from models.user_model import UserProfile, AuthorizedUserProfile
-from schemas.user_schema import USER_PROFILE_SCHEMA, NEGATIVE_RESPONSE_SCHEMA
+from schemas.user_schema import negative_response_schema, user_profile_schema
 from utils.api_users import get_logged_user_profile, update_user_profile
+from utils import api_users
 from utils.schema_validator import validate_json_schema
 
 update_profile_cases = [
@@ -89,7 +90,7 @@ class TestUserProfileManagement:
 
         with allure.step("Validate JSON schema of the response"):
             data = response.json()
-            validate_json_schema(data, NEGATIVE_RESPONSE_SCHEMA)
+            validate_json_schema(data, negative_response_schema())
 
         with allure.step("Check error message is the expected"):
             assert data["message"] == ErrorMessages.MISSING_TOKEN_ERROR
@@ -123,7 +124,7 @@ class TestUserProfileManagement:
 
         with allure.step("Validate JSON schema of the response"):
             data = response.json()
-            validate_json_schema(data, NEGATIVE_RESPONSE_SCHEMA)
+            validate_json_schema(data, negative_response_schema())
 
         with allure.step("Check error message is the expected"):
             assert data["message"] == ErrorMessages.INVALID_CREDENTIALS
@@ -164,7 +165,7 @@ class TestUserProfileManagement:
         As a fixture, we reset the attributes so we know it has been changed.
         """
         token = os.getenv("GITHUB_TOKEN")
-        url = "https://api.github.com/user"
+        url = f"{api_users.BASE_URL}/user"
         headers = {
             "Authorization": f"token {token}",
             "Accept": "application/vnd.github+json",
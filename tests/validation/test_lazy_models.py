@@ -0,0 +1,73 @@
+import allure
+import pytest
+
+from models.commit_model import CommitDetail
+from models.repo_model import Repository
+from utils.lazy_models import LazyModel, lazy_from_dict, lazy_from_dict_many
+from utils.schema_validator import from_dict
+from utils.synthetic_data import SyntheticDataGenerator
+
+
+@pytest.fixture(scope="module")
+def repositories():
+    generator = SyntheticDataGenerator(seed=6)
+    return list(generator.repositories(generator.user(0), 20))
+
+
+@allure.epic("GitHub API")
+@allure.feature("Lazy Models")
+class TestLazyModels:
+    @allure.story("Proxies have the attributes of the dataclass")
+    def test_proxy_matches_eager_conversion(self, repositories):
+        data = repositories[3]
+        repo = lazy_from_dict(data, Repository)
+        converted = from_dict(data, Repository)
+
+        for name in Repository.__dataclass_fields__:
+            if name.startswith("_"):
+                continue
+            value = getattr(repo, name)
+            if isinstance(value, LazyModel):
+                value = value.to_model()
+            assert value == getattr(converted, name), name
+        assert repo.updated_at_epoch == converted.updated_at_epoch
+        assert repo.to_model() == converted
+
+    @allure.story("Public methods are forwarded to the dataclass")
+    def test_public_methods_are_forwarded(self, repositories):
+        repo = lazy_from_dict(repositories[3], Repository)
+
+        assert repo.to_dict() == from_dict(repositories[3], Repository).to_dict()
+        assert type(repo).to_dict.__doc__ == Repository.to_dict.__doc__
+
+    @allure.story("Nested objects are wrapped on first access")
+    def test_nested_objects_are_wrapped_on_access(self, repositories):
+        repos = lazy_from_dict_many(repositories, Repository)
+
+        assert [repo.name for repo in repos] == [repo["name"] for repo in repositories]
+        assert all(repo._values is None for repo in repos)
+        owner = repos[0].owner
+        assert type(owner).__name__ == "LazyUserProfile"
+        assert owner.login == repositories[0]["owner"]["login"]
+        assert repos[0].owner is owner
+
+    @allure.story("Optional nested objects follow from_dict")
+    def test_empty_author_is_none(self, repositories):
+        commit = next(SyntheticDataGenerator(seed=6).commits(repositories[0], 2))
+        commit = dict(commit, author={}, committer=None)
+
+        lazy_commit = lazy_from_dict(commit, CommitDetail)
+        assert lazy_commit.author is None
+        assert lazy_commit.committer is None
+        assert lazy_commit.commit.author.date_epoch == from_dict(commit, CommitDetail).commit.author.date_epoch
+        assert lazy_commit.parents[0].sha == commit["parents"][0]["sha"]
+
+    @allure.story("Missing fields are reported on access")
+    def test_missing_field_raises_attribute_error(self, repositories):
+        data = dict(repositories[0])
+        del data["name"]
+
+        repo = lazy_from_dict(data, Repository)
+        assert repo.id == data["id"]
+        with pytest.raises(AttributeError):
+            repo.name
@@ -0,0 +1,61 @@
+import os
+
+import allure
+import pytest
+
+from schemas.commits_schema import list_commits_schema
+from schemas.definitions import SIMPLE_USER
+from schemas.user_schema import negative_response_schema, user_profile_schema
+from utils.local_api_data import default_dataset, public_profile
+from utils.schema_codegen import UnsupportedSchema, build_validator, generate_source, schema_hash
+from utils.schema_validator import get_validator
+
+
+@allure.epic("GitHub API")
+@allure.feature("Schema Validation")
+class TestSchemaCodegen:
+    @allure.story("Generated validators agree with jsonschema")
+    def test_generated_validator_agrees_with_jsonschema(self, tmp_path):
+        profile = default_dataset("token").users["octocat"]
+        responses = [
+            profile,
+            public_profile(profile),
+            dict(public_profile(profile), plan={"name": "free"}),
+            dict(profile, id="583231"),
+            dict(profile, id=583231.0),
+            dict(profile, id=True),
+            {key: value for key, value in profile.items() if key != "login"},
+            [],
+            None,
+        ]
+        is_valid = build_validator(user_profile_schema(), str(tmp_path))
+
+        for response in responses:
+            assert is_valid(response) == get_validator(user_profile_schema()).is_valid(response), response
+
+    @allure.story("Share definitions between schemas")
+    def test_shared_definition_is_generated_once(self, tmp_path):
+        commit = default_dataset("token").commits["octocat/hello-world"][0]
+        source = generate_source(list_commits_schema())
+        is_valid = build_validator(list_commits_schema(), str(tmp_path))
+
+        # author and committer reference the same Simple User definition
+        assert source.count("data.get('avatar_url'") == 1
+        assert is_valid([commit]) and is_valid([dict(commit, author={})])
+        assert not is_valid([dict(commit, committer=dict(commit["committer"], login=None))])
+        assert build_validator(SIMPLE_USER, str(tmp_path))(commit["author"])
+
+    @allure.story("Cache generated validators on disk")
+    def test_generated_module_is_cached_by_schema_hash(self, tmp_path):
+        build_validator(negative_response_schema(), str(tmp_path))
+        path = os.path.join(tmp_path, f"{schema_hash(negative_response_schema())}.py")
+        assert os.listdir(tmp_path) == [os.path.basename(path)]
+
+        with open(path, "a", encoding="utf-8") as module_file:
+            module_file.write("\n\ndef is_valid(data):\n    return 'cached'\n")
+        assert build_validator(negative_response_schema(), str(tmp_path))({}) == "cached"
+
+    @allure.story("Leave unsupported schemas to jsonschema")
+    def test_unsupported_keyword_is_rejected(self):
+        with pytest.raises(UnsupportedSchema):
+            generate_source({"type": "string", "pattern": "^[a-z]+$"})
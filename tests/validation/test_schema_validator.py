@@ -0,0 +1,253 @@
+import copy
+import dataclasses
+import pickle
+import sys
+
+import allure
+import pytest
+from jsonschema import ValidationError, validate
+
+from schemas.commits_schema import list_commits_schema
+from schemas.definitions import SIMPLE_USER
+from schemas.user_schema import negative_response_schema
+from utils.local_api_data import default_dataset
+from models.commit_model import CommitDetail
+from models.repo_model import Repository
+from models.user_model import UserProfile
+from utils.schema_validator import (
+    PARALLEL_VALIDATION_THRESHOLD,
+    IdentityMap,
+    SamplingPolicy,
+    from_dict,
+    from_dict_many,
+    get_converter,
+    get_validator,
+    iter_from_dict,
+    sampling,
+    validate_json_array,
+    validate_json_schema,
+)
+
+NOT_FOUND_RESPONSE = {
+    "message": "Not Found",
+    "documentation_url": "https://docs.github.com/rest",
+    "status": "404",
+}
+
+
+@allure.epic("GitHub API")
+@allure.feature("Schema Validation")
+class TestSchemaValidator:
+    @allure.story("Compile every schema once")
+    def test_validator_is_compiled_once_per_schema(self):
+        assert get_validator(negative_response_schema()) is get_validator(negative_response_schema())
+        assert get_validator(negative_response_schema()) is not get_validator(
+            negative_response_schema(), check_formats=True
+        )
+        assert get_validator(dict(negative_response_schema())) is not get_validator(negative_response_schema())
+
+    @pytest.mark.parametrize(
+        "invalid_response",
+        [
+            {key: value for key, value in NOT_FOUND_RESPONSE.items() if key != "message"},
+            dict(NOT_FOUND_RESPONSE, documentation_url=404),
+            "Not Found",
+        ],
+    )
+    @allure.story("Report the same errors as jsonschema")
+    def test_error_message_matches_jsonschema(self, invalid_response):
+        with pytest.raises(ValidationError) as expected:
+            validate(invalid_response, negative_response_schema())
+
+        with pytest.raises(AssertionError) as error:
+            validate_json_schema(invalid_response, negative_response_schema())
+
+        assert str(error.value) == f"JSON Schema validation failed: {expected.value.message}"
+        assert validate_json_schema(NOT_FOUND_RESPONSE, negative_response_schema()) is True
+
+    @allure.story("Report every invalid item of large arrays")
+    def test_large_array_reports_every_invalid_item(self):
+        commit = default_dataset("token").commits["octocat/hello-world"][0]
+        commits = [commit] * PARALLEL_VALIDATION_THRESHOLD
+        commits[3] = dict(commit, sha=None)
+        commits[-1] = {key: value for key, value in commit.items() if key != "url"}
+
+        with sampling(None), pytest.raises(AssertionError) as error:
+            validate_json_schema(commits, list_commits_schema())
+
+        assert [(item.index, item.json_path) for item in error.value.errors] == [
+            (3, "$[3].sha"),
+            (PARALLEL_VALIDATION_THRESHOLD - 1, f"$[{PARALLEL_VALIDATION_THRESHOLD - 1}]"),
+        ]
+        assert str(error.value).startswith(
+            f"JSON Schema validation failed for 2 of {PARALLEL_VALIDATION_THRESHOLD} items:"
+        )
+
+    @allure.story("Validate chunks on a process pool")
+    def test_process_pool_finds_same_errors_as_one_process(self):
+        commit = default_dataset("token").commits["octocat/hello-world"][0]
+        commits = [commit] * 50
+        commits[7] = dict(commit, node_id=7)
+        commits[31] = dict(commit, parents=None)
+
+        errors = []
+        for workers in (1, 2):
+            with pytest.raises(AssertionError) as error:
+                validate_json_array(commits, list_commits_schema(), workers=workers, chunk_size=10, check_formats=True)
+            errors.append(error.value.errors)
+
+        assert errors[0] == errors[1]
+        assert [item.json_path for item in errors[0]] == ["$[7].node_id", "$[31].parents"]
+
+    @allure.story("Validate a sample of large arrays")
+    def test_sample_checks_first_last_and_seeded_random_items(self):
+        policy = SamplingPolicy(first=3, last=2, random=5, seed=7)
+        indexes = policy.indexes(1000)
+
+        assert indexes == sorted(set(indexes))
+        assert indexes[:3] == [0, 1, 2] and indexes[-2:] == [998, 999]
+        assert len(indexes) == 10 and SamplingPolicy(3, 2, 5, 7).indexes(1000) == indexes
+        assert policy.indexes(8) == list(range(8))
+
+    @pytest.mark.validation_sample(first=2, last=2, random=0)
+    @allure.story("Validate a sample of large arrays")
+    def test_marker_samples_validation(self, validation_sampling):
+        commit = default_dataset("token").commits["octocat/hello-world"][0]
+        commits = [commit] * 100
+        commits[50] = dict(commit, sha=None)
+
+        assert validation_sampling == SamplingPolicy(first=2, last=2, random=0)
+        assert validate_json_schema(commits, list_commits_schema()) is True
+
+        commits[98] = dict(commit, sha=None)
+        with pytest.raises(AssertionError) as error:
+            validate_json_schema(commits, list_commits_schema())
+        assert [item.json_path for item in error.value.errors] == ["$[98].sha"]
+        assert str(error.value).startswith("JSON Schema validation failed for 1 of 4 sampled items:")
+
+    @allure.story("Load schemas on first use")
+    def test_schemas_are_loaded_once_from_data_files(self):
+        from schemas import commits_schema
+
+        assert commits_schema.LIST_COMMITS_SCHEMA is list_commits_schema()
+        assert list_commits_schema()["items"]["properties"]["author"]["oneOf"][0] == SIMPLE_USER
+        with pytest.raises(AttributeError):
+            commits_schema.LIST_USERS_SCHEMA
+
+    @allure.story("Convert responses to models")
+    def test_from_dict_converts_optional_and_list_fields(self):
+        commit = default_dataset("token").commits["octocat/hello-world"][0]
+        original = repr(commit)
+
+        commit_object = from_dict(commit, CommitDetail)
+
+        assert get_converter(CommitDetail) is get_converter(CommitDetail)
+        assert repr(commit) == original
+        assert isinstance(commit_object.author, UserProfile)
+        assert not hasattr(commit_object, "__dict__") and not hasattr(commit_object.author, "__dict__")
+        assert commit_object.committer.login == commit["committer"]["login"]
+        assert commit_object.parents[0].sha == commit["parents"][0]["sha"]
+        assert commit_object.commit.tree.sha == commit["commit"]["tree"]["sha"]
+        assert from_dict(dict(commit, author={}, committer=None), CommitDetail).author is None
+        with pytest.raises(TypeError):
+            from_dict(dict(commit, unexpected=True), CommitDetail)
+
+    @allure.story("Convert responses to models")
+    def test_batch_conversion_leaves_shared_body_untouched(self):
+        body = default_dataset("token").commits["octocat/hello-world"]
+        original = repr(body)
+
+        commit_objects = from_dict_many(body, CommitDetail)
+        streamed = iter_from_dict(iter(body), CommitDetail)
+
+        assert repr(body) == original
+        assert list(streamed) == commit_objects == [from_dict(commit, CommitDetail) for commit in body]
+        assert [commit.sha for commit in commit_objects] == [commit["sha"] for commit in body]
+
+    @allure.story("Convert responses to models")
+    def test_repository_derives_url_fields_from_url(self):
+        repo = default_dataset("token").repositories_by_name["octocat/hello-world"]
+
+        repo_object = from_dict(repo, Repository)
+        serialised = repo_object.to_dict()
+
+        assert repo_object.branches_url == repo["branches_url"] == f"{repo['url']}/branches{{/branch}}"
+        assert list(serialised) == list(repo)
+        assert {key: value for key, value in serialised.items() if key != "owner"} == {
+            key: value for key, value in repo.items() if key != "owner"
+        }
+        assert repo_object == from_dict(dict(repo), Repository)
+
+        moved = from_dict(dict(repo, hooks_url="https://example.com/hooks"), Repository)
+        assert moved.hooks_url == "https://example.com/hooks" and moved.tags_url == repo["tags_url"]
+        assert moved != repo_object
+
+    @allure.story("Convert responses to models")
+    def test_repository_supports_the_dataclass_functions(self):
+        repo = default_dataset("token").repositories_by_name["octocat/hello-world"]
+        repo_object = from_dict(dict(repo, hooks_url="https://example.com/hooks"), Repository)
+
+        serialised = dataclasses.asdict(repo_object)
+        renamed = dataclasses.replace(repo_object, name="renamed")
+
+        assert serialised == repo_object.to_dict()
+        assert {key: value for key, value in serialised.items() if key != "owner"} == {
+            key: value for key, value in dict(repo, hooks_url="https://example.com/hooks").items() if key != "owner"
+        }
+        assert renamed.name == "renamed" and renamed.branches_url == repo["branches_url"]
+        assert renamed.hooks_url == "https://example.com/hooks"
+        for duplicate in (copy.copy(repo_object), copy.deepcopy(repo_object), pickle.loads(pickle.dumps(repo_object))):
+            assert duplicate == repo_object and dataclasses.asdict(duplicate) == serialised
+
+    @allure.story("Convert responses to models")
+    def test_assigning_url_keeps_the_url_fields(self):
+        repo = default_dataset("token").repositories_by_name["octocat/hello-world"]
+        repo_object = from_dict(repo, Repository)
+        moved_url = "https://api.github.com/repos/octocat/moved"
+
+        relocated = dataclasses.replace(repo_object, url=moved_url)
+        repo_object.url = moved_url
+
+        for moved in (repo_object, relocated):
+            assert moved.url == moved_url
+            assert moved.branches_url == repo["branches_url"]
+            assert {key: value for key, value in moved.to_dict().items() if key not in ("owner", "url")} == {
+                key: value for key, value in repo.items() if key not in ("owner", "url")
+            }
+
+    @allure.story("Convert responses to models")
+    def test_identity_map_shares_repeated_users(self):
+        dataset = default_dataset("token")
+        repos = [repo for repo in dataset.repositories if repo["owner"]["login"] == "octocat"]
+        identities = IdentityMap()
+
+        repo_objects = from_dict_many(repos, Repository, identities)
+        renamed = from_dict(dict(repos[0], owner=dict(repos[0]["owner"], login="octocat-renamed")), Repository, identities)
+
+        assert len(repo_objects) > 1 and all(repo.owner is repo_objects[0].owner for repo in repo_objects)
+        assert repo_objects[0].owner.login is sys.intern("octocat")
+        assert renamed.owner is not repo_objects[0].owner and renamed.owner.login == "octocat-renamed"
+        assert from_dict(repos[0], Repository).owner is not repo_objects[0].owner
+
+    @allure.story("Convert responses to models")
+    def test_users_are_shared_only_on_opt_in(self):
+        repos = [repo for repo in default_dataset("token").repositories if repo["owner"]["login"] == "octocat"]
+
+        repo_objects = from_dict_many(repos, Repository)
+        streamed = list(iter_from_dict(repos, Repository))
+
+        assert repo_objects[0].owner == repo_objects[1].owner
+        assert repo_objects[0].owner is not repo_objects[1].owner
+        assert streamed[0].owner is not streamed[1].owner
+
+    @allure.story("Convert responses to models")
+    def test_identity_map_keeps_every_version_of_a_user(self):
+        owner = default_dataset("token").repositories_by_name["octocat/hello-world"]["owner"]
+        renamed = dict(owner, login="octocat-renamed")
+        identities = IdentityMap()
+
+        users = [from_dict(data, UserProfile, identities) for data in (owner, renamed, owner, renamed)]
+
+        assert users[0] is users[2] and users[1] is users[3]
+        assert users[0] is not users[1]
+        assert len(identities) == 2
@@ -0,0 +1,73 @@
+import allure
+import numpy as np
+import pytest
+
+from utils.synthetic_data import SyntheticDataGenerator
+from utils.tables import CommitTable, RepositoryTable
+
+
+@pytest.fixture(scope="module")
+def repositories():
+    generator = SyntheticDataGenerator(seed=5)
+    return list(generator.repositories(generator.user(0), 200))
+
+
+@allure.epic("GitHub API")
+@allure.feature("Columnar Collections")
+class TestTables:
+    @allure.story("Repository columns follow the response")
+    def test_repository_columns(self, repositories):
+        table = RepositoryTable(repositories)
+
+        assert len(table) == 200
+        assert table.column("id").dtype == np.int64
+        assert table.column("private").dtype == np.bool_
+        assert table.column("created_at").dtype == np.dtype("datetime64[s]")
+        assert table.column("id").tolist() == [repo["id"] for repo in repositories]
+        assert str(table.column("created_at")[0]) == repositories[0]["created_at"][:-1]
+        assert [repo.name for repo in table] == [repo["name"] for repo in repositories]
+
+    @allure.story("Look up repositories through the indexes")
+    def test_repository_indexes(self, repositories):
+        table = RepositoryTable(repositories)
+        repo = repositories[42]
+
+        assert table.by_id(repo["id"]).full_name == repo["full_name"]
+        assert table.by_name(repo["name"]) is table[42]
+        assert len(table.by_owner(repo["owner"]["login"])) == 200
+        assert len(table.by_owner("nobody")) == 0
+        with pytest.raises(KeyError):
+            table.by_id(-1)
+
+    @allure.story("Filter, sort and group repositories")
+    def test_repository_filter_sort_group(self, repositories):
+        table = RepositoryTable(repositories)
+
+        private = table.where(table.column("private"))
+        assert [repo.name for repo in private] == [
+            repo["name"] for repo in repositories if repo["private"]
+        ]
+
+        by_stars = table.sort("stargazers_count", descending=True)
+        assert by_stars.column("stargazers_count").tolist() == sorted(
+            (repo["stargazers_count"] for repo in repositories), reverse=True
+        )
+        assert [repo.name for repo in table.sort("name")] == sorted(
+            repo["name"] for repo in repositories
+        )
+
+        groups = table.group_by("language")
+        assert sum(len(group) for group in groups.values()) == 200
+        for language, group in groups.items():
+            assert all(repo.language == language for repo in group)
+
+    @allure.story("Commit columns and indexes")
+    def test_commit_table(self, repositories):
+        commits = list(SyntheticDataGenerator(seed=5).commits(repositories[0], 300))
+        table = CommitTable(commits)
+
+        assert table.by_sha(commits[10]["sha"]).sha == commits[10]["sha"]
+        assert len(table.merges()) == sum(len(commit["parents"]) > 1 for commit in commits)
+        assert np.all(np.diff(table.sort("committed_at").column("committed_at")) >= np.timedelta64(0))
+        for login, group in table.group_by("author").items():
+            assert len(table.by_author(login)) == len(group)
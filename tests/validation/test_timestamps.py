@@ -0,0 +1,65 @@
+import subprocess
+import sys
+from datetime import datetime, timezone
+
+import allure
+import numpy as np
+import pytest
+
+from models.timestamps import parse_epoch
+from utils.timestamps import datetime64_column
+
+
+@allure.epic("GitHub API")
+@allure.feature("Timestamps")
+class TestTimestamps:
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            ("2011-01-26T19:01:12Z", datetime(2011, 1, 26, 19, 1, 12, tzinfo=timezone.utc)),
+            ("1969-12-31T23:59:59Z", datetime(1969, 12, 31, 23, 59, 59, tzinfo=timezone.utc)),
+            ("2024-02-29T00:00:00Z", datetime(2024, 2, 29, tzinfo=timezone.utc)),
+            ("2011-01-26T20:01:12+01:00", datetime(2011, 1, 26, 19, 1, 12, tzinfo=timezone.utc)),
+            ("2011-01-26", datetime(2011, 1, 26, tzinfo=timezone.utc)),
+        ],
+    )
+    @allure.story("Parse timestamps into epoch seconds")
+    def test_parse_epoch(self, value, expected):
+        assert parse_epoch(value) == int(expected.timestamp())
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "2023-02-29T00:00:00Z",
+            "2011-13-26T19:01:12Z",
+            "2011-01-26T24:00:00Z",
+            "2024-01-01T-1:00:00Z",
+            "2024-01-01T 1:00:00Z",
+            "2024-01-01T01:00:0\u0661Z",
+            "yesterday",
+        ],
+    )
+    @allure.story("Reject invalid timestamps")
+    def test_parse_epoch_rejects_invalid_timestamps(self, value):
+        with pytest.raises(ValueError):
+            parse_epoch(value)
+
+    @allure.story("Parse a column of timestamps at once")
+    def test_datetime64_column(self):
+        values = ["2011-01-26T19:01:12Z", None, "2025-02-10T14:27:22Z"]
+
+        column = datetime64_column(values)
+        assert column.dtype == np.dtype("datetime64[s]")
+        assert np.isnat(column[1])
+        assert column[[0, 2]].astype(np.int64).tolist() == [parse_epoch(values[0]), parse_epoch(values[2])]
+
+        with_offset = datetime64_column(["2011-01-26T20:01:12+01:00", None])
+        assert with_offset[0].astype(np.int64) == parse_epoch(values[0])
+
+    @allure.story("Import the models without NumPy")
+    def test_models_do_not_import_numpy(self):
+        code = (
+            "import sys; import models.commit_model, models.repo_model, models.user_model; "
+            "sys.exit('numpy' in sys.modules)"
+        )
+        assert subprocess.run([sys.executable, "-c", code]).returncode == 0
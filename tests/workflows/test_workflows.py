@@ -2,13 +2,13 @@ import pytest
 import allure
 
 from models.commit_model import CommitDetail
-from models.repo_model import Repository
 from models.user_model import AuthorizedUserProfile
-from schemas.commits_schema import LIST_COMMITS_SCHEMA
-from schemas.repos_schema import LIST_REPOSITORIES_SCHEMA
+from schemas.commits_schema import list_commits_schema
+from schemas.repos_schema import list_repositories_schema
 from utils.api_repos import get_repositories_from_logged_user, get_commits_of_repository
 from utils.api_users import get_logged_user_profile, update_user_profile
-from utils.schema_validator import validate_json_schema, from_dict
+from utils.schema_validator import validate_json_schema, from_dict_many
+from utils.tables import RepositoryTable
 
 @allure.epic("GitHub API")
 @allure.feature("End 2 End Test")
@@ -68,21 +68,14 @@ class TestEnd2End:
         ):
             response = get_repositories_from_logged_user()
             assert response.status_code == 200, f"Expected 200, got {response.status_code}"
-            repo_objects = [from_dict(repo, Repository) for repo in response.json()]
+            repo_objects = RepositoryTable(response.json())
 
             assert len(repo_objects) == 9
             assert all([repo.owner.login == "aleixbernardo"] for repo in repo_objects)
-            github_testing_repo = next(
-                (repo for repo in repo_objects if repo.name == "github_testing")
-            )
-            assert github_testing_repo.private is False
+            assert repo_objects.by_name("github_testing").private is False
+            assert repo_objects.by_name("travel_planner").private is True
 
-            github_testing_repo = next(
-                (repo for repo in repo_objects if repo.name == "travel_planner")
-            )
-            assert github_testing_repo.private is True
-
-            validate_json_schema(response.json(), LIST_REPOSITORIES_SCHEMA)
+            validate_json_schema(response.json(), list_repositories_schema())
 
         with allure.step(
             "Step 6: Attempt to list commits for a non-existent repository and validate that the appropriate error is returned"
@@ -101,7 +94,7 @@ class TestEnd2End:
             response = get_commits_of_repository(first_repo_owner, repo=first_repo_name)
 
             assert response.status_code == 200
-            commit_objects = [from_dict(commit, CommitDetail) for commit in response.json()]
+            commit_objects = from_dict_many(response.json(), CommitDetail)
 
             for commit in commit_objects:
                 assert commit.sha is not None
@@ -112,7 +105,7 @@ class TestEnd2End:
             response = get_commits_of_repository(last_repo_owner, repo=last_repo_name)
 
             assert response.status_code == 200
-            commit_objects = [from_dict(commit, CommitDetail) for commit in response.json()]
+            commit_objects = from_dict_many(response.json(), CommitDetail)
 
             for commit in commit_objects:
                 assert commit.sha is not None
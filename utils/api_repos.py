@@ -1,12 +1,80 @@
-import os
-import random
-import string
+from typing import Iterator
+
 import allure
-import requests
+
+from utils.http_client import GitHubClient, get_default_client
+from utils.pagination import (
+    DEFAULT_PREFETCH_WORKERS,
+    MAX_PER_PAGE,
+    iter_items,
+    iter_pages,
+)
 
 BASE_URL = "https://api.github.com"
 
 
+def _sorting_direction(sort: str, direction: str = None) -> str:
+    """
+    Returns the sorting direction, defaulting to 'asc' for 'full_name' and 'desc' otherwise.
+    """
+    if direction:
+        return direction
+    return "asc" if sort == "full_name" else "desc"
+
+
+def user_repositories_params(type, sort, direction, per_page, page) -> dict:
+    """
+    Builds the query parameters of GET /users/{username}/repos.
+    """
+    params = {"type": type, "sort": sort, "per_page": per_page, "page": page}
+
+    # Handle sorting direction
+    params["direction"] = _sorting_direction(sort, direction)
+    return params
+
+
+def logged_user_repositories_params(
+    type, sort, direction, per_page, page, visibility, affiliation, since, before
+) -> dict:
+    """
+    Builds the query parameters of GET /user/repos, leaving out the filters that are not set.
+    """
+    params = {
+        "type": type,
+        "sort": sort,
+        "per_page": per_page,
+        "page": page,
+        "visibility": visibility,
+        "affiliation": affiliation,
+        "since": since,
+        "before": before,
+    }
+
+    # Remove any None values from the params dictionary
+    params = {key: value for key, value in params.items() if value is not None}
+
+    # Handle sorting direction
+    params["direction"] = _sorting_direction(sort, direction)
+    return params
+
+
+def commits_params(sha, path, author, committer, since, until, per_page, page) -> dict:
+    """
+    Builds the query parameters of GET /repos/{owner}/{repo}/commits, leaving out the filters that are not set.
+    """
+    params = {
+        "sha": sha,
+        "path": path,
+        "author": author,
+        "committer": committer,
+        "since": since,
+        "until": until,
+        "per_page": per_page,
+        "page": page,
+    }
+    return {key: value for key, value in params.items() if value is not None}
+
+
 def get_repositories_from_user(
     username: str,
     type: str = "owner",
@@ -16,6 +84,7 @@ def get_repositories_from_user(
     page: int = 1,
     include_token=True,
     random_token=False,
+    client: GitHubClient = None,
 ):
     """
     Lists public repositories for the specified user, paginated.
@@ -29,42 +98,22 @@ def get_repositories_from_user(
     - page (int): Page number for pagination. Default is 1.
     - include_token (bool): Whether to include a valid GitHub token in the request for authorization (default: True).
     - random_token (bool): Whether to generate a random token for testing purposes (default: False).
+    - client (GitHubClient, optional): HTTP client to send the request with (default: shared client).
 
     Returns:
     - Response object containing the API response.
     """
-    headers = {}
-
-    # If include_token is True, fetch token from environment variable or generate a random token
-    if include_token:
-        if random_token:
-            github_token = "".join(
-                random.choices(string.ascii_letters + string.digits, k=40)
-            )  # Random 40-character token
-        else:
-            github_token = os.getenv("GITHUB_TOKEN")
+    client = client or get_default_client()
 
-        if not github_token:
-            raise ValueError("GITHUB_TOKEN is missing! Please set it in the .env file.")
-
-        headers = {
-            "Authorization": f"token {github_token}"
-        }  # Add the token to the headers
+    # If include_token is True, use the token from environment variable or generate a random token
+    headers = client.auth_headers(include_token, random_token)
 
     # Set the query parameters for the API request
-    params = {"type": type, "sort": sort, "per_page": per_page, "page": page}
-
-    # Handle sorting direction
-    if direction:
-        params["direction"] = direction
-    elif sort == "full_name":
-        params["direction"] = "asc"
-    else:
-        params["direction"] = "desc"
+    params = user_repositories_params(type, sort, direction, per_page, page)
 
     # Send the GET request to the GitHub API
     url = f"{BASE_URL}/users/{username}/repos"
-    response = requests.get(url, params=params, headers=headers)
+    response = client.get(url, params=params, headers=headers)
 
     # Attach details of the API response to Allure
     allure.attach(
@@ -91,6 +140,7 @@ def get_repositories_from_logged_user(
     random_token: bool = False,  # Whether to generate a random token for testing (default: False)
     since: str = None,  # Show repositories updated after this time (ISO 8601 format)
     before: str = None,  # Show repositories updated before this time (ISO 8601 format)
+    client: GitHubClient = None,  # HTTP client to send the request with (default: shared client)
 ):
     """
     Lists repositories for the logged-in user with optional filters for visibility, type, and more.
@@ -107,52 +157,24 @@ def get_repositories_from_logged_user(
     - random_token (bool): Whether to generate a random token for testing. Default is False.
     - since (str): Only show repositories updated after this time (ISO 8601 format).
     - before (str): Only show repositories updated before this time (ISO 8601 format).
+    - client (GitHubClient): HTTP client to send the request with. Default is the shared client.
 
     Returns:
     - Response object containing the API response.
     """
-    headers = {}
-
-    # If include_token is True, fetch token from environment variable or generate a random token
-    if include_token:
-        if random_token:
-            github_token = "".join(
-                random.choices(string.ascii_letters + string.digits, k=40)
-            )  # Random 40-character token
-        else:
-            github_token = os.getenv("GITHUB_TOKEN")
-
-        if not github_token:
-            raise ValueError("GITHUB_TOKEN is missing! Please set it in the .env file.")
+    client = client or get_default_client()
 
-        headers = {"Authorization": f"token {github_token}"}  # Add token to the headers
+    # If include_token is True, use the token from environment variable or generate a random token
+    headers = client.auth_headers(include_token, random_token)
 
     # Set the query parameters for the API request
-    params = {
-        "type": type,
-        "sort": sort,
-        "per_page": per_page,
-        "page": page,
-        "visibility": visibility,
-        "affiliation": affiliation,
-        "since": since,
-        "before": before,
-    }
-
-    # Remove any None values from the params dictionary
-    params = {key: value for key, value in params.items() if value is not None}
-
-    # Handle sorting direction
-    if direction:
-        params["direction"] = direction
-    elif sort == "full_name":
-        params["direction"] = "asc"
-    else:
-        params["direction"] = "desc"
+    params = logged_user_repositories_params(
+        type, sort, direction, per_page, page, visibility, affiliation, since, before
+    )
 
     # Send the GET request to the GitHub API
     url = f"{BASE_URL}/user/repos"
-    response = requests.get(url, params=params, headers=headers)
+    response = client.get(url, params=params, headers=headers)
 
     # Attach details of the API response to Allure for visibility
     allure.attach(
@@ -180,6 +202,7 @@ def get_commits_of_repository(
     page: int = 1,
     include_token: bool = True,
     random_token: bool = False,
+    client: GitHubClient = None,
 ):
     """
     Fetches a list of commits for a given repository.
@@ -197,45 +220,25 @@ def get_commits_of_repository(
     - page (int, optional): Page number for pagination. Default is 1.
     - include_token (bool, optional): Whether to include a GitHub token for authentication (default: True).
     - random_token (bool, optional): Whether to generate a random token for testing (default: False).
+    - client (GitHubClient, optional): HTTP client to send the request with (default: shared client).
 
     Returns:
     - Response object containing the API response with commit data.
     """
-    headers = {}
-
-    # If include_token is True, fetch token from environment variable or generate a random token
-    if include_token:
-        if random_token:
-            github_token = "".join(
-                random.choices(string.ascii_letters + string.digits, k=40)
-            )  # Random 40-character token
-        else:
-            github_token = os.getenv("GITHUB_TOKEN")
-
-        if not github_token:
-            raise ValueError("GITHUB_TOKEN is missing! Please set it in the .env file.")
+    client = client or get_default_client()
 
-        headers["Authorization"] = f"Bearer {github_token}"  # Add token to the headers
+    # If include_token is True, use the token from environment variable or generate a random token
+    headers = client.auth_headers(include_token, random_token, scheme="Bearer")
 
     # Set query parameters for fetching commits, filtering out None values
-    params = {
-        "sha": sha,
-        "path": path,
-        "author": author,
-        "committer": committer,
-        "since": since,
-        "until": until,
-        "per_page": per_page,
-        "page": page,
-    }
-    params = {key: value for key, value in params.items() if value is not None}
+    params = commits_params(sha, path, author, committer, since, until, per_page, page)
 
     # Construct the API endpoint URL for fetching commits
     url = f"{BASE_URL}/repos/{owner}/{repo}/commits"
 
     # Send the GET request to the GitHub API
     with allure.step(f"Sending GET request to fetch commits for {owner}/{repo}"):
-        response = requests.get(url, params=params, headers=headers)
+        response = client.get(url, params=params, headers=headers)
 
     # Attach response details to Allure for visibility
     with allure.step("Attach API response details to Allure"):
@@ -251,3 +254,108 @@ def get_commits_of_repository(
         )
 
     return response
+
+
+def iter_repositories_from_user(
+    username: str,
+    type: str = "owner",
+    sort: str = "full_name",
+    direction: str = None,
+    per_page: int = MAX_PER_PAGE,
+    include_token=True,
+    random_token=False,
+    max_workers: int = DEFAULT_PREFETCH_WORKERS,
+    client: GitHubClient = None,
+) -> Iterator[dict]:
+    """
+    Iterates over every public repository of the specified user, following the pagination links.
+
+    Parameters are the same as get_repositories_from_user, except that there is no page and per_page
+    defaults to the maximum allowed by the API (100) to use as few requests as possible. Once the last page
+    is known, up to max_workers pages are fetched concurrently (use 1 to fetch them serially).
+
+    Returns:
+    - Iterator of repository dictionaries, yielded one at a time.
+    - Raises an exception: requests.HTTPError if any page does not return a successful status code.
+    """
+    client = client or get_default_client()
+    headers = client.auth_headers(include_token, random_token)
+    params = user_repositories_params(type, sort, direction, per_page, 1)
+
+    url = f"{BASE_URL}/users/{username}/repos"
+    return iter_items(
+        iter_pages(client, url, params=params, headers=headers, max_workers=max_workers)
+    )
+
+
+def iter_repositories_from_logged_user(
+    type: str = "all",
+    sort: str = "full_name",
+    direction: str = None,
+    per_page: int = MAX_PER_PAGE,
+    visibility: str = None,
+    affiliation: str = None,
+    include_token: bool = True,
+    random_token: bool = False,
+    since: str = None,
+    before: str = None,
+    max_workers: int = DEFAULT_PREFETCH_WORKERS,
+    client: GitHubClient = None,
+) -> Iterator[dict]:
+    """
+    Iterates over every repository of the logged-in user, following the pagination links.
+
+    Parameters are the same as get_repositories_from_logged_user, except that there is no page and per_page
+    defaults to the maximum allowed by the API (100) to use as few requests as possible. Once the last page
+    is known, up to max_workers pages are fetched concurrently (use 1 to fetch them serially).
+
+    Returns:
+    - Iterator of repository dictionaries, yielded one at a time.
+    - Raises an exception: requests.HTTPError if any page does not return a successful status code.
+    """
+    client = client or get_default_client()
+    headers = client.auth_headers(include_token, random_token)
+    params = logged_user_repositories_params(
+        type, sort, direction, per_page, 1, visibility, affiliation, since, before
+    )
+
+    url = f"{BASE_URL}/user/repos"
+    return iter_items(
+        iter_pages(client, url, params=params, headers=headers, max_workers=max_workers)
+    )
+
+
+def iter_commits_of_repository(
+    owner: str,
+    repo: str,
+    sha: str = None,
+    path: str = None,
+    author: str = None,
+    committer: str = None,
+    since: str = None,
+    until: str = None,
+    per_page: int = MAX_PER_PAGE,
+    include_token: bool = True,
+    random_token: bool = False,
+    max_workers: int = DEFAULT_PREFETCH_WORKERS,
+    client: GitHubClient = None,
+) -> Iterator[dict]:
+    """
+    Iterates over every commit of a repository, following the pagination links.
+
+    Parameters are the same as get_commits_of_repository, except that there is no page and per_page
+    defaults to the maximum allowed by the API (100) to use as few requests as possible. Once the last page
+    is known, up to max_workers pages are fetched concurrently (use 1 to fetch them serially).
+
+    Returns:
+    - Iterator of commit dictionaries, yielded one at a time.
+    - Raises an exception: requests.HTTPError if any page does not return a successful status code.
+    """
+    client = client or get_default_client()
+    headers = client.auth_headers(include_token, random_token, scheme="Bearer")
+    params = commits_params(sha, path, author, committer, since, until, per_page, 1)
+
+    url = f"{BASE_URL}/repos/{owner}/{repo}/commits"
+    return iter_items(
+        iter_pages(client, url, params=params, headers=headers, max_workers=max_workers)
+    )
@@ -0,0 +1,172 @@
+from typing import AsyncIterator, Iterable, List, Tuple
+
+import httpx
+
+from utils import api_repos
+from utils.api_repos import (
+    commits_params,
+    logged_user_repositories_params,
+    user_repositories_params,
+)
+from utils.async_client import (
+    DEFAULT_MAX_CONCURRENCY,
+    AsyncGitHubClient,
+    attach_response,
+    gather_limited,
+    get_default_async_client,
+)
+from utils.pagination import MAX_PER_PAGE
+
+
+async def get_repositories_from_user(
+    username: str,
+    type: str = "owner",
+    sort: str = "full_name",
+    direction: str = None,
+    per_page: int = 30,
+    page: int = 1,
+    include_token=True,
+    random_token=False,
+    client: AsyncGitHubClient = None,
+) -> httpx.Response:
+    """
+    Async version of api_repos.get_repositories_from_user, with the same parameters and defaults.
+
+    Returns:
+    - httpx.Response object containing the API response.
+    """
+    client = client or get_default_async_client()
+    headers = client.auth_headers(include_token, random_token)
+    params = user_repositories_params(type, sort, direction, per_page, page)
+
+    url = f"{api_repos.BASE_URL}/users/{username}/repos"
+    response = await client.get(url, params=params, headers=headers)
+    attach_response(response)
+
+    return response
+
+
+async def get_repositories_from_logged_user(
+    type: str = "all",
+    sort: str = "full_name",
+    direction: str = None,
+    per_page: int = 30,
+    page: int = 1,
+    visibility: str = None,
+    affiliation: str = None,
+    include_token: bool = True,
+    random_token: bool = False,
+    since: str = None,
+    before: str = None,
+    client: AsyncGitHubClient = None,
+) -> httpx.Response:
+    """
+    Async version of api_repos.get_repositories_from_logged_user, with the same parameters and defaults.
+
+    Returns:
+    - httpx.Response object containing the API response.
+    """
+    client = client or get_default_async_client()
+    headers = client.auth_headers(include_token, random_token)
+    params = logged_user_repositories_params(
+        type, sort, direction, per_page, page, visibility, affiliation, since, before
+    )
+
+    url = f"{api_repos.BASE_URL}/user/repos"
+    response = await client.get(url, params=params, headers=headers)
+    attach_response(response)
+
+    return response
+
+
+async def get_commits_of_repository(
+    owner: str,
+    repo: str,
+    sha: str = None,
+    path: str = None,
+    author: str = None,
+    committer: str = None,
+    since: str = None,
+    until: str = None,
+    per_page: int = 30,
+    page: int = 1,
+    include_token: bool = True,
+    random_token: bool = False,
+    client: AsyncGitHubClient = None,
+) -> httpx.Response:
+    """
+    Async version of api_repos.get_commits_of_repository, with the same parameters and defaults.
+
+    Returns:
+    - httpx.Response object containing the API response with commit data.
+    """
+    client = client or get_default_async_client()
+    headers = client.auth_headers(include_token, random_token, scheme="Bearer")
+    params = commits_params(sha, path, author, committer, since, until, per_page, page)
+
+    url = f"{api_repos.BASE_URL}/repos/{owner}/{repo}/commits"
+    response = await client.get(url, params=params, headers=headers)
+    attach_response(response)
+
+    return response
+
+
+async def iter_commits_of_repository(
+    owner: str,
+    repo: str,
+    sha: str = None,
+    path: str = None,
+    author: str = None,
+    committer: str = None,
+    since: str = None,
+    until: str = None,
+    per_page: int = MAX_PER_PAGE,
+    include_token: bool = True,
+    random_token: bool = False,
+    client: AsyncGitHubClient = None,
+) -> AsyncIterator[dict]:
+    """
+    Async version of api_repos.iter_commits_of_repository, following the rel="next" links of every page.
+
+    Returns:
+    - Async iterator of commit dictionaries, yielded one at a time.
+    - Raises an exception: httpx.HTTPStatusError if any page does not return a successful status code.
+    """
+    client = client or get_default_async_client()
+    headers = client.auth_headers(include_token, random_token, scheme="Bearer")
+    params = commits_params(sha, path, author, committer, since, until, per_page, 1)
+
+    url = f"{api_repos.BASE_URL}/repos/{owner}/{repo}/commits"
+    while url:
+        response = await client.get(url, params=params, headers=headers)
+        response.raise_for_status()
+        for commit in response.json():
+            yield commit
+
+        # The next link already carries the query parameters of the following page
+        url, params = response.links.get("next", {}).get("url"), None
+
+
+async def get_commits_of_repositories(
+    repositories: Iterable[Tuple[str, str]],
+    limit: int = DEFAULT_MAX_CONCURRENCY,
+    **kwargs,
+) -> List[httpx.Response]:
+    """
+    Fetches the commits of many repositories concurrently.
+
+    Parameters:
+    - repositories (Iterable[Tuple[str, str]]): (owner, repo) pairs to fetch the commits of.
+    - limit (int): Maximum number of requests running at the same time. Default is 100.
+    - kwargs: Any other parameter accepted by get_commits_of_repository (e.g. per_page, since).
+
+    Returns:
+    - List of httpx.Response objects, in the same order as the repositories.
+    """
+    return await gather_limited(
+        (
+            get_commits_of_repository(owner, repo, **kwargs)
+            for owner, repo in repositories
+        ),
+        limit=limit,
+    )
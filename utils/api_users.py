@@ -1,35 +1,30 @@
-import os
-import random
-import string
 import allure
-import requests
+
+from utils.http_client import GitHubClient, get_default_client
 
 BASE_URL = "https://api.github.com"
 
 
-def get_user_profile(username: str, include_token=True):
+def get_user_profile(username: str, include_token=True, client: GitHubClient = None):
     """
     Retrieves the public profile of a GitHub user based on their username.
 
     Parameters:
     - username (str): The GitHub username to fetch the profile of.
     - include_token (bool): Whether to include a GitHub token for authentication. Default is True.
+    - client (GitHubClient): HTTP client to send the request with. Default is the shared client.
 
     Returns:
     - Response object from the GET request, containing the user's profile information.
     """
-    headers = {}
+    client = client or get_default_client()
 
-    # If include_token is True, fetch the GitHub token from environment variables and add it to the request headers
-    if include_token:
-        github_token = os.getenv("GITHUB_TOKEN")
-        if not github_token:
-            raise ValueError("GITHUB_TOKEN is missing! Please set it in the .env file.")
-        headers = {"Authorization": f"token {github_token}"}
+    # If include_token is True, use the GitHub token from environment variables in the request headers
+    headers = client.auth_headers(include_token)
 
     # Make the API request to get the user's profile
     url = f"{BASE_URL}/users/{username}"
-    response = requests.get(url, headers=headers)
+    response = client.get(url, headers=headers)
 
     # Attach response details to Allure for visibility
     allure.attach(
@@ -44,36 +39,28 @@ def get_user_profile(username: str, include_token=True):
     return response
 
 
-def get_logged_user_profile(include_token=True, random_token=False):
+def get_logged_user_profile(
+    include_token=True, random_token=False, client: GitHubClient = None
+):
     """
     Retrieves the profile of the currently authenticated GitHub user based on the GitHub token provided.
 
     Parameters:
     - include_token (bool): Whether to include a valid token in the request headers. Default is True.
     - random_token (bool): If True, generate a random token for testing purposes. Default is False.
+    - client (GitHubClient): HTTP client to send the request with. Default is the shared client.
 
     Returns:
     - Response object from the GET request containing the logged-in user's profile information.
     """
-    headers = {}
-
-    if include_token:
-        # Generate a random token or retrieve the token from environment variables based on random_token flag
-        if random_token:
-            github_token = "".join(
-                random.choices(string.ascii_letters + string.digits, k=40)
-            )
-        else:
-            github_token = os.getenv("GITHUB_TOKEN")
-
-        if not github_token:
-            raise ValueError("GITHUB_TOKEN is missing! Please set it in the .env file.")
+    client = client or get_default_client()
 
-        headers = {"Authorization": f"token {github_token}"}
+    # Generate a random token or retrieve the token from environment variables based on random_token flag
+    headers = client.auth_headers(include_token, random_token)
 
     # Make the API request to get the logged-in user's profile
     url = f"{BASE_URL}/user"
-    response = requests.get(url, headers=headers)
+    response = client.get(url, headers=headers)
 
     # Attach response details to Allure for visibility
     allure.attach(
@@ -88,7 +75,13 @@ def get_logged_user_profile(include_token=True, random_token=False):
     return response
 
 
-def update_user_profile(body, include_token=True, random_token=False):
+def update_user_profile(
+    body,
+    include_token=True,
+    random_token=False,
+    retry=False,
+    client: GitHubClient = None,
+):
     """
     Updates the profile of the currently authenticated GitHub user with the provided data.
 
@@ -96,29 +89,21 @@ def update_user_profile(body, include_token=True, random_token=False):
     - body (dict): A dictionary containing the fields to be updated (e.g., name, email, blog).
     - include_token (bool): Whether to include a valid token in the request headers. Default is True.
     - random_token (bool): If True, generate a random token for testing purposes. Default is False.
+    - retry (bool): Whether to retry the PATCH on transient failures (502, 503, ...). Default is False, as a
+      retried PATCH may be applied twice if only its response was lost.
+    - client (GitHubClient): HTTP client to send the request with. Default is the shared client.
 
     Returns:
     - Response object from the PATCH request containing the result of the update.
     """
-    headers = {}
-
-    if include_token:
-        # Generate a random token or retrieve the token from environment variables based on random_token flag
-        if random_token:
-            github_token = "".join(
-                random.choices(string.ascii_letters + string.digits, k=40)
-            )
-        else:
-            github_token = os.getenv("GITHUB_TOKEN")
-
-        if not github_token:
-            raise ValueError("GITHUB_TOKEN is missing! Please set it in the .env file.")
+    client = client or get_default_client()
 
-        headers = {"Authorization": f"token {github_token}"}
+    # Generate a random token or retrieve the token from environment variables based on random_token flag
+    headers = client.auth_headers(include_token, random_token)
 
     # Make the API request to update the user's profile
     url = f"{BASE_URL}/user"
-    response = requests.patch(url, headers=headers, json=body)
+    response = client.patch(url, headers=headers, json=body, retry_non_idempotent=retry)
 
     # Attach response details to Allure for visibility
     allure.attach(
@@ -0,0 +1,99 @@
+from typing import Iterable, List
+
+import httpx
+
+from utils import api_users
+from utils.async_client import (
+    DEFAULT_MAX_CONCURRENCY,
+    AsyncGitHubClient,
+    attach_response,
+    gather_limited,
+    get_default_async_client,
+)
+
+
+async def get_user_profile(
+    username: str, include_token=True, client: AsyncGitHubClient = None
+) -> httpx.Response:
+    """
+    Async version of api_users.get_user_profile, with the same parameters and defaults.
+
+    Returns:
+    - httpx.Response object from the GET request, containing the user's profile information.
+    """
+    client = client or get_default_async_client()
+    headers = client.auth_headers(include_token)
+
+    url = f"{api_users.BASE_URL}/users/{username}"
+    response = await client.get(url, headers=headers)
+    attach_response(response)
+
+    return response
+
+
+async def get_logged_user_profile(
+    include_token=True, random_token=False, client: AsyncGitHubClient = None
+) -> httpx.Response:
+    """
+    Async version of api_users.get_logged_user_profile, with the same parameters and defaults.
+
+    Returns:
+    - httpx.Response object from the GET request containing the logged-in user's profile information.
+    """
+    client = client or get_default_async_client()
+    headers = client.auth_headers(include_token, random_token)
+
+    url = f"{api_users.BASE_URL}/user"
+    response = await client.get(url, headers=headers)
+    attach_response(response)
+
+    return response
+
+
+async def update_user_profile(
+    body,
+    include_token=True,
+    random_token=False,
+    retry=False,
+    client: AsyncGitHubClient = None,
+) -> httpx.Response:
+    """
+    Async version of api_users.update_user_profile, with the same parameters and defaults (retry is opt-in).
+
+    Returns:
+    - httpx.Response object from the PATCH request containing the result of the update.
+    """
+    client = client or get_default_async_client()
+    headers = client.auth_headers(include_token, random_token)
+
+    url = f"{api_users.BASE_URL}/user"
+    response = await client.patch(
+        url, headers=headers, json=body, retry_non_idempotent=retry
+    )
+    attach_response(response)
+
+    return response
+
+
+async def get_user_profiles(
+    usernames: Iterable[str],
+    limit: int = DEFAULT_MAX_CONCURRENCY,
+    include_token=True,
+    client: AsyncGitHubClient = None,
+) -> List[httpx.Response]:
+    """
+    Fetches the public profiles of many users concurrently.
+
+    Parameters:
+    - usernames (Iterable[str]): The GitHub usernames to fetch the profiles of.
+    - limit (int): Maximum number of requests running at the same time. Default is 100.
+    - include_token (bool): Whether to include a GitHub token for authentication. Default is True.
+    - client (AsyncGitHubClient): HTTP client to send the requests with. Default is the client of the running loop.
+
+    Returns:
+    - List of httpx.Response objects, in the same order as the usernames.
+    """
+    return await gather_limited(
+        (get_user_profile(username, include_token, client) for username in usernames),
+        limit=limit,
+    )
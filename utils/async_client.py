@@ -0,0 +1,309 @@
+import asyncio
+import weakref
+from typing import Awaitable, Iterable, List
+
+import allure
+import httpx
+
+from utils.http_cache import CachedResponse, ConditionalRequestCache
+from utils.journal import Journal
+from utils.rate_limit import RateLimitScheduler
+from utils.retry import RetryPolicy
+from utils.http_client import build_auth_headers
+
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_CONCURRENCY = 100
+
+
+class AsyncGitHubClient:
+    """
+    Asyncio counterpart of GitHubClient, backed by a pooled keep-alive httpx.AsyncClient.
+
+    Every request waits on a semaphore, so at most max_concurrency requests are in flight at once no
+    matter how many coroutines are using the client.
+
+    Parameters:
+    - max_connections (int): Maximum number of open connections. Default is 100.
+    - max_keepalive_connections (int, optional): Maximum number of idle keep-alive connections. Default is max_connections.
+    - max_concurrency (int): Maximum number of requests in flight. Default is 100.
+    - timeout (float, optional): Timeout in seconds for every request. Default is None (no timeout).
+    - use_cache (bool): Whether GET requests are sent as conditional requests and answered from the cache on a
+      304 Not Modified. Default is True.
+    - rate_limit (bool): Whether requests are paced by a RateLimitScheduler that follows the rate limit headers.
+      Default is True.
+    - rate_limiter (RateLimitScheduler, optional): Scheduler to use, e.g. to share the quota between clients.
+      Default is a new scheduler.
+    - retry (bool): Whether transient failures are retried. Default is True.
+    - retry_policy (RetryPolicy, optional): Retry policy to use. Default is RetryPolicy().
+    - cache (ConditionalRequestCache, optional): Cache to use, e.g. to share it with a GitHubClient. Default is a new cache.
+    - journal (Journal, optional): Journal to record every request to, or to replay responses from without
+      sending any request. Default is None (live traffic only).
+    """
+
+    def __init__(
+        self,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        timeout: float = None,
+        use_cache: bool = True,
+        cache: ConditionalRequestCache = None,
+        rate_limit: bool = True,
+        rate_limiter: RateLimitScheduler = None,
+        retry: bool = True,
+        retry_policy: RetryPolicy = None,
+        journal: Journal = None,
+    ):
+        self.journal = journal
+        self.retry_policy = (retry_policy or RetryPolicy()) if retry else None
+        self.rate_limiter = (
+            (rate_limiter or RateLimitScheduler()) if rate_limit else None
+        )
+        self.cache = (cache or ConditionalRequestCache()) if use_cache else None
+        self._http = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections or max_connections,
+            ),
+            timeout=timeout,
+        )
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    def auth_headers(
+        self,
+        include_token: bool = True,
+        random_token: bool = False,
+        scheme: str = "token",
+    ) -> dict:
+        """
+        Builds the authorization headers for a request. See build_auth_headers.
+        """
+        return build_auth_headers(include_token, random_token, scheme)
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        params=None,
+        headers=None,
+        json=None,
+        retry_non_idempotent: bool = False,
+    ) -> httpx.Response:
+        """
+        Sends an HTTP request once a concurrency slot is available.
+
+        Parameters:
+        - method (str): HTTP method ('GET', 'PATCH', ...).
+        - url (str): Absolute URL of the endpoint.
+        - params (dict, optional): Query parameters.
+        - headers (dict, optional): Request headers.
+        - json (optional): JSON body of the request.
+        - retry_non_idempotent (bool): Whether to retry the request on transient failures even if the method is
+          not idempotent (e.g. PATCH). Default is False.
+
+        Returns:
+        - httpx.Response object containing the API response. Responses served from the cache have from_cache set to True.
+        """
+        if self.journal is not None and self.journal.replaying:
+            return _response_from_journal(
+                self.journal.replay(method, url, params, headers), method, url, params
+            )
+
+        response = await self._request(
+            method, url, params, headers, json, retry_non_idempotent
+        )
+
+        if self.journal is not None:
+            self.journal.record(
+                method,
+                url,
+                params,
+                headers,
+                json,
+                response.status_code,
+                response.headers,
+                response.text,
+                response.elapsed.total_seconds(),
+            )
+        return response
+
+    async def _request(
+        self, method, url, params, headers, json, retry_non_idempotent
+    ) -> httpx.Response:
+        if method != "GET" or self.cache is None:
+            return await self._send_with_retry(
+                method, url, params, headers, json, retry_non_idempotent
+            )
+
+        key = self.cache.key(url, params, headers)
+        entry = self.cache.get(key)
+        if entry is not None:
+            headers = {**(headers or {}), **entry.conditional_headers()}
+
+        response = await self._send_with_retry(
+            method, url, params, headers, json, False
+        )
+        if response.status_code == 304 and entry is not None:
+            return _response_from_cache(entry, response)
+        if response.status_code == 200:
+            self.cache.store(key, response.headers, response.content, response.encoding)
+        return response
+
+    async def _send_with_retry(
+        self, method, url, params, headers, json, retry_non_idempotent
+    ) -> httpx.Response:
+        if self.retry_policy is None:
+            return await self._send(method, url, params, headers, json)
+        return await self.retry_policy.call_async(
+            method,
+            url,
+            lambda: self._send(method, url, params, headers, json),
+            retry_non_idempotent=retry_non_idempotent,
+            transport_errors=(httpx.TransportError,),
+        )
+
+    async def _send(self, method, url, params, headers, json) -> httpx.Response:
+        if self.rate_limiter is not None:
+            delay = self.rate_limiter.reserve(method, url, headers)
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+        async with self._semaphore:
+            response = await self._http.request(
+                method, url, params=params, headers=headers, json=json
+            )
+
+        if self.rate_limiter is not None:
+            self.rate_limiter.update(
+                url, headers, response.status_code, response.headers
+            )
+        return response
+
+    async def get(self, url: str, params=None, headers=None) -> httpx.Response:
+        return await self.request("GET", url, params=params, headers=headers)
+
+    async def patch(
+        self, url: str, headers=None, json=None, retry_non_idempotent: bool = False
+    ) -> httpx.Response:
+        return await self.request(
+            "PATCH",
+            url,
+            headers=headers,
+            json=json,
+            retry_non_idempotent=retry_non_idempotent,
+        )
+
+    async def aclose(self):
+        """
+        Closes every pooled connection.
+        """
+        await self._http.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+
+def attach_response(response: httpx.Response):
+    """
+    Attaches the status code and body of a response to the Allure report, like the synchronous helpers do.
+    """
+    allure.attach(
+        str(response.status_code),
+        name="Status Code",
+        attachment_type=allure.attachment_type.TEXT,
+    )
+    allure.attach(
+        response.text, name="Response Body", attachment_type=allure.attachment_type.JSON
+    )
+
+
+def _response_from_cache(
+    entry: CachedResponse, not_modified: httpx.Response
+) -> httpx.Response:
+    """
+    Builds a 200 response with the cached body for a request that was answered with 304 Not Modified.
+    """
+    response = httpx.Response(
+        200,
+        headers=entry.revalidated_headers(not_modified.headers),
+        content=entry.content,
+        request=not_modified.request,
+    )
+    response.from_cache = True
+    return response
+
+
+def _response_from_journal(
+    entry: dict, method: str, url: str, params: dict
+) -> httpx.Response:
+    """
+    Builds the response recorded in a journal entry.
+    """
+    response = httpx.Response(
+        entry["status_code"],
+        headers=entry["headers"],
+        content=entry["body"].encode("utf-8"),
+        request=httpx.Request(method, url, params=params),
+    )
+    response.from_journal = True
+    return response
+
+
+# httpx clients are bound to the event loop they are first used on, so the default client is per loop
+_default_clients = weakref.WeakKeyDictionary()
+
+
+def get_default_async_client() -> AsyncGitHubClient:
+    """
+    Returns the client used by the async API helpers on the running event loop when no client is passed.
+    Its connections stay open until close_default_async_client() is awaited, which must be done before the
+    event loop is closed.
+    """
+    loop = asyncio.get_running_loop()
+    client = _default_clients.get(loop)
+    if client is None:
+        client = AsyncGitHubClient(journal=Journal.from_env())
+        _default_clients[loop] = client
+    return client
+
+
+def set_default_async_client(client: AsyncGitHubClient):
+    """
+    Replaces the client used by the async API helpers on the running event loop.
+    """
+    _default_clients[asyncio.get_running_loop()] = client
+
+
+async def close_default_async_client():
+    """
+    Closes the default client of the running event loop, if it has one, and forgets it. The next call to
+    get_default_async_client() on the loop creates a new client.
+    """
+    client = _default_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+async def gather_limited(
+    aws: Iterable[Awaitable], limit: int = DEFAULT_MAX_CONCURRENCY
+) -> List:
+    """
+    Awaits the given awaitables with at most `limit` of them running at once.
+
+    Parameters:
+    - aws (Iterable[Awaitable]): The coroutines to run (e.g. calls to the async API helpers).
+    - limit (int): Maximum number of coroutines running at the same time. Default is 100.
+
+    Returns:
+    - List: The results in the same order as the awaitables.
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(aw):
+        async with semaphore:
+            return await aw
+
+    return await asyncio.gather(*(run(aw) for aw in aws))
@@ -0,0 +1,113 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+DEFAULT_MAX_ENTRIES = 2048
+
+# Headers describing the body, which must come from the cached response rather than from the 304
+_ENTITY_HEADERS = {
+    "content-length",
+    "content-type",
+    "content-encoding",
+    "transfer-encoding",
+}
+
+
+@dataclass
+class CachedResponse:
+    etag: Optional[str]
+    last_modified: Optional[str]
+    headers: Dict[str, str]
+    content: bytes
+    encoding: Optional[str]
+
+    def conditional_headers(self) -> dict:
+        """
+        Returns the If-None-Match / If-Modified-Since headers that revalidate this response.
+        """
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def revalidated_headers(self, not_modified_headers) -> dict:
+        """
+        Returns the cached headers updated with the fresh headers of a 304 response (e.g. rate limit headers).
+        The entity headers of the cached body are kept.
+        """
+        headers = dict(self.headers)
+        for name, value in not_modified_headers.items():
+            if name.lower() not in _ENTITY_HEADERS:
+                headers[name] = value
+        return headers
+
+
+class ConditionalRequestCache:
+    """
+    Stores the ETag and Last-Modified validators of GET responses, so repeated requests can be sent as
+    conditional requests (If-None-Match / If-Modified-Since) and answered from the cache on a 304.
+
+    Entries are keyed by URL, query parameters and a hash of the Authorization header, so responses are
+    never shared between different tokens and no token is kept in memory. The least recently used entry
+    is evicted once max_entries is reached. The cache is safe to share between threads.
+
+    Parameters:
+    - max_entries (int): Maximum number of cached responses. Default is 2048.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(url: str, params: dict = None, headers: dict = None) -> Tuple:
+        """
+        Builds the cache key of a request from its URL, query parameters and token identity.
+        """
+        authorization = (headers or {}).get("Authorization", "")
+        identity = (
+            hashlib.sha256(authorization.encode()).hexdigest() if authorization else ""
+        )
+        query = tuple(sorted((str(k), str(v)) for k, v in (params or {}).items()))
+        return url, query, identity
+
+    def get(self, key: Tuple) -> Optional[CachedResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def store(
+        self, key: Tuple, headers: dict, content: bytes, encoding: str = None
+    ) -> bool:
+        """
+        Caches a successful response if it carries an ETag or Last-Modified validator.
+
+        Returns:
+        - bool: True if the response was cached.
+        """
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return False
+
+        entry = CachedResponse(etag, last_modified, dict(headers), content, encoding)
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return True
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
@@ -0,0 +1,354 @@
+import os
+import random
+import string
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from utils.http_cache import CachedResponse, ConditionalRequestCache
+from utils.journal import Journal
+from utils.rate_limit import RateLimitScheduler
+from utils.retry import RetryPolicy
+
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 32
+DEFAULT_PREFETCH_WORKERS = 4
+
+
+@lru_cache(maxsize=None)
+def _token_headers(scheme: str, github_token: str) -> dict:
+    return {"Authorization": f"{scheme} {github_token}"}
+
+
+def build_auth_headers(
+    include_token: bool = True, random_token: bool = False, scheme: str = "token"
+) -> dict:
+    """
+    Builds the authorization headers for a request.
+
+    Headers for the GITHUB_TOKEN are built once per token and scheme and reused afterwards, so the
+    returned dictionary must not be modified by the caller.
+
+    Parameters:
+    - include_token (bool): Whether to include a GitHub token in the headers. Default is True.
+    - random_token (bool): Whether to generate a random token for testing purposes. Default is False.
+    - scheme (str): Authorization scheme ('token' or 'Bearer'). Default is 'token'.
+
+    Returns:
+    - dict: The headers to send with the request.
+    - Raises an exception: ValueError if a token is required and GITHUB_TOKEN is not set.
+    """
+    if not include_token:
+        return {}
+
+    if random_token:
+        github_token = "".join(
+            random.choices(string.ascii_letters + string.digits, k=40)
+        )  # Random 40-character token
+        return {"Authorization": f"{scheme} {github_token}"}
+
+    github_token = os.getenv("GITHUB_TOKEN")
+    if not github_token:
+        raise ValueError("GITHUB_TOKEN is missing! Please set it in the .env file.")
+
+    return _token_headers(scheme, github_token)
+
+
+class GitHubClient:
+    """
+    Keep-alive HTTP client shared by every API helper.
+
+    A single urllib3 connection pool (owned by the HTTPAdapter) is shared by all threads, so TCP and TLS
+    handshakes are paid once per connection instead of once per request. Each thread gets its own
+    requests.Session mounted on that adapter, which keeps session state thread-local while connections
+    are reused across threads.
+
+    Parameters:
+    - pool_connections (int): Number of host pools to cache. Default is 10.
+    - pool_maxsize (int): Maximum number of keep-alive connections per host. Default is 32.
+    - pool_block (bool): Whether to block when the pool is exhausted instead of opening extra connections.
+    - timeout (float, optional): Default timeout in seconds for every request. Default is None (no timeout).
+    - prefetch_workers (int): Number of threads, shared by every paginated iterator of the client, that prefetch
+      pages. Default is 4.
+    - use_cache (bool): Whether GET requests are sent as conditional requests and answered from the cache on a
+      304 Not Modified. Default is True. 304 responses do not count against the GitHub rate limit.
+    - rate_limit (bool): Whether requests are paced by a RateLimitScheduler that follows the rate limit headers.
+      Default is True.
+    - rate_limiter (RateLimitScheduler, optional): Scheduler to use, e.g. to share the quota between clients.
+      Default is a new scheduler.
+    - retry (bool): Whether transient failures are retried. Default is True.
+    - retry_policy (RetryPolicy, optional): Retry policy to use. Default is RetryPolicy().
+    - cache (ConditionalRequestCache, optional): Cache to use, e.g. to share it between clients. Default is a new cache.
+    - journal (Journal, optional): Journal to record every request to, or to replay responses from without
+      sending any request. Default is None (live traffic only).
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = False,
+        timeout: float = None,
+        prefetch_workers: int = DEFAULT_PREFETCH_WORKERS,
+        use_cache: bool = True,
+        cache: ConditionalRequestCache = None,
+        rate_limit: bool = True,
+        rate_limiter: RateLimitScheduler = None,
+        retry: bool = True,
+        retry_policy: RetryPolicy = None,
+        journal: Journal = None,
+    ):
+        self.journal = journal
+        self.retry_policy = (retry_policy or RetryPolicy()) if retry else None
+        self.rate_limiter = (
+            (rate_limiter or RateLimitScheduler()) if rate_limit else None
+        )
+        self.timeout = timeout
+        self.prefetch_workers = prefetch_workers
+        self.cache = (cache or ConditionalRequestCache()) if use_cache else None
+        self._adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        self._local = threading.local()
+        # Sessions are owned by their thread, so the session of a thread that exits is dropped with it
+        self._sessions = weakref.WeakSet()
+        self._executor = None
+        self._lock = threading.Lock()
+
+    @property
+    def session(self) -> requests.Session:
+        """
+        Returns the requests.Session of the calling thread, creating it on first use.
+        """
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.mount("https://", self._adapter)
+            session.mount("http://", self._adapter)
+            self._local.session = session
+            with self._lock:
+                self._sessions.add(session)
+        return session
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """
+        Returns the thread pool that prefetches pages for the client, creating it on first use.
+
+        The pool is shared by every iterator of the client and lives until close(), so its threads, and the
+        sessions they hold, are reused instead of being created for every iteration.
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.prefetch_workers,
+                    thread_name_prefix="github-prefetch",
+                )
+            return self._executor
+
+    def auth_headers(
+        self,
+        include_token: bool = True,
+        random_token: bool = False,
+        scheme: str = "token",
+    ) -> dict:
+        """
+        Builds the authorization headers for a request. See build_auth_headers.
+        """
+        return build_auth_headers(include_token, random_token, scheme)
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        params=None,
+        headers=None,
+        json=None,
+        retry_non_idempotent: bool = False,
+    ) -> requests.Response:
+        """
+        Sends an HTTP request through the pooled session of the calling thread.
+
+        Parameters:
+        - method (str): HTTP method ('GET', 'PATCH', ...).
+        - url (str): Absolute URL of the endpoint.
+        - params (dict, optional): Query parameters.
+        - headers (dict, optional): Request headers.
+        - json (optional): JSON body of the request.
+        - retry_non_idempotent (bool): Whether to retry the request on transient failures even if the method is
+          not idempotent (e.g. PATCH). Default is False.
+
+        Returns:
+        - Response object containing the API response. Responses served from the cache have from_cache set to True.
+        - Raises an exception: JournalMissError in replay mode if the request was never recorded.
+        """
+        if self.journal is not None and self.journal.replaying:
+            return _response_from_journal(
+                self.journal.replay(method, url, params, headers), method, url, params
+            )
+
+        response = self._request(
+            method, url, params, headers, json, retry_non_idempotent
+        )
+
+        if self.journal is not None:
+            self.journal.record(
+                method,
+                url,
+                params,
+                headers,
+                json,
+                response.status_code,
+                response.headers,
+                response.text,
+                response.elapsed.total_seconds(),
+            )
+        return response
+
+    def _request(
+        self, method, url, params, headers, json, retry_non_idempotent
+    ) -> requests.Response:
+        if method != "GET" or self.cache is None:
+            return self._send_with_retry(
+                method, url, params, headers, json, retry_non_idempotent
+            )
+
+        key = self.cache.key(url, params, headers)
+        entry = self.cache.get(key)
+        if entry is not None:
+            headers = {**(headers or {}), **entry.conditional_headers()}
+
+        response = self._send_with_retry(method, url, params, headers, json, False)
+        if response.status_code == 304 and entry is not None:
+            return _response_from_cache(entry, response)
+        if response.status_code == 200:
+            self.cache.store(key, response.headers, response.content, response.encoding)
+        return response
+
+    def _send_with_retry(
+        self, method, url, params, headers, json, retry_non_idempotent
+    ) -> requests.Response:
+        if self.retry_policy is None:
+            return self._send(method, url, params, headers, json)
+        return self.retry_policy.call(
+            method,
+            url,
+            lambda: self._send(method, url, params, headers, json),
+            retry_non_idempotent=retry_non_idempotent,
+            transport_errors=(requests.ConnectionError, requests.Timeout),
+        )
+
+    def _send(self, method, url, params, headers, json) -> requests.Response:
+        if self.rate_limiter is not None:
+            self.rate_limiter.wait(method, url, headers)
+
+        response = self.session.request(
+            method, url, params=params, headers=headers, json=json, timeout=self.timeout
+        )
+
+        if self.rate_limiter is not None:
+            self.rate_limiter.update(
+                url, headers, response.status_code, response.headers
+            )
+        return response
+
+    def get(self, url: str, params=None, headers=None) -> requests.Response:
+        return self.request("GET", url, params=params, headers=headers)
+
+    def patch(
+        self, url: str, headers=None, json=None, retry_non_idempotent: bool = False
+    ) -> requests.Response:
+        return self.request(
+            "PATCH",
+            url,
+            headers=headers,
+            json=json,
+            retry_non_idempotent=retry_non_idempotent,
+        )
+
+    def close(self):
+        """
+        Stops the prefetch thread pool and closes every pooled connection and the per-thread sessions.
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+            sessions, self._sessions = list(self._sessions), weakref.WeakSet()
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+        for session in sessions:
+            session.close()
+        self._adapter.close()
+        self._local = threading.local()
+
+
+def _response_from_cache(
+    entry: CachedResponse, not_modified: requests.Response
+) -> requests.Response:
+    """
+    Builds a 200 response with the cached body for a request that was answered with 304 Not Modified.
+    """
+    response = requests.Response()
+    response.status_code = 200
+    response.reason = "OK"
+    response._content = entry.content
+    response.encoding = entry.encoding
+    response.headers = CaseInsensitiveDict(
+        entry.revalidated_headers(not_modified.headers)
+    )
+    response.url = not_modified.url
+    response.request = not_modified.request
+    response.elapsed = not_modified.elapsed
+    response.connection = not_modified.connection
+    response.from_cache = True
+    return response
+
+
+def _response_from_journal(
+    entry: dict, method: str, url: str, params: dict
+) -> requests.Response:
+    """
+    Builds the response recorded in a journal entry.
+    """
+    response = requests.Response()
+    response.status_code = entry["status_code"]
+    response._content = entry["body"].encode("utf-8")
+    response.encoding = "utf-8"
+    response.headers = CaseInsensitiveDict(entry["headers"])
+    response.request = requests.Request(method, url, params=params).prepare()
+    response.url = response.request.url
+    response.from_journal = True
+    return response
+
+
+_default_client = None
+_default_client_lock = threading.Lock()
+
+
+def get_default_client() -> GitHubClient:
+    """
+    Returns the process-wide client used by the API helpers when no client is passed explicitly.
+
+    Its journal mode is taken from the GITHUB_API_MODE and GITHUB_API_JOURNAL environment variables.
+    """
+    global _default_client
+    if _default_client is None:
+        with _default_client_lock:
+            if _default_client is None:
+                _default_client = GitHubClient(journal=Journal.from_env())
+    return _default_client
+
+
+def set_default_client(client: GitHubClient):
+    """
+    Replaces the process-wide client used by the API helpers (e.g. to tune the pool size in a fixture).
+    """
+    global _default_client
+    with _default_client_lock:
+        _default_client = client
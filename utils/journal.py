@@ -0,0 +1,168 @@
+import json
+import os
+import threading
+from collections import defaultdict, deque
+from typing import Dict, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+LIVE, RECORD, REPLAY = "live", "record", "replay"
+MODES = (LIVE, RECORD, REPLAY)
+
+DEFAULT_JOURNAL_PATH = os.path.join("journal", "requests.jsonl")
+
+# Response headers that are never written to the journal
+_SKIPPED_HEADERS = {
+    "set-cookie",
+    "content-encoding",
+    "transfer-encoding",
+    "content-length",
+}
+
+
+class JournalMissError(LookupError):
+    """
+    Raised in replay mode when the journal has no response for a request.
+    """
+
+
+def auth_class(headers: dict = None) -> str:
+    """
+    Classifies the Authorization header of a request without exposing the token:
+    'none' (no token), 'token' (the GITHUB_TOKEN) or 'invalid' (any other token, e.g. a random one).
+    """
+    authorization = (headers or {}).get("Authorization")
+    if not authorization:
+        return "none"
+    github_token = os.getenv("GITHUB_TOKEN")
+    if github_token and authorization.split(" ", 1)[-1] == github_token:
+        return "token"
+    return "invalid"
+
+
+def request_key(
+    method: str, url: str, params: dict = None, headers: dict = None
+) -> Tuple:
+    """
+    Builds the key requests are matched on: method, URL path, query parameters and auth class.
+
+    Only the path of the URL is used, so a journal recorded against api.github.com can be replayed with
+    BASE_URL pointing anywhere. Query parameters embedded in the URL (e.g. pagination links) and passed
+    in params are merged.
+    """
+    parts = urlsplit(url)
+    query = parse_qsl(parts.query) + [
+        (str(key), str(value)) for key, value in (params or {}).items()
+    ]
+    return method.upper(), parts.path, tuple(sorted(query)), auth_class(headers)
+
+
+class Journal:
+    """
+    NDJSON journal of API traffic, one request/response pair per line.
+
+    In record mode every request sent by a client is appended to the journal. In replay mode requests
+    are answered from the journal without touching the network, matching on method, URL path, query
+    parameters and auth class. When the same request was recorded several times, the recorded responses
+    are served in order and the last one is repeated afterwards, so sequences such as GET, PATCH, GET of
+    the same profile replay faithfully.
+
+    Parameters:
+    - path (str): Path of the journal file. Default is journal/requests.jsonl.
+    - mode (str): 'record' or 'replay'.
+    """
+
+    def __init__(self, path: str = DEFAULT_JOURNAL_PATH, mode: str = RECORD):
+        if mode not in (RECORD, REPLAY):
+            raise ValueError(
+                f"Journal mode must be '{RECORD}' or '{REPLAY}', got '{mode}'"
+            )
+        self.path = path
+        self.mode = mode
+        self._lock = threading.Lock()
+        self._entries: Dict[Tuple, deque] = defaultdict(deque)
+        if mode == REPLAY:
+            self._load()
+
+    @classmethod
+    def from_env(cls) -> Optional["Journal"]:
+        """
+        Builds a journal from the GITHUB_API_MODE ('live', 'record' or 'replay') and GITHUB_API_JOURNAL
+        environment variables, or returns None in live mode.
+        """
+        mode = os.getenv("GITHUB_API_MODE", LIVE).lower()
+        if mode not in MODES:
+            raise ValueError(f"GITHUB_API_MODE must be one of {MODES}, got '{mode}'")
+        if mode == LIVE:
+            return None
+        return cls(os.getenv("GITHUB_API_JOURNAL", DEFAULT_JOURNAL_PATH), mode)
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == REPLAY
+
+    def _load(self):
+        with open(self.path, encoding="utf-8") as journal_file:
+            for line in journal_file:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                key = request_key(entry["method"], entry["url"], entry["params"])
+                self._entries[key[:3] + (entry["auth"],)].append(entry)
+
+    def record(
+        self,
+        method: str,
+        url: str,
+        params: dict,
+        headers: dict,
+        body,
+        status_code: int,
+        response_headers,
+        text: str,
+        elapsed: float = None,
+    ):
+        """
+        Appends a request/response pair to the journal. The token itself is never written, only its auth class.
+        """
+        entry = {
+            "method": method.upper(),
+            "url": url,
+            "params": {str(key): str(value) for key, value in (params or {}).items()},
+            "auth": auth_class(headers),
+            "request_body": body,
+            "status_code": status_code,
+            "headers": {
+                name: value
+                for name, value in response_headers.items()
+                if name.lower() not in _SKIPPED_HEADERS
+            },
+            "body": text,
+            "elapsed": elapsed,
+        }
+        line = json.dumps(entry, ensure_ascii=False) + "\n"
+        with self._lock:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as journal_file:
+                journal_file.write(line)
+
+    def replay(
+        self, method: str, url: str, params: dict = None, headers: dict = None
+    ) -> dict:
+        """
+        Returns the recorded entry for a request.
+
+        Returns:
+        - dict: The journal entry, with status_code, headers and body of the recorded response.
+        - Raises an exception: JournalMissError if the request was never recorded.
+        """
+        key = request_key(method, url, params, headers)
+        with self._lock:
+            entries = self._entries.get(key)
+            if not entries:
+                raise JournalMissError(
+                    f"No recorded response in {self.path} for {key[0]} {key[1]} "
+                    f"params={dict(key[2])} auth={key[3]}"
+                )
+            return entries.popleft() if len(entries) > 1 else entries[0]
@@ -0,0 +1,226 @@
+import threading
+from dataclasses import MISSING, InitVar, is_dataclass
+from functools import wraps
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Type,
+    Union,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
+
+from utils.schema_validator import from_dict
+
+# Proxy classes by the dataclass they stand for, built the first time a dataclass is seen in the process
+_proxies: Dict[type, type] = {}
+_proxies_lock = threading.Lock()
+
+
+class LazyModel:
+    """
+    Base of the lazy proxies: a proxy wraps the decoded dictionary of a model and has the attributes of its
+    dataclass, but a field is only read when it is accessed, and nested models are wrapped in their own
+    proxies on first access. The other public methods of the dataclass (e.g. Repository.to_dict) convert the
+    proxy with to_model() first. Proxies must be treated as immutable, like the dictionary they wrap.
+    """
+
+    __slots__ = ("_data", "_values")
+    model: ClassVar[type]
+
+    def __init__(self, data: Dict[str, Any]):
+        self._data = data
+        # Converted values of the nested fields, by field name, once accessed
+        self._values: Optional[Dict[str, Any]] = None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._data!r})"
+
+    def __eq__(self, other) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._data == other._data
+
+    __hash__ = None
+
+    def to_model(self):
+        """
+        Returns the dataclass instance the proxy stands for, converting every field.
+        """
+        return from_dict(self._data, self.model)
+
+
+def _proxy_of(dataclass_type: type) -> Callable:
+    # The proxy class is looked up when a value is wrapped, so that self-referencing dataclasses need no
+    # special case while their proxy class is being built
+    def wrap(value):
+        if not isinstance(value, dict):
+            return value
+        return (_proxies.get(dataclass_type) or lazy_type(dataclass_type))(value)
+
+    return wrap
+
+
+def _lazy_converter(field_type) -> Optional[Callable]:
+    """
+    Returns the function wrapping a value of a field of the given type, or None if it is returned as is.
+    Mirrors the conversion of from_dict: an empty object in an Optional dataclass field becomes None.
+    """
+    origin, args = get_origin(field_type), get_args(field_type)
+    if is_dataclass(field_type):
+        return _proxy_of(field_type)
+
+    if origin is list and len(args) == 1:
+        wrap_item = _lazy_converter(args[0])
+        if wrap_item is None:
+            return None
+        return lambda value: (
+            [wrap_item(item) for item in value] if isinstance(value, list) else value
+        )
+
+    if origin is Union and len(args) == 2 and type(None) in args:
+        inner_type = args[0] if args[1] is type(None) else args[1]
+        wrap_inner = _lazy_converter(inner_type)
+        if wrap_inner is None:
+            return None
+        if is_dataclass(inner_type):
+            return lambda value: (
+                None if value is None or value == {} else wrap_inner(value)
+            )
+        return lambda value: None if value is None else wrap_inner(value)
+    return None
+
+
+def _missing(self: LazyModel, name: str) -> AttributeError:
+    return AttributeError(f"{type(self).__name__} has no field {name!r} in its data")
+
+
+def _field_property(name: str, field, convert: Optional[Callable]) -> property:
+    if convert is None and field.default is not MISSING:
+        default = field.default
+
+        def read(self: LazyModel):
+            return self._data.get(name, default)
+
+    elif convert is None and field.default_factory is MISSING:
+
+        def read(self: LazyModel):
+            try:
+                return self._data[name]
+            except KeyError:
+                raise _missing(self, name) from None
+
+    else:
+        # Converted and default_factory values are computed once and kept
+        def read(self: LazyModel):
+            values = self._values
+            if values is None:
+                values = self._values = {}
+            elif name in values:
+                return values[name]
+            if name in self._data:
+                value = self._data[name]
+                value = value if convert is None else convert(value)
+            elif field.default is not MISSING:
+                value = field.default
+            elif field.default_factory is not MISSING:
+                value = field.default_factory()
+            else:
+                raise _missing(self, name)
+            values[name] = value
+            return value
+
+    return property(read, doc=f"The {name} field, read from the data on access.")
+
+
+def _forwarded_method(name: str, method: Callable) -> Callable:
+    # The other methods may need the whole dataclass instance (e.g. Repository.to_dict), so they are called
+    # on the converted model
+    @wraps(method)
+    def forward(self: LazyModel, *args, **kwargs):
+        return getattr(self.to_model(), name)(*args, **kwargs)
+
+    return forward
+
+
+def _build_proxy(dataclass_type: type) -> type:
+    hints = get_type_hints(dataclass_type)
+    # The fields from_dict reads: those with init=True and the InitVar pseudo-fields
+    fields = {
+        name: field
+        for name, field in dataclass_type.__dataclass_fields__.items()
+        if field.init and get_origin(hints.get(name)) is not ClassVar
+    }
+    namespace = {"__slots__": (), "model": dataclass_type}
+    # The other properties of the dataclass (e.g. Repository.updated_at_epoch) only read its fields, so they
+    # work on the proxy as well. Public static and class methods are kept, and the other public methods are
+    # forwarded to the converted dataclass
+    for cls in reversed(dataclass_type.__mro__):
+        for name, attribute in vars(cls).items():
+            if name in fields or name in vars(LazyModel):
+                continue
+            if isinstance(attribute, property):
+                namespace[name] = attribute
+            elif name.startswith("_"):
+                continue
+            elif isinstance(attribute, (staticmethod, classmethod)):
+                namespace[name] = attribute
+            elif callable(attribute):
+                namespace[name] = _forwarded_method(name, attribute)
+    for name, field in fields.items():
+        hint = hints.get(name, field.type)
+        convert = None if isinstance(hint, InitVar) else _lazy_converter(hint)
+        namespace[name] = _field_property(name, field, convert)
+    return type(f"Lazy{dataclass_type.__name__}", (LazyModel,), namespace)
+
+
+def lazy_type(dataclass_type: type) -> type:
+    """
+    Returns the proxy class of a dataclass, a LazyModel subclass named Lazy<dataclass name>.
+    """
+    proxy = _proxies.get(dataclass_type)
+    if proxy is not None:
+        return proxy
+
+    with _proxies_lock:
+        proxy = _proxies.get(dataclass_type)
+        if proxy is None:
+            proxy = _proxies[dataclass_type] = _build_proxy(dataclass_type)
+    return proxy
+
+
+def lazy_from_dict(data: Dict[str, Any], dataclass_type: Type) -> LazyModel:
+    """
+    Wraps a dictionary in a lazy proxy of a dataclass, without converting any field.
+
+    Parameters:
+    - data (Dict[str, Any]): The dictionary to wrap. It is not modified nor copied.
+    - dataclass_type (Type): The dataclass whose attributes the proxy has.
+
+    Returns:
+    - LazyModel: The proxy. Unlike from_dict, missing or unknown fields are only noticed when accessed.
+    """
+    return lazy_type(dataclass_type)(data)
+
+
+def lazy_from_dict_many(
+    items: Iterable[Dict[str, Any]], dataclass_type: Type
+) -> List[LazyModel]:
+    """
+    Wraps a list of dictionaries (e.g. a decoded response body) in lazy proxies of a dataclass.
+
+    Parameters:
+    - items (Iterable[Dict[str, Any]]): The dictionaries to wrap. They are not modified.
+    - dataclass_type (Type): The dataclass whose attributes the proxies have.
+
+    Returns:
+    - List[LazyModel]: The proxies, in the order of the items.
+    """
+    proxy = lazy_type(dataclass_type)
+    return [proxy(item) for item in items]
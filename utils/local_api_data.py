@@ -0,0 +1,618 @@
+import base64
+import hashlib
+import os
+from typing import Dict, Iterable, List, Optional
+
+from models.repo_model import URL_SUFFIXES
+
+API_URL = "https://api.github.com"
+WEB_URL = "https://github.com"
+
+# Fields of the private profile that GitHub only returns to the authenticated user
+PRIVATE_PROFILE_FIELDS = (
+    "private_gists",
+    "total_private_repos",
+    "owned_private_repos",
+    "disk_usage",
+    "collaborators",
+    "two_factor_authentication",
+    "plan",
+    "notification_email",
+)
+
+PROFILE_FIELDS = (
+    "name",
+    "company",
+    "blog",
+    "location",
+    "email",
+    "hireable",
+    "bio",
+    "twitter_username",
+)
+
+
+def node_id(kind: str, object_id) -> str:
+    """
+    Returns a GitHub-like global node id for an object.
+    """
+    return base64.b64encode(f"0{len(kind)}:{kind}{object_id}".encode()).decode()
+
+
+def fake_sha(*parts) -> str:
+    """
+    Returns a deterministic 40-character hexadecimal SHA for the given parts.
+    """
+    return hashlib.sha1(":".join(str(part) for part in parts).encode()).hexdigest()
+
+
+def simple_user(
+    login: str,
+    id: int,
+    type: str = "User",
+    site_admin: bool = False,
+    api_url: str = API_URL,
+) -> dict:
+    """
+    Builds the simple-user object embedded as repository owner and commit author/committer.
+    """
+    user_url = f"{api_url}/users/{login}"
+    return {
+        "login": login,
+        "id": id,
+        "node_id": node_id("User", id),
+        "avatar_url": f"https://avatars.githubusercontent.com/u/{id}?v=4",
+        "gravatar_id": "",
+        "url": user_url,
+        "html_url": f"{WEB_URL}/{login}",
+        "followers_url": f"{user_url}/followers",
+        "following_url": f"{user_url}/following{{/other_user}}",
+        "gists_url": f"{user_url}/gists{{/gist_id}}",
+        "starred_url": f"{user_url}/starred{{/owner}}{{/repo}}",
+        "subscriptions_url": f"{user_url}/subscriptions",
+        "organizations_url": f"{user_url}/orgs",
+        "repos_url": f"{user_url}/repos",
+        "events_url": f"{user_url}/events{{/privacy}}",
+        "received_events_url": f"{user_url}/received_events",
+        "type": type,
+        "user_view_type": "public",
+        "site_admin": site_admin,
+    }
+
+
+def user_profile(
+    login: str,
+    id: int,
+    created_at: str,
+    updated_at: str,
+    name: str = None,
+    company: str = None,
+    blog: str = "",
+    location: str = None,
+    email: str = None,
+    hireable: bool = None,
+    bio: str = None,
+    twitter_username: str = None,
+    public_repos: int = 0,
+    public_gists: int = 0,
+    followers: int = 0,
+    following: int = 0,
+    private_gists: int = 0,
+    total_private_repos: int = 0,
+    owned_private_repos: int = 0,
+    disk_usage: int = 0,
+    collaborators: int = 0,
+    two_factor_authentication: bool = False,
+    type: str = "User",
+    api_url: str = API_URL,
+) -> dict:
+    """
+    Builds the full (private) profile of a user, as returned by GET /user. See public_profile for the public view.
+    """
+    profile = simple_user(login, id, type=type, api_url=api_url)
+    profile.update(
+        {
+            "name": name,
+            "company": company,
+            "blog": blog,
+            "location": location,
+            "email": email,
+            "hireable": hireable,
+            "bio": bio,
+            "twitter_username": twitter_username,
+            "notification_email": email,
+            "public_repos": public_repos,
+            "public_gists": public_gists,
+            "followers": followers,
+            "following": following,
+            "created_at": created_at,
+            "updated_at": updated_at,
+            "private_gists": private_gists,
+            "total_private_repos": total_private_repos,
+            "owned_private_repos": owned_private_repos,
+            "disk_usage": disk_usage,
+            "collaborators": collaborators,
+            "two_factor_authentication": two_factor_authentication,
+            "plan": {
+                "name": "free",
+                "space": 976562499,
+                "collaborators": 0,
+                "private_repos": 10000,
+            },
+        }
+    )
+    return profile
+
+
+def public_profile(profile: dict) -> dict:
+    """
+    Returns the public view of a full profile, as returned by GET /users/{username} to other users.
+    """
+    return {
+        key: value
+        for key, value in profile.items()
+        if key not in PRIVATE_PROFILE_FIELDS
+    }
+
+
+def repository(
+    owner: dict,
+    name: str,
+    id: int,
+    created_at: str,
+    updated_at: str,
+    pushed_at: str,
+    private: bool = False,
+    description: str = None,
+    fork: bool = False,
+    homepage: str = None,
+    size: int = 0,
+    stargazers_count: int = 0,
+    language: str = None,
+    forks_count: int = 0,
+    open_issues_count: int = 0,
+    archived: bool = False,
+    topics: List[str] = None,
+    default_branch: str = "main",
+    api_url: str = API_URL,
+) -> dict:
+    """
+    Builds a repository object with every field of the list repositories endpoints, including permissions.
+
+    Parameters:
+    - owner (dict): Simple-user object of the owner (see simple_user).
+    - Other parameters are the repository fields of the same name.
+    """
+    full_name = f"{owner['login']}/{name}"
+    url = f"{api_url}/repos/{full_name}"
+    repo = {
+        "id": id,
+        "node_id": node_id("Repository", id),
+        "name": name,
+        "full_name": full_name,
+        "private": private,
+        "owner": owner,
+        "html_url": f"{WEB_URL}/{full_name}",
+        "description": description,
+        "fork": fork,
+        "url": url,
+    }
+    repo.update({field: url + suffix for field, suffix in URL_SUFFIXES.items()})
+    repo.update(
+        {
+            "created_at": created_at,
+            "updated_at": updated_at,
+            "pushed_at": pushed_at,
+            "git_url": f"git://github.com/{full_name}.git",
+            "ssh_url": f"git@github.com:{full_name}.git",
+            "clone_url": f"{WEB_URL}/{full_name}.git",
+            "svn_url": f"{WEB_URL}/{full_name}",
+            "homepage": homepage,
+            "size": size,
+            "stargazers_count": stargazers_count,
+            "watchers_count": stargazers_count,
+            "language": language,
+            "has_issues": True,
+            "has_projects": True,
+            "has_downloads": True,
+            "has_wiki": True,
+            "has_pages": False,
+            "has_discussions": False,
+            "forks_count": forks_count,
+            "mirror_url": None,
+            "archived": archived,
+            "disabled": False,
+            "open_issues_count": open_issues_count,
+            "license": None,
+            "allow_forking": True,
+            "is_template": False,
+            "web_commit_signoff_required": False,
+            "topics": topics or [],
+            "visibility": "private" if private else "public",
+            "forks": forks_count,
+            "open_issues": open_issues_count,
+            "watchers": stargazers_count,
+            "default_branch": default_branch,
+            "permissions": {
+                "admin": True,
+                "maintain": True,
+                "push": True,
+                "triage": True,
+                "pull": True,
+            },
+        }
+    )
+    return repo
+
+
+def commit(
+    repo_full_name: str,
+    sha: str,
+    message: str,
+    author: dict,
+    committer: dict,
+    author_user: Optional[dict],
+    committer_user: Optional[dict],
+    parents: Iterable[str] = (),
+    tree_sha: str = None,
+    api_url: str = API_URL,
+) -> dict:
+    """
+    Builds a commit object of GET /repos/{owner}/{repo}/commits.
+
+    Parameters:
+    - repo_full_name (str): owner/name of the repository.
+    - sha (str): SHA of the commit.
+    - message (str): Commit message.
+    - author (dict), committer (dict): Git signatures with name, email and date.
+    - author_user (dict, optional), committer_user (dict, optional): Simple-user objects of the GitHub accounts
+      matching the signatures. None is returned as an empty object, like GitHub does for unknown emails.
+    - parents (Iterable[str]): SHAs of the parent commits.
+    """
+    repo_url = f"{api_url}/repos/{repo_full_name}"
+    tree_sha = tree_sha or fake_sha("tree", sha)
+    return {
+        "sha": sha,
+        "node_id": node_id("Commit", sha),
+        "commit": {
+            "author": dict(author),
+            "committer": dict(committer),
+            "message": message,
+            "tree": {"sha": tree_sha, "url": f"{repo_url}/git/trees/{tree_sha}"},
+            "url": f"{repo_url}/git/commits/{sha}",
+            "comment_count": 0,
+            "verification": {
+                "verified": False,
+                "reason": "unsigned",
+                "signature": None,
+                "payload": None,
+                "verified_at": None,
+            },
+        },
+        "url": f"{repo_url}/commits/{sha}",
+        "html_url": f"{WEB_URL}/{repo_full_name}/commit/{sha}",
+        "comments_url": f"{repo_url}/commits/{sha}/comments",
+        "author": author_user if author_user is not None else {},
+        "committer": committer_user if committer_user is not None else {},
+        "parents": [
+            {
+                "sha": parent,
+                "url": f"{repo_url}/commits/{parent}",
+                "html_url": f"{WEB_URL}/{repo_full_name}/commit/{parent}",
+            }
+            for parent in parents
+        ],
+    }
+
+
+class Dataset:
+    """
+    In-memory GitHub data served by the local API server: users, tokens, repositories, collaborators,
+    organization members and commit histories. Logins and repository names are case-insensitive.
+    """
+
+    def __init__(self):
+        self.users: Dict[str, dict] = {}
+        self.tokens: Dict[str, str] = {}
+        self.repositories: List[dict] = []
+        self.repositories_by_name: Dict[str, dict] = {}
+        self.collaborators: Dict[str, set] = {}
+        self.organization_members: Dict[str, set] = {}
+        self.commits: Dict[str, List[dict]] = {}
+        self.commits_by_sha: Dict[str, Dict[str, dict]] = {}
+        self.commit_paths: Dict[str, List[str]] = {}
+
+    def add_user(self, profile: dict, token: str = None) -> dict:
+        self.users[profile["login"].lower()] = profile
+        if token:
+            self.tokens[token] = profile["login"].lower()
+        return profile
+
+    def add_repository(self, repo: dict, collaborators: Iterable[str] = ()) -> dict:
+        full_name = repo["full_name"].lower()
+        self.repositories.append(repo)
+        self.repositories_by_name[full_name] = repo
+        self.collaborators[full_name] = {login.lower() for login in collaborators}
+        self.commits.setdefault(full_name, [])
+        self.commits_by_sha.setdefault(full_name, {})
+        return repo
+
+    def add_organization_member(self, organization: str, login: str):
+        self.organization_members.setdefault(organization.lower(), set()).add(
+            login.lower()
+        )
+
+    def add_commit(
+        self, repo_full_name: str, commit_object: dict, paths: Iterable[str] = ()
+    ):
+        """
+        Adds a commit to a repository. Commits must be added from the newest to the oldest (git log order).
+        """
+        full_name = repo_full_name.lower()
+        self.commits[full_name].append(commit_object)
+        self.commits_by_sha[full_name][commit_object["sha"]] = commit_object
+        if paths:
+            self.commit_paths[commit_object["sha"]] = list(paths)
+
+    def user_for_token(self, token: str) -> Optional[dict]:
+        login = self.tokens.get(token)
+        return self.users.get(login) if login else None
+
+
+def _git_signature(name: str, email: str, date: str) -> dict:
+    return {"name": name, "email": email, "date": date}
+
+
+def default_dataset(token: str = None) -> Dataset:
+    """
+    Builds the dataset the test suite runs against: octocat and its public repositories (including the
+    three commits of Hello-World), and aleixbernardo with nine repositories, four of them owned by
+    mbernardo95. The given token (default: GITHUB_TOKEN, or 'local-token') authenticates as aleixbernardo.
+    """
+    dataset = Dataset()
+    token = token or os.getenv("GITHUB_TOKEN") or "local-token"
+
+    octocat = dataset.add_user(
+        user_profile(
+            "octocat",
+            583231,
+            "2011-01-25T18:44:36Z",
+            "2025-01-22T12:33:42Z",
+            name="The Octocat",
+            company="@github",
+            blog="https://github.blog",
+            location="San Francisco",
+            public_repos=8,
+            public_gists=8,
+            followers=17000,
+            following=9,
+        )
+    )
+    aleix = dataset.add_user(
+        user_profile(
+            "aleixbernardo",
+            101258743,
+            "2022-03-23T09:11:05Z",
+            "2025-02-10T14:27:22Z",
+            name="aleix",
+            company="Bizerba",
+            blog="aleix.bernardo@blog.com",
+            location="Badalona",
+            bio="this is the bio of aleix",
+            twitter_username="aleix_twitter",
+            public_repos=1,
+            total_private_repos=4,
+            owned_private_repos=4,
+            disk_usage=1024,
+        ),
+        token=token,
+    )
+    mbernardo = dataset.add_user(
+        user_profile(
+            "mbernardo95", 44158710, "2018-10-15T08:00:00Z", "2025-01-25T14:47:52Z"
+        )
+    )
+    for login, id in (("Spaceghost", 251370), ("Cameron423698", 7823)):
+        dataset.add_user(
+            user_profile(login, id, "2010-04-13T00:00:00Z", "2024-01-01T00:00:00Z")
+        )
+    github = dataset.add_user(
+        user_profile(
+            "github",
+            9919,
+            "2008-05-11T04:37:31Z",
+            "2024-01-01T00:00:00Z",
+            type="Organization",
+        )
+    )
+
+    def simple(profile):
+        return simple_user(profile["login"], profile["id"], type=profile["type"])
+
+    # octocat: eight public repositories, plus one of the github organization it collaborates on
+    octocat_repositories = [
+        (
+            "boysenberry-repo-1",
+            1296270,
+            "2018-05-10T17:51:29Z",
+            "2024-11-09T19:27:04Z",
+        ),
+        ("git-consortium", 18221276, "2014-03-28T17:55:38Z", "2024-10-28T05:40:50Z"),
+        ("hello-worId", 56271164, "2016-04-14T21:36:35Z", "2024-11-07T17:10:49Z"),
+        ("Hello-World", 1296269, "2011-01-26T19:01:12Z", "2025-01-22T14:02:03Z"),
+        ("linguist", 1300192, "2011-01-26T22:27:42Z", "2024-11-11T01:32:05Z"),
+        ("octocat.github.io", 17881631, "2014-03-18T20:10:19Z", "2024-11-03T18:09:26Z"),
+        ("Spoon-Knife", 1300193, "2011-01-27T19:30:43Z", "2025-01-20T20:11:36Z"),
+        ("test-repo1", 130792000, "2018-04-24T03:51:26Z", "2024-10-14T07:41:46Z"),
+    ]
+    for name, id, created_at, updated_at in octocat_repositories:
+        dataset.add_repository(
+            repository(simple(octocat), name, id, created_at, updated_at, updated_at)
+        )
+    dataset.add_repository(
+        repository(
+            simple(github),
+            "octokit.rb",
+            417862,
+            "2009-12-10T21:41:49Z",
+            "2024-12-01T10:00:00Z",
+            "2024-12-01T10:00:00Z",
+        ),
+        collaborators=["octocat"],
+    )
+
+    octocat_user, spaceghost, cameron = (
+        simple(octocat),
+        simple(dataset.users["spaceghost"]),
+        simple(dataset.users["cameron423698"]),
+    )
+    first_sha = "553c2077f0edc3d5dc5d17262f6aa498e69d6f8e"
+    newline_sha = "762941318ee16e59dabbacb1b4049eec22f0d303"
+    merge_sha = "7fd1a60b01f91b314f59955a4e4d4e80d8edf11d"
+    octocat_signature = _git_signature(
+        "The Octocat", "octocat@nowhere.com", "2012-03-06T23:06:50Z"
+    )
+    dataset.add_commit(
+        "octocat/Hello-World",
+        commit(
+            "octocat/Hello-World",
+            merge_sha,
+            "Merge pull request #6 from Spaceghost/patch-1\n\nNew line at end of file.",
+            octocat_signature,
+            octocat_signature,
+            octocat_user,
+            octocat_user,
+            parents=[first_sha, newline_sha],
+        ),
+    )
+    spaceghost_signature = _git_signature(
+        "Johnneylee Jack Rollins",
+        "Johnneylee.rollins@gmail.com",
+        "2011-09-14T04:42:41Z",
+    )
+    dataset.add_commit(
+        "octocat/Hello-World",
+        commit(
+            "octocat/Hello-World",
+            newline_sha,
+            "New line at end of file. --Signed off by Spaceghost",
+            spaceghost_signature,
+            spaceghost_signature,
+            spaceghost,
+            spaceghost,
+            parents=[first_sha],
+        ),
+        paths=["README"],
+    )
+    cameron_signature = _git_signature(
+        "cameronmcefee", "cameron@github.com", "2011-01-26T19:06:08Z"
+    )
+    dataset.add_commit(
+        "octocat/Hello-World",
+        commit(
+            "octocat/Hello-World",
+            first_sha,
+            "first commit",
+            cameron_signature,
+            cameron_signature,
+            cameron,
+            cameron,
+        ),
+        paths=["README"],
+    )
+    boysenberry_signature = _git_signature(
+        "octocat", "octocat@github.com", "2018-05-10T17:51:29Z"
+    )
+    dataset.add_commit(
+        "octocat/boysenberry-repo-1",
+        commit(
+            "octocat/boysenberry-repo-1",
+            "7fd1a60b01f91b314f59955a4e4d4e80d8edf11e",
+            "Initial commit",
+            boysenberry_signature,
+            boysenberry_signature,
+            octocat_user,
+            octocat_user,
+        ),
+    )
+
+    # aleixbernardo: five own repositories (one public) and four private ones of mbernardo95
+    aleix_repositories = [
+        (aleix, "api_automation", True, "2025-01-01T15:20:00Z", "2025-01-01T15:39:16Z"),
+        (aleix, "bookstore", True, "2025-01-01T17:00:00Z", "2025-01-01T17:29:27Z"),
+        (
+            aleix,
+            "github_testing",
+            False,
+            "2025-01-25T12:00:00Z",
+            "2025-02-10T14:27:22Z",
+        ),
+        (aleix, "travel_planner", True, "2025-01-25T12:30:00Z", "2025-01-25T12:35:02Z"),
+        (aleix, "weather_app", True, "2025-01-25T14:40:00Z", "2025-01-25T14:45:36Z"),
+        (
+            mbernardo,
+            "landing-page",
+            True,
+            "2022-05-01T20:00:00Z",
+            "2022-05-01T20:20:58Z",
+        ),
+        (mbernardo, "pokedex", True, "2022-09-20T14:00:00Z", "2022-09-20T14:20:15Z"),
+        (
+            mbernardo,
+            "react-course",
+            True,
+            "2022-09-20T14:30:00Z",
+            "2022-09-20T14:41:52Z",
+        ),
+        (mbernardo, "tfg", True, "2025-01-25T14:30:00Z", "2025-01-25T14:47:52Z"),
+    ]
+    for index, (owner, name, private, created_at, updated_at) in enumerate(
+        aleix_repositories
+    ):
+        owner_user = simple(owner)
+        repo = dataset.add_repository(
+            repository(
+                owner_user,
+                name,
+                900000000 + index,
+                created_at,
+                updated_at,
+                updated_at,
+                private=private,
+            ),
+            collaborators=["aleixbernardo"] if owner is mbernardo else [],
+        )
+        signature = _git_signature(
+            owner["login"], f"{owner['login']}@users.noreply.github.com", updated_at
+        )
+        first_signature = dict(signature, date=created_at)
+        head_sha, root_sha = fake_sha(repo["full_name"], 2), fake_sha(
+            repo["full_name"], 1
+        )
+        dataset.add_commit(
+            repo["full_name"],
+            commit(
+                repo["full_name"],
+                head_sha,
+                "Update README",
+                signature,
+                signature,
+                owner_user,
+                owner_user,
+                parents=[root_sha],
+            ),
+        )
+        dataset.add_commit(
+            repo["full_name"],
+            commit(
+                repo["full_name"],
+                root_sha,
+                "Initial commit",
+                first_signature,
+                first_signature,
+                owner_user,
+                owner_user,
+            ),
+        )
+
+    return dataset
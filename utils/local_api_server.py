@@ -0,0 +1,643 @@
+import argparse
+import hashlib
+import json
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from error_messages.messages import ErrorMessages
+from utils.local_api_data import (
+    PROFILE_FIELDS,
+    Dataset,
+    default_dataset,
+    public_profile,
+)
+from models.timestamps import parse_epoch
+
+DOCUMENTATION_URL = "https://docs.github.com/rest"
+DEFAULT_PER_PAGE = 30
+MAX_PER_PAGE = 100
+DEFAULT_RATE_LIMIT = 5000
+RATE_LIMIT_WINDOW = 3600
+
+# Oldest and newest timestamps accepted by the commits filters
+MIN_TIMESTAMP = parse_epoch("1970-01-01T00:00:00Z")
+MAX_TIMESTAMP = parse_epoch("2099-12-31T23:59:59Z")
+
+REPOSITORY_SORT_FIELDS = ("created", "updated", "pushed", "full_name")
+REPOSITORY_TYPES = ("all", "owner", "public", "private", "member")
+AFFILIATIONS = ("owner", "collaborator", "organization_member")
+
+_OWNER_PERMISSIONS = {
+    "admin": True,
+    "maintain": True,
+    "push": True,
+    "triage": True,
+    "pull": True,
+}
+_COLLABORATOR_PERMISSIONS = {
+    "admin": False,
+    "maintain": False,
+    "push": True,
+    "triage": True,
+    "pull": True,
+}
+_READ_PERMISSIONS = {
+    "admin": False,
+    "maintain": False,
+    "push": False,
+    "triage": False,
+    "pull": True,
+}
+
+
+class APIError(Exception):
+    """
+    Raised by the request handlers to answer with a GitHub error response.
+    """
+
+    def __init__(self, status_code: int, message: str):
+        super().__init__(message)
+        self.status_code = status_code
+        self.message = message
+
+
+class LocalGitHubAPI:
+    """
+    Local stand-in for the GitHub REST API endpoints used by the suite, served from an in-memory Dataset.
+
+    It answers like api.github.com does: the same status codes and error bodies, Link pagination headers,
+    weak ETags with 304 responses to If-None-Match, and X-RateLimit-* headers counted per token. Item JSON
+    is serialised once and reused, and connections are kept alive (HTTP/1.1), so the server can be used to
+    run the suite and measure the client offline and without rate limits.
+
+    Supported endpoints:
+    - GET /users/{username} and GET, PATCH /user
+    - GET /users/{username}/repos and GET /user/repos
+    - GET /repos/{owner}/{repo}/commits
+
+    Parameters:
+    - dataset (Dataset, optional): Data to serve. Default is default_dataset(), which mirrors the suite's expectations.
+    - host (str): Interface to listen on. Default is 127.0.0.1.
+    - port (int): Port to listen on. Default is 0 (any free port).
+    - rate_limit (int): Requests per hour allowed for each token (and for anonymous requests). Default is 5000.
+    """
+
+    def __init__(
+        self,
+        dataset: Dataset = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        rate_limit: int = DEFAULT_RATE_LIMIT,
+    ):
+        self.dataset = dataset or default_dataset()
+        self.rate_limit = rate_limit
+        self._lock = threading.Lock()
+        # Guards the profiles, which PATCH /user changes while other requests read them
+        self._profiles_lock = threading.Lock()
+        self._quotas: Dict[str, List] = {}
+        self._encoded: Dict[Tuple, bytes] = {}
+        self._ancestors: Dict[Tuple[str, str], List[dict]] = {}
+        self._server = ThreadingHTTPServer((host, port), _RequestHandler)
+        self._server.daemon_threads = True
+        self._server.api = self
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "LocalGitHubAPI":
+        """
+        Serves requests in a background thread and returns the server.
+        """
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="local-github-api", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        """
+        Serves requests in the calling thread until interrupted.
+        """
+        try:
+            self._server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self._server.server_close()
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "LocalGitHubAPI":
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    @contextmanager
+    def patch_base_urls(self):
+        """
+        Points the BASE_URL of the API helpers at the server for the duration of the block.
+        """
+        from utils import api_repos, api_users
+
+        previous = api_repos.BASE_URL, api_users.BASE_URL
+        api_repos.BASE_URL = api_users.BASE_URL = self.url
+        try:
+            yield self
+        finally:
+            api_repos.BASE_URL, api_users.BASE_URL = previous
+
+    # Rate limit
+
+    def consume_quota(self, identity: str) -> Tuple[int, int, int]:
+        """
+        Counts a request against the quota of a token and returns (limit, remaining, reset).
+        """
+        with self._lock:
+            now = int(time.time())
+            quota = self._quotas.get(identity)
+            if quota is None or quota[1] <= now:
+                quota = self._quotas[identity] = [
+                    self.rate_limit,
+                    now + RATE_LIMIT_WINDOW,
+                ]
+            if quota[0] > 0:
+                quota[0] -= 1
+                return self.rate_limit, quota[0], quota[1]
+            return self.rate_limit, -1, quota[1]
+
+    # Serialisation
+
+    def encode_item(self, key: Tuple, item: dict) -> bytes:
+        """
+        Returns the JSON of a list item, serialised once per key.
+        """
+        encoded = self._encoded.get(key)
+        if encoded is None:
+            encoded = json.dumps(
+                item, ensure_ascii=False, separators=(",", ":")
+            ).encode()
+            self._encoded[key] = encoded
+        return encoded
+
+    def encode_repository(self, repo: dict, viewer: Optional[dict]) -> bytes:
+        permissions = self.permissions(repo, viewer)
+        key = (
+            "repo",
+            repo["full_name"].lower(),
+            tuple(permissions.values()) if permissions else None,
+        )
+        if key not in self._encoded:
+            item = {
+                name: value for name, value in repo.items() if name != "permissions"
+            }
+            if permissions:
+                item["permissions"] = permissions
+            return self.encode_item(key, item)
+        return self._encoded[key]
+
+    def permissions(self, repo: dict, viewer: Optional[dict]) -> Optional[dict]:
+        if viewer is None:
+            return None
+        full_name = repo["full_name"].lower()
+        if repo["owner"]["login"].lower() == viewer["login"].lower():
+            return _OWNER_PERMISSIONS
+        if viewer["login"].lower() in self.dataset.collaborators.get(full_name, ()):
+            return _COLLABORATOR_PERMISSIONS
+        return _READ_PERMISSIONS
+
+    # Endpoints
+
+    def get_viewer(self, viewer: dict) -> dict:
+        """
+        Returns a copy of the full profile of the authenticated user.
+        """
+        with self._profiles_lock:
+            return dict(viewer)
+
+    def get_user(self, viewer: Optional[dict], username: str) -> dict:
+        profile = self.dataset.users.get(username.lower())
+        if profile is None:
+            raise APIError(404, ErrorMessages.NOT_FOUND)
+        if viewer is not None and viewer["login"].lower() == username.lower():
+            return self.get_viewer(profile)
+        with self._profiles_lock:
+            return public_profile(profile)
+
+    def update_user(self, viewer: dict, body) -> dict:
+        """
+        Applies the editable fields of a PATCH /user body and returns a copy of the updated profile. Like
+        GitHub, other keys are ignored.
+        """
+        if not isinstance(body, dict):
+            raise APIError(400, "Problems parsing JSON")
+        with self._profiles_lock:
+            changes = {
+                key: value
+                for key, value in body.items()
+                if key in PROFILE_FIELDS and viewer.get(key) != value
+            }
+            if changes:
+                viewer.update(changes)
+                viewer["updated_at"] = datetime.now(timezone.utc).strftime(
+                    "%Y-%m-%dT%H:%M:%SZ"
+                )
+            return dict(viewer)
+
+    def visible_repositories(
+        self, viewer: dict, affiliations: set, visibility: str
+    ) -> List[dict]:
+        login = viewer["login"].lower()
+        repositories = []
+        for repo in self.dataset.repositories:
+            full_name, owner = repo["full_name"].lower(), repo["owner"]
+            if owner["login"].lower() == login:
+                affiliation = "owner"
+            elif login in self.dataset.collaborators.get(full_name, ()):
+                affiliation = "collaborator"
+            elif login in self.dataset.organization_members.get(
+                owner["login"].lower(), ()
+            ):
+                affiliation = "organization_member"
+            else:
+                continue
+            if affiliation in affiliations and visibility in (
+                "all",
+                repo["visibility"],
+            ):
+                repositories.append(repo)
+        return repositories
+
+    def list_user_repositories(self, username: str, query: dict) -> List[dict]:
+        login = username.lower()
+        if login not in self.dataset.users:
+            raise APIError(404, ErrorMessages.NOT_FOUND)
+        repo_type = query.get("type", "owner")
+        if repo_type not in ("all", "owner", "member"):
+            raise APIError(422, "Validation Failed")
+        repositories = []
+        for repo in self.dataset.repositories:
+            if repo["private"]:
+                continue
+            owned = repo["owner"]["login"].lower() == login
+            member = login in self.dataset.collaborators.get(
+                repo["full_name"].lower(), ()
+            )
+            if (owned and repo_type in ("all", "owner")) or (
+                member and repo_type in ("all", "member")
+            ):
+                repositories.append(repo)
+        return self.sort_repositories(repositories, query)
+
+    def list_logged_user_repositories(self, viewer: dict, query: dict) -> List[dict]:
+        repo_type = query.get("type")
+        if repo_type is not None and ("visibility" in query or "affiliation" in query):
+            raise APIError(
+                422, ErrorMessages.INVALID_VISIBILITY_AFFILIATION_TYPE_COMBINATION
+            )
+
+        visibility = query.get("visibility", "all")
+        affiliations = set(query.get("affiliation", ",".join(AFFILIATIONS)).split(","))
+        if repo_type is not None:
+            if repo_type not in REPOSITORY_TYPES:
+                raise APIError(422, "Validation Failed")
+            visibility = repo_type if repo_type in ("public", "private") else "all"
+            affiliations = {
+                "owner": {"owner"},
+                "member": {"collaborator", "organization_member"},
+            }.get(repo_type, set(AFFILIATIONS))
+        if visibility not in ("all", "public", "private") or not affiliations <= set(
+            AFFILIATIONS
+        ):
+            raise APIError(422, "Validation Failed")
+
+        repositories = self.visible_repositories(viewer, affiliations, visibility)
+        try:
+            since = parse_epoch(query["since"]) if "since" in query else None
+            before = parse_epoch(query["before"]) if "before" in query else None
+        except ValueError:
+            raise APIError(422, "Validation Failed")
+        if since is not None:
+            repositories = [
+                repo for repo in repositories if parse_epoch(repo["updated_at"]) > since
+            ]
+        if before is not None:
+            repositories = [
+                repo
+                for repo in repositories
+                if parse_epoch(repo["updated_at"]) < before
+            ]
+        return self.sort_repositories(repositories, query)
+
+    def sort_repositories(self, repositories: List[dict], query: dict) -> List[dict]:
+        sort = query.get("sort", "full_name")
+        if sort not in REPOSITORY_SORT_FIELDS:
+            raise APIError(422, "Validation Failed")
+        direction = query.get("direction", "asc" if sort == "full_name" else "desc")
+        if direction not in ("asc", "desc"):
+            raise APIError(422, "Validation Failed")
+        if sort == "full_name":
+            key = lambda repo: repo["full_name"].lower()
+        else:
+            key = lambda repo: repo[f"{sort}_at"]
+        return sorted(repositories, key=key, reverse=direction == "desc")
+
+    def list_commits(
+        self, viewer: Optional[dict], owner: str, name: str, query: dict
+    ) -> List[dict]:
+        full_name = f"{owner}/{name}".lower()
+        repo = self.dataset.repositories_by_name.get(full_name)
+        if repo is None or (
+            repo["private"]
+            and self.permissions(repo, viewer) in (None, _READ_PERMISSIONS)
+        ):
+            raise APIError(404, ErrorMessages.NOT_FOUND)
+
+        commits = self.dataset.commits.get(full_name, [])
+        if not commits:
+            raise APIError(409, "Git Repository is empty.")
+        if "sha" in query:
+            commits = self.ancestors(full_name, query["sha"])
+
+        bounds = {}
+        for name_ in ("since", "until"):
+            if name_ in query:
+                try:
+                    bounds[name_] = parse_epoch(query[name_])
+                except ValueError:
+                    raise APIError(400, f"Invalid value for parameter '{name_}'")
+                if not MIN_TIMESTAMP <= bounds[name_] <= MAX_TIMESTAMP:
+                    raise APIError(400, f"Invalid value for parameter '{name_}'")
+        if (
+            "since" in bounds
+            and "until" in bounds
+            and bounds["since"] > bounds["until"]
+        ):
+            raise APIError(
+                400, "The 'since' parameter must be earlier than the 'until' parameter"
+            )
+
+        def signed_by(role: str, value: str):
+            value = value.lower()
+            return lambda item: (
+                (item[role] or {}).get("login", "").lower() == value
+                or item["commit"][role]["email"].lower() == value
+            )
+
+        filters = []
+        if "author" in query:
+            filters.append(signed_by("author", query["author"]))
+        if "committer" in query:
+            filters.append(signed_by("committer", query["committer"]))
+        if "since" in bounds:
+            since = bounds["since"]
+            filters.append(
+                lambda item: parse_epoch(item["commit"]["committer"]["date"]) >= since
+            )
+        if "until" in bounds:
+            until = bounds["until"]
+            filters.append(
+                lambda item: parse_epoch(item["commit"]["committer"]["date"]) <= until
+            )
+        if "path" in query:
+            path = query["path"].strip("/")
+            filters.append(
+                lambda item: any(
+                    changed == path or changed.startswith(f"{path}/")
+                    for changed in self.dataset.commit_paths.get(item["sha"], ())
+                )
+            )
+        if filters:
+            commits = [
+                item for item in commits if all(check(item) for check in filters)
+            ]
+        return commits
+
+    def ancestors(self, full_name: str, ref: str) -> List[dict]:
+        """
+        Returns the commits reachable from a SHA (or 'HEAD' / the default branch), newest first.
+        """
+        by_sha = self.dataset.commits_by_sha[full_name]
+        repo = self.dataset.repositories_by_name[full_name]
+        if ref in ("HEAD", repo["default_branch"]):
+            return self.dataset.commits[full_name]
+        start = by_sha.get(ref)
+        if start is None:
+            matches = (
+                [sha for sha in by_sha if sha.startswith(ref)] if len(ref) >= 7 else []
+            )
+            if len(matches) != 1:
+                raise APIError(404, f"No commit found for SHA: {ref}")
+            start = by_sha[matches[0]]
+
+        key = (full_name, start["sha"])
+        if key not in self._ancestors:
+            reachable, pending = set(), [start["sha"]]
+            while pending:
+                sha = pending.pop()
+                if sha in reachable or sha not in by_sha:
+                    continue
+                reachable.add(sha)
+                pending.extend(parent["sha"] for parent in by_sha[sha]["parents"])
+            self._ancestors[key] = [
+                item
+                for item in self.dataset.commits[full_name]
+                if item["sha"] in reachable
+            ]
+        return self._ancestors[key]
+
+
+def _pagination(query: dict) -> Tuple[int, int]:
+    def number(name: str, default: int) -> int:
+        try:
+            return max(1, int(query.get(name, default)))
+        except ValueError:
+            return default
+
+    return min(number("per_page", DEFAULT_PER_PAGE), MAX_PER_PAGE), number("page", 1)
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "LocalGitHubAPI"
+
+    def log_message(self, format, *args):
+        pass
+
+    @property
+    def api(self) -> LocalGitHubAPI:
+        return self.server.api
+
+    def do_GET(self):
+        self._handle("GET")
+
+    def do_PATCH(self):
+        self._handle("PATCH")
+
+    def _handle(self, method: str):
+        body = None
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            body = self.rfile.read(length)
+
+        parts = urlsplit(self.path)
+        query = dict(parse_qsl(parts.query, keep_blank_values=True))
+        segments = [segment for segment in parts.path.split("/") if segment]
+        extra_headers = {}
+
+        try:
+            viewer, identity = self._authenticate()
+            limit, remaining, reset = self.api.consume_quota(identity)
+            extra_headers.update(
+                {
+                    "X-RateLimit-Limit": str(limit),
+                    "X-RateLimit-Remaining": str(max(remaining, 0)),
+                    "X-RateLimit-Reset": str(reset),
+                    "X-RateLimit-Used": str(limit - max(remaining, 0)),
+                    "X-RateLimit-Resource": "core",
+                }
+            )
+            if remaining < 0:
+                raise APIError(403, "API rate limit exceeded.")
+            status_code, payload = self._route(method, segments, query, viewer, body)
+        except APIError as error:
+            payload = json.dumps(
+                {
+                    "message": error.message,
+                    "documentation_url": DOCUMENTATION_URL,
+                    "status": str(error.status_code),
+                }
+            ).encode()
+            self._send(error.status_code, payload, extra_headers)
+            return
+
+        if isinstance(payload, tuple):
+            payload, link = payload
+            if link:
+                extra_headers["Link"] = link
+        self._send(status_code, payload, extra_headers, etag=True)
+
+    def _authenticate(self) -> Tuple[Optional[dict], str]:
+        authorization = self.headers.get("Authorization")
+        if not authorization:
+            return None, f"ip:{self.client_address[0]}"
+        token = authorization.split(" ", 1)[-1].strip()
+        viewer = self.api.dataset.user_for_token(token)
+        if viewer is None:
+            raise APIError(401, ErrorMessages.INVALID_CREDENTIALS)
+        return viewer, f"token:{hashlib.sha256(token.encode()).hexdigest()}"
+
+    def _route(self, method: str, segments: List[str], query: dict, viewer, body):
+        api = self.api
+        if segments == ["user"]:
+            if viewer is None:
+                raise APIError(401, ErrorMessages.MISSING_TOKEN_ERROR)
+            if method == "PATCH":
+                try:
+                    data = json.loads(body or b"null")
+                except ValueError:
+                    raise APIError(400, "Problems parsing JSON")
+                return 200, self._json(api.update_user(viewer, data))
+            return 200, self._json(api.get_viewer(viewer))
+        if method != "GET":
+            raise APIError(404, ErrorMessages.NOT_FOUND)
+
+        if len(segments) == 2 and segments[0] == "users":
+            return 200, self._json(api.get_user(viewer, segments[1]))
+        if segments == ["user", "repos"]:
+            if viewer is None:
+                raise APIError(401, ErrorMessages.MISSING_TOKEN_ERROR)
+            repositories = api.list_logged_user_repositories(viewer, query)
+            return 200, self._page(
+                repositories, query, lambda repo: api.encode_repository(repo, viewer)
+            )
+        if len(segments) == 3 and segments[0] == "users" and segments[2] == "repos":
+            repositories = api.list_user_repositories(segments[1], query)
+            return 200, self._page(
+                repositories, query, lambda repo: api.encode_repository(repo, viewer)
+            )
+        if len(segments) == 4 and segments[0] == "repos" and segments[3] == "commits":
+            commits = api.list_commits(viewer, segments[1], segments[2], query)
+            return 200, self._page(
+                commits,
+                query,
+                lambda item: api.encode_item(("commit", item["sha"]), item),
+            )
+        raise APIError(404, ErrorMessages.NOT_FOUND)
+
+    @staticmethod
+    def _json(data: dict) -> bytes:
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode()
+
+    def _page(self, items: List[dict], query: dict, encode) -> Tuple[bytes, str]:
+        per_page, page = _pagination(query)
+        start = (page - 1) * per_page
+        payload = (
+            b"["
+            + b",".join(encode(item) for item in items[start : start + per_page])
+            + b"]"
+        )
+        return payload, self._link_header(
+            query, page, max(1, -(-len(items) // per_page))
+        )
+
+    def _link_header(self, query: dict, page: int, last_page: int) -> str:
+        base = f"http://{self.headers.get('Host')}{urlsplit(self.path).path}"
+
+        def link(number: int, rel: str) -> str:
+            return f'<{base}?{urlencode(dict(query, page=number))}>; rel="{rel}"'
+
+        links = []
+        if page > 1:
+            links.append(link(min(page - 1, last_page), "prev"))
+        if page < last_page:
+            links.append(link(page + 1, "next"))
+            links.append(link(last_page, "last"))
+        if page > 1:
+            links.append(link(1, "first"))
+        return ", ".join(links)
+
+    def _send(
+        self, status_code: int, payload: bytes, headers: dict, etag: bool = False
+    ):
+        headers = dict(headers, **{"Content-Type": "application/json; charset=utf-8"})
+        if etag:
+            headers["ETag"] = f'W/"{hashlib.md5(payload).hexdigest()}"'
+            if self.headers.get("If-None-Match") == headers["ETag"]:
+                status_code, payload = 304, b""
+        self.send_response(status_code)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Serve the local stand-in of the GitHub API"
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--rate-limit", type=int, default=DEFAULT_RATE_LIMIT)
+    args = parser.parse_args()
+
+    api = LocalGitHubAPI(host=args.host, port=args.port, rate_limit=args.rate_limit)
+    print(f"Serving the GitHub API stand-in on {api.url}")
+    api.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
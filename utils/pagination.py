@@ -0,0 +1,166 @@
+from collections import deque
+from concurrent.futures import Executor
+from typing import Iterator, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+
+from utils.http_client import DEFAULT_PREFETCH_WORKERS, GitHubClient
+
+MAX_PER_PAGE = 100
+
+
+def _page_number(url: str) -> Optional[int]:
+    """
+    Returns the value of the page query parameter of a URL, or None if it has none.
+    """
+    page = dict(parse_qsl(urlsplit(url).query)).get("page")
+    return int(page) if page and page.isdigit() else None
+
+
+def _with_page(url: str, page: int) -> str:
+    """
+    Returns the URL with its page query parameter replaced by the given page number.
+    """
+    parts = urlsplit(url)
+    query = dict(parse_qsl(parts.query))
+    query["page"] = page
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+def iter_pages(
+    client: GitHubClient,
+    url: str,
+    params: dict = None,
+    headers: dict = None,
+    max_workers: int = DEFAULT_PREFETCH_WORKERS,
+) -> Iterator[requests.Response]:
+    """
+    Yields every page of a paginated endpoint, following the Link header of the responses.
+
+    The first page is always fetched on its own. If its Link header contains a rel="last" link, the
+    remaining pages are fetched concurrently on the prefetch thread pool of the client, at most max_workers
+    pages ahead of the consumer. Otherwise the rel="next" links are followed with the next page requested
+    while the current one is being consumed. Pages are yielded in page order in both cases.
+
+    Parameters:
+    - client (GitHubClient): HTTP client to send the requests with.
+    - url (str): URL of the first page.
+    - params (dict, optional): Query parameters of the first page. Later pages use the query of the Link header.
+    - headers (dict, optional): Request headers sent with every page.
+    - max_workers (int): Maximum number of pages requested ahead of the consumer, sent by at most
+      client.prefetch_workers threads. Use 1 to fetch pages serially. Default is 4.
+
+    Returns:
+    - Iterator of Response objects, one per page, in page order.
+    - Raises an exception: requests.HTTPError if any page does not return a successful status code.
+    """
+    response = client.get(url, params=params, headers=headers)
+    response.raise_for_status()
+
+    if max_workers <= 1:
+        yield from _iter_pages_serially(client, response, headers)
+        return
+
+    last_url = response.links.get("last", {}).get("url")
+    first_page = _page_number(response.url) or 1
+    last_page = _page_number(last_url) if last_url else None
+
+    if last_page is not None:
+        yield response
+        page_urls = (
+            _with_page(last_url, page) for page in range(first_page + 1, last_page + 1)
+        )
+        yield from _iter_prefetched(
+            client, client.executor, page_urls, headers, max_workers
+        )
+    else:
+        yield from _iter_pipelined(client, client.executor, response, headers)
+
+
+def _iter_pages_serially(
+    client: GitHubClient, response: requests.Response, headers: dict
+) -> Iterator[requests.Response]:
+    """
+    Yields the given page and then follows the rel="next" links one request at a time.
+    """
+    while True:
+        yield response
+
+        next_url = response.links.get("next", {}).get("url")
+        if not next_url:
+            return
+        response = client.get(next_url, headers=headers)
+        response.raise_for_status()
+
+
+def _iter_prefetched(
+    client: GitHubClient,
+    executor: Executor,
+    page_urls: Iterator[str],
+    headers: dict,
+    window: int,
+) -> Iterator[requests.Response]:
+    """
+    Fetches the known page URLs concurrently, keeping at most `window` requests in flight, and yields them in order.
+    Requests that have not started yet are cancelled if the consumer stops early.
+    """
+    pending = deque()
+    try:
+        for page_url in page_urls:
+            pending.append(executor.submit(client.get, page_url, headers=headers))
+            if len(pending) < window:
+                continue
+            response = pending.popleft().result()
+            response.raise_for_status()
+            yield response
+
+        while pending:
+            response = pending.popleft().result()
+            response.raise_for_status()
+            yield response
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def _iter_pipelined(
+    client: GitHubClient,
+    executor: Executor,
+    response: requests.Response,
+    headers: dict,
+) -> Iterator[requests.Response]:
+    """
+    Follows the rel="next" links, requesting the next page before yielding the current one.
+    """
+    while True:
+        next_url = response.links.get("next", {}).get("url")
+        future = (
+            executor.submit(client.get, next_url, headers=headers) if next_url else None
+        )
+        try:
+            yield response
+        except GeneratorExit:
+            # The consumer stopped early: do not send the next request if it has not started yet
+            if future is not None:
+                future.cancel()
+            raise
+
+        if future is None:
+            return
+        response = future.result()
+        response.raise_for_status()
+
+
+def iter_items(pages: Iterator[requests.Response]) -> Iterator[dict]:
+    """
+    Yields the items of every page one at a time, so only a few pages are held in memory.
+
+    Parameters:
+    - pages (Iterator[Response]): Pages of a list endpoint, as returned by iter_pages.
+
+    Returns:
+    - Iterator of the decoded items of every page, in order.
+    """
+    for page in pages:
+        yield from page.json()
@@ -0,0 +1,231 @@
+import hashlib
+import threading
+import time
+from dataclasses import dataclass
+from datetime import timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+MUTATING_METHODS = {"POST", "PATCH", "PUT", "DELETE"}
+
+# GitHub asks to wait at least one second between mutating requests to avoid secondary rate limits
+DEFAULT_MUTATING_INTERVAL = 1.0
+DEFAULT_LOW_WATER_MARK = 100
+
+
+def token_identity(headers: dict = None) -> str:
+    """
+    Returns a stable, non-reversible identity of the token sent in the Authorization header ('' if anonymous).
+    """
+    authorization = (headers or {}).get("Authorization", "")
+    if not authorization:
+        return ""
+    return hashlib.sha256(authorization.encode()).hexdigest()[:16]
+
+
+def retry_after_seconds(value: Optional[str], now: float = None) -> Optional[float]:
+    """
+    Parses a Retry-After header, given either as delay seconds ('120') or as an HTTP date
+    ('Wed, 21 Oct 2015 07:28:00 GMT'), into the seconds to wait from now.
+
+    Parameters:
+    - value (str, optional): Value of the Retry-After header.
+    - now (float, optional): Current epoch time in seconds, to measure dates from. Default is time.time().
+
+    Returns:
+    - float: Seconds to wait (0 for a date in the past), or None if the header is missing or malformed.
+    """
+    if value is None:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, retry_at.timestamp() - (time.time() if now is None else now))
+
+
+def resource_for(url: str) -> str:
+    """
+    Returns the GitHub rate limit resource ('core', 'search' or 'graphql') a request URL counts against.
+    """
+    path = urlsplit(url).path
+    if path.startswith("/search/"):
+        return "search"
+    if path.startswith("/graphql"):
+        return "graphql"
+    return "core"
+
+
+@dataclass
+class Quota:
+    limit: Optional[int] = None
+    remaining: Optional[int] = None
+    reset: Optional[float] = None  # epoch seconds
+    reserved: int = 0  # requests scheduled since the headers were received
+    not_before: float = (
+        0.0  # set when the quota ran out, to the time the next window starts
+    )
+
+
+class TokenBucket:
+    """
+    Token bucket that refills at `rate` tokens per second up to `capacity`. reserve() takes a token and
+    returns how long the caller has to wait for it, so concurrent callers are spaced evenly.
+    """
+
+    def __init__(self, rate: float, capacity: float, clock: Callable[[], float]):
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._tokens = capacity
+        self._updated = clock()
+
+    def reserve(self, rate: float = None, capacity: float = None) -> float:
+        rate = rate or self.rate
+        capacity = min(capacity or self.capacity, self.capacity)
+        now = self._clock()
+        self._tokens = min(capacity, self._tokens + (now - self._updated) * rate)
+        self._updated = now
+        self._tokens -= 1
+        return 0.0 if self._tokens >= 0 else -self._tokens / rate
+
+
+class RateLimitScheduler:
+    """
+    Paces requests according to the GitHub rate limit headers.
+
+    For every token and resource the scheduler tracks X-RateLimit-Limit, X-RateLimit-Remaining and
+    X-RateLimit-Reset from the responses, and before every request it computes how long to wait:
+    - until the reset time, if the quota of the token is exhausted;
+    - until the Retry-After delay of a secondary rate limit (403/429) has elapsed;
+    - for a token bucket slot. The bucket refills at requests_per_second (unlimited by default), and once
+      fewer than low_water_mark requests remain it slows down to spread the rest evenly until the reset;
+    - at least mutating_interval seconds between mutating requests (PATCH, POST, ...) of the same token.
+
+    The scheduler is thread-safe and never sleeps itself: reserve() returns the delay, and wait() sleeps it.
+
+    Parameters:
+    - requests_per_second (float, optional): Maximum sustained request rate per token. Default is None (unlimited).
+    - burst (int): Number of requests allowed in a burst on top of the sustained rate. Default is 10.
+    - mutating_interval (float): Minimum seconds between mutating requests of a token. Default is 1.0.
+    - low_water_mark (int): Remaining quota below which requests are spread until the reset. Default is 100.
+    - clock (Callable): Returns the current epoch time in seconds. Default is time.time.
+    - sleep (Callable): Sleeps for the given seconds. Default is time.sleep.
+    """
+
+    def __init__(
+        self,
+        requests_per_second: float = None,
+        burst: int = 10,
+        mutating_interval: float = DEFAULT_MUTATING_INTERVAL,
+        low_water_mark: int = DEFAULT_LOW_WATER_MARK,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+        self.mutating_interval = mutating_interval
+        self.low_water_mark = low_water_mark
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._quotas: Dict[Tuple[str, str], Quota] = {}
+        self._buckets: Dict[Tuple[str, str], TokenBucket] = {}
+        self._blocked_until: Dict[str, float] = {}
+        self._next_mutation: Dict[str, float] = {}
+
+    def quota(self, headers: dict = None, resource: str = "core") -> Quota:
+        """
+        Returns the last known quota of the token in the given request headers.
+        """
+        with self._lock:
+            return self._quotas.get((token_identity(headers), resource), Quota())
+
+    def reserve(self, method: str, url: str, headers: dict = None) -> float:
+        """
+        Reserves a slot for a request and returns how many seconds the caller must wait before sending it.
+        """
+        identity = token_identity(headers)
+        key = (identity, resource_for(url))
+
+        with self._lock:
+            now = self._clock()
+            start = max(now, self._blocked_until.get(identity, 0.0))
+
+            quota = self._quotas.get(key)
+            rate = self.requests_per_second
+            burst = self.burst
+            if quota is not None and quota.remaining is not None and quota.reset:
+                start = max(start, quota.not_before)
+                if quota.remaining - quota.reserved <= 0 and quota.reset > start:
+                    # Quota exhausted: nothing can be sent before the window resets
+                    start = quota.not_before = quota.reset
+                    quota.remaining, quota.reserved = quota.limit or 1, 0
+                elif quota.remaining < self.low_water_mark and quota.reset > now:
+                    # Spread the remaining requests evenly until the reset
+                    spread_rate = quota.remaining / (quota.reset - now)
+                    rate = min(rate, spread_rate) if rate else spread_rate
+                    burst = 1
+                quota.reserved += 1
+
+            if rate:
+                bucket = self._buckets.get(key)
+                if bucket is None:
+                    bucket = TokenBucket(rate, self.burst, self._clock)
+                    self._buckets[key] = bucket
+                start = max(start, now + bucket.reserve(rate, burst))
+
+            if method.upper() in MUTATING_METHODS:
+                start = max(start, self._next_mutation.get(identity, 0.0))
+                self._next_mutation[identity] = start + self.mutating_interval
+
+            return max(0.0, start - now)
+
+    def wait(self, method: str, url: str, headers: dict = None):
+        """
+        Blocks the calling thread until the request may be sent.
+        """
+        delay = self.reserve(method, url, headers)
+        if delay > 0:
+            self._sleep(delay)
+
+    def update(self, url: str, headers: dict, status_code: int, response_headers):
+        """
+        Records the rate limit headers of a response and any Retry-After delay it asks for.
+
+        Parameters:
+        - url (str): URL of the request.
+        - headers (dict): Headers of the request, used to identify the token.
+        - status_code (int): Status code of the response.
+        - response_headers: Headers of the response.
+        """
+        identity = token_identity(headers)
+        resource = response_headers.get("X-RateLimit-Resource") or resource_for(url)
+
+        with self._lock:
+            now = self._clock()
+            remaining = response_headers.get("X-RateLimit-Remaining")
+            if remaining is not None:
+                limit = response_headers.get("X-RateLimit-Limit")
+                reset = response_headers.get("X-RateLimit-Reset")
+                self._quotas[(identity, resource)] = Quota(
+                    limit=int(limit) if limit else None,
+                    remaining=int(remaining),
+                    reset=float(reset) if reset else None,
+                )
+
+            if status_code in (403, 429):
+                retry_after = retry_after_seconds(
+                    response_headers.get("Retry-After"), now
+                )
+                if retry_after is not None:
+                    blocked_until = now + retry_after
+                    self._blocked_until[identity] = max(
+                        self._blocked_until.get(identity, 0.0), blocked_until
+                    )
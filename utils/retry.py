@@ -0,0 +1,228 @@
+import asyncio
+import logging
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, List, Optional, Tuple, Type
+
+from utils.rate_limit import retry_after_seconds
+
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+RETRY_STATUSES = {429, 502, 503, 504}
+
+
+@dataclass
+class Attempt:
+    number: int
+    elapsed: float  # seconds spent sending the request and receiving the response
+    status_code: Optional[int] = None
+    error: Optional[str] = None
+    delay: float = 0.0  # seconds waited before the next attempt
+
+
+@dataclass
+class RetryState:
+    attempts: List[Attempt] = field(default_factory=list)
+    waited: float = 0.0
+
+
+class RetryPolicy:
+    """
+    Retries transient failures with exponential backoff and full jitter.
+
+    A request is retried when it fails with a connection error or timeout, when it returns one of the
+    retry statuses (429, 502, 503, 504 by default), or when it returns a 403 caused by a rate limit (with
+    Retry-After or no remaining quota). The n-th retry waits a random time between 0 and
+    min(max_delay, base_delay * 2 ** (n - 1)) seconds, or the Retry-After delay if it is longer.
+
+    Only idempotent methods (GET, HEAD, OPTIONS, PUT, DELETE) are retried unless the caller opts in, as
+    retrying a PATCH or POST whose response was lost could apply it twice.
+
+    Every call gets at most max_attempts attempts and retry_budget seconds of waiting in total. The timing
+    of every attempt is recorded in the `attempts` attribute of the returned response (or raised exception).
+
+    Parameters:
+    - max_attempts (int): Maximum number of attempts per call, including the first one. Default is 4.
+    - base_delay (float): Backoff of the first retry in seconds, before jitter. Default is 0.5.
+    - max_delay (float): Maximum backoff of a single retry in seconds, before jitter. Default is 30.
+    - retry_budget (float): Maximum seconds spent waiting between attempts of one call. Default is 60.
+    - statuses (set): Status codes that are retried. Default is {429, 502, 503, 504}.
+    - retry_exceptions (tuple, optional): Exception types that are retried. Default is the connection and
+      timeout errors of the HTTP library of the client.
+    - rng (random.Random, optional): Random generator for the jitter, e.g. seeded in tests.
+    - sleep (Callable): Sleeps for the given seconds. Default is time.sleep.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 4,
+        base_delay: float = 0.5,
+        max_delay: float = 30.0,
+        retry_budget: float = 60.0,
+        statuses: set = None,
+        retry_exceptions: Tuple[Type[BaseException], ...] = None,
+        rng: random.Random = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_budget = retry_budget
+        self.statuses = RETRY_STATUSES if statuses is None else statuses
+        self.retry_exceptions = retry_exceptions
+        self._rng = rng or random.Random()
+        self._sleep = sleep
+
+    def is_retryable_method(
+        self, method: str, retry_non_idempotent: bool = False
+    ) -> bool:
+        return retry_non_idempotent or method.upper() in IDEMPOTENT_METHODS
+
+    def is_retryable_response(self, status_code: int, headers) -> bool:
+        if status_code in self.statuses:
+            return True
+        # A 403 is only transient when it comes from a primary or secondary rate limit
+        return status_code == 403 and (
+            "Retry-After" in headers or headers.get("X-RateLimit-Remaining") == "0"
+        )
+
+    def backoff(self, retry_number: int) -> float:
+        """
+        Returns a full-jitter backoff for the n-th retry (1-based).
+        """
+        ceiling = min(self.max_delay, self.base_delay * 2 ** (retry_number - 1))
+        return self._rng.uniform(0, ceiling)
+
+    def _next_delay(self, state: RetryState, headers=None) -> Optional[float]:
+        """
+        Returns how long to wait before the next attempt, or None if the call must not be retried again.
+        """
+        if len(state.attempts) >= self.max_attempts:
+            return None
+
+        delay = self.backoff(len(state.attempts))
+        retry_after = retry_after_seconds((headers or {}).get("Retry-After"))
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+
+        if state.waited + delay > self.retry_budget:
+            return None
+        state.waited += delay
+        state.attempts[-1].delay = delay
+        return delay
+
+    def _record_attempt(
+        self,
+        state: RetryState,
+        retryable: bool,
+        started: float,
+        response=None,
+        error=None,
+    ) -> Optional[float]:
+        """
+        Records the outcome of an attempt and returns the delay before the next one, or None to stop retrying.
+        """
+        number, elapsed = len(state.attempts) + 1, time.perf_counter() - started
+        if error is not None:
+            state.attempts.append(Attempt(number, elapsed, error=repr(error)))
+            return self._next_delay(state) if retryable else None
+
+        state.attempts.append(
+            Attempt(number, elapsed, status_code=response.status_code)
+        )
+        if retryable and self.is_retryable_response(
+            response.status_code, response.headers
+        ):
+            return self._next_delay(state, response.headers)
+        return None
+
+    def call(
+        self,
+        method: str,
+        url: str,
+        send: Callable,
+        retry_non_idempotent: bool = False,
+        transport_errors: Tuple[Type[BaseException], ...] = (),
+    ):
+        """
+        Sends a request with send() and retries it according to the policy.
+
+        Parameters:
+        - method (str): HTTP method of the request.
+        - url (str): URL of the request, used for logging.
+        - send (Callable): Sends the request once and returns the response.
+        - retry_non_idempotent (bool): Whether to retry methods that are not idempotent (e.g. PATCH). Default is False.
+        - transport_errors (tuple): Exception types of the HTTP library that are retried when the policy
+          was created without retry_exceptions.
+
+        Returns:
+        - The response of the last attempt, with the list of Attempt in its `attempts` attribute.
+        """
+        retryable = self.is_retryable_method(method, retry_non_idempotent)
+        retry_exceptions = self.retry_exceptions or transport_errors
+        state = RetryState()
+
+        while True:
+            started = time.perf_counter()
+            try:
+                response = send()
+            except retry_exceptions as error:
+                delay = self._record_attempt(state, retryable, started, error=error)
+                if delay is None:
+                    error.attempts = state.attempts
+                    raise
+                reason = repr(error)
+            else:
+                delay = self._record_attempt(
+                    state, retryable, started, response=response
+                )
+                if delay is None:
+                    response.attempts = state.attempts
+                    return response
+                reason = response.status_code
+
+            self._log_retry(method, url, reason, delay, state)
+            self._sleep(delay)
+
+    async def call_async(
+        self,
+        method: str,
+        url: str,
+        send: Callable[[], Awaitable],
+        retry_non_idempotent: bool = False,
+        transport_errors: Tuple[Type[BaseException], ...] = (),
+    ):
+        """
+        Async version of call(), where send() returns an awaitable and the backoff is awaited.
+        """
+        retryable = self.is_retryable_method(method, retry_non_idempotent)
+        retry_exceptions = self.retry_exceptions or transport_errors
+        state = RetryState()
+
+        while True:
+            started = time.perf_counter()
+            try:
+                response = await send()
+            except retry_exceptions as error:
+                delay = self._record_attempt(state, retryable, started, error=error)
+                if delay is None:
+                    error.attempts = state.attempts
+                    raise
+                reason = repr(error)
+            else:
+                delay = self._record_attempt(
+                    state, retryable, started, response=response
+                )
+                if delay is None:
+                    response.attempts = state.attempts
+                    return response
+                reason = response.status_code
+
+            self._log_retry(method, url, reason, delay, state)
+            await asyncio.sleep(delay)
+
+    def _log_retry(self, method, url, reason, delay, state: RetryState):
+        logging.info(
+            f"Retrying {method} {url} after {reason} in {delay:.2f}s "
+            f"(attempt {len(state.attempts) + 1}/{self.max_attempts})"
+        )
@@ -0,0 +1,383 @@
+import hashlib
+import importlib.util
+import json
+import os
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+
+from jsonschema import validators
+from referencing import Registry
+from referencing.exceptions import Unresolvable
+
+from schemas.definitions import schema_registry
+
+# Bump when the generated code changes, so stale files in the cache are not reused
+GENERATOR_VERSION = "2"
+
+DEFAULT_CACHE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".validator_cache"
+)
+
+# Keywords that never affect validation (format is only asserted when format checking is enabled)
+_ANNOTATIONS = {
+    "title",
+    "description",
+    "examples",
+    "format",
+    "default",
+    "deprecated",
+    "readOnly",
+    "writeOnly",
+    "$comment",
+    "$schema",
+    "$id",
+    "$defs",
+}
+_KEYWORDS = {
+    "type",
+    "enum",
+    "properties",
+    "required",
+    "additionalProperties",
+    "items",
+    "oneOf",
+    "anyOf",
+    "allOf",
+    "$ref",
+} | _ANNOTATIONS
+
+_TYPE_CHECKS = {
+    "string": "isinstance({value}, str)",
+    "integer": "_is_integer({value})",
+    "number": "_is_number({value})",
+    "boolean": "isinstance({value}, bool)",
+    "null": "{value} is None",
+    "object": "isinstance({value}, dict)",
+    "array": "isinstance({value}, list)",
+}
+
+# Draft 6 and later accept floats with an integral value as integers, which the generated code relies on
+_SUPPORTED_DRAFTS = (
+    validators.Draft6Validator,
+    validators.Draft7Validator,
+    validators.Draft201909Validator,
+    validators.Draft202012Validator,
+)
+
+_PRELUDE = """\
+import numbers
+
+
+def _is_integer(value):
+    if isinstance(value, bool):
+        return False
+    return isinstance(value, int) or (isinstance(value, float) and value.is_integer())
+
+
+def _is_number(value):
+    return isinstance(value, numbers.Number) and not isinstance(value, bool)
+
+
+_MISSING = object()
+"""
+
+
+class UnsupportedSchema(ValueError):
+    """
+    Raised when a schema uses a keyword or form the code generator does not compile.
+    """
+
+
+def schema_hash(schema: dict, registry: Registry = None) -> str:
+    """
+    Returns the SHA-256 of the canonical JSON of a schema, the resources of the registry its $refs are
+    resolved against, and the generator version.
+    """
+    registry = schema_registry() if registry is None else registry
+    canonical = json.dumps(
+        [schema, {uri: registry[uri].contents for uri in registry}],
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(f"{GENERATOR_VERSION}:{canonical}".encode()).hexdigest()
+
+
+class _CodeGenerator:
+    def __init__(self, resolver):
+        self.functions: List[str] = []
+        self.constants: List[str] = []
+        self._names: Dict[str, str] = {}
+        self._resolver = resolver
+
+    def frozenset_constant(self, prefix: str, values) -> str:
+        name = f"_{prefix}_{len(self.constants)}"
+        self.constants.append(f"{name} = frozenset({sorted(values)!r})")
+        return name
+
+    def check(self, schema, value: str) -> str:
+        """
+        Returns a boolean Python expression checking the variable named value against a subschema.
+        """
+        if schema is True:
+            return "True"
+        if schema is False:
+            return "False"
+        if not isinstance(schema, dict):
+            raise UnsupportedSchema(
+                f"Schemas must be objects or booleans, got {schema!r}"
+            )
+        unknown = set(schema) - _KEYWORDS
+        if unknown:
+            raise UnsupportedSchema(f"Unsupported keywords {sorted(unknown)}")
+        if "$ref" in schema:
+            return self._reference(schema, value)
+
+        if set(schema) - _ANNOTATIONS <= {"type", "enum"}:
+            conditions = self._leaf_conditions(schema, value)
+            return " and ".join(conditions) if conditions else "True"
+        return f"{self.function(schema)}({value})"
+
+    def _reference(self, schema: dict, value: str) -> str:
+        # A referenced subschema is generated once, like any other repeated subschema
+        if set(schema) - _ANNOTATIONS != {"$ref"}:
+            raise UnsupportedSchema("$ref next to other keywords is not supported")
+        try:
+            resolved = self._resolver.lookup(schema["$ref"])
+        except Unresolvable as error:
+            raise UnsupportedSchema(f"Cannot resolve {schema['$ref']!r}") from error
+        previous, self._resolver = self._resolver, resolved.resolver
+        try:
+            return self.check(resolved.contents, value)
+        finally:
+            self._resolver = previous
+
+    def _leaf_conditions(self, schema: dict, value: str) -> List[str]:
+        conditions = []
+        if "type" in schema:
+            types = (
+                schema["type"] if isinstance(schema["type"], list) else [schema["type"]]
+            )
+            if not types or any(name not in _TYPE_CHECKS for name in types):
+                raise UnsupportedSchema(f"Unsupported type {schema['type']!r}")
+            if types == ["null", "string"] or types == ["string", "null"]:
+                conditions.append(f"({value} is None or isinstance({value}, str))")
+            else:
+                checks = [_TYPE_CHECKS[name].format(value=value) for name in types]
+                conditions.append(
+                    checks[0] if len(checks) == 1 else f"({' or '.join(checks)})"
+                )
+        if "enum" in schema:
+            if not all(isinstance(option, str) for option in schema["enum"]):
+                raise UnsupportedSchema("Only enums of strings are supported")
+            options = self.frozenset_constant("ENUM", schema["enum"])
+            conditions.append(f"(isinstance({value}, str) and {value} in {options})")
+        return conditions
+
+    def function(self, schema: dict) -> str:
+        """
+        Generates (once per distinct subschema) a function validating a value against it, and returns its name.
+        """
+        key = json.dumps(schema, sort_keys=True)
+        if key in self._names:
+            return self._names[key]
+        name = self._names[key] = f"_validate_{len(self._names)}"
+
+        lines = [f"def {name}(data):"]
+        for condition in self._leaf_conditions(schema, "data"):
+            lines.append(f"    if not {condition}:")
+            lines.append("        return False")
+
+        object_lines = self._object_lines(schema)
+        if object_lines:
+            if schema.get("type") == "object":
+                lines.extend(f"    {line}" for line in object_lines)
+            else:
+                lines.append("    if isinstance(data, dict):")
+                lines.extend(f"        {line}" for line in object_lines)
+
+        if "items" in schema:
+            if isinstance(schema["items"], list):
+                raise UnsupportedSchema(
+                    "Tuple validation with items arrays is not supported"
+                )
+            item_check = self.check(schema["items"], "item")
+            if item_check != "True":
+                indent = "    " if schema.get("type") == "array" else "        "
+                if indent != "    ":
+                    lines.append("    if isinstance(data, list):")
+                lines.append(f"{indent}for item in data:")
+                lines.append(f"{indent}    if not {item_check}:")
+                lines.append(f"{indent}        return False")
+
+        if "oneOf" in schema:
+            checks = [self.check(subschema, "data") for subschema in schema["oneOf"]]
+            lines.append(f"    if ({') + ('.join(checks)}) != 1:")
+            lines.append("        return False")
+        if "anyOf" in schema:
+            checks = [self.check(subschema, "data") for subschema in schema["anyOf"]]
+            lines.append(f"    if not (({') or ('.join(checks)})):")
+            lines.append("        return False")
+        if "allOf" in schema:
+            checks = [self.check(subschema, "data") for subschema in schema["allOf"]]
+            lines.append(f"    if not (({') and ('.join(checks)})):")
+            lines.append("        return False")
+
+        lines.append("    return True")
+        self.functions.append("\n".join(lines))
+        return name
+
+    def _object_lines(self, schema: dict) -> List[str]:
+        lines = []
+        if schema.get("required"):
+            if not all(isinstance(key, str) for key in schema["required"]):
+                raise UnsupportedSchema("required must be a list of strings")
+            required = self.frozenset_constant("REQUIRED", schema["required"])
+            lines.append(f"if not {required}.issubset(data):")
+            lines.append("    return False")
+
+        properties = schema.get("properties", {})
+        for key, subschema in properties.items():
+            check = self.check(subschema, "value")
+            if check == "True":
+                continue
+            lines.append(f"value = data.get({key!r}, _MISSING)")
+            lines.append(f"if value is not _MISSING and not {check}:")
+            lines.append("    return False")
+
+        additional = schema.get("additionalProperties", True)
+        if additional is not True:
+            keys = self.frozenset_constant("PROPERTIES", properties)
+            if additional is False:
+                lines.append(f"if not {keys}.issuperset(data):")
+                lines.append("    return False")
+            else:
+                check = self.check(additional, "value")
+                lines.append("for key, value in data.items():")
+                lines.append(f"    if key not in {keys} and not {check}:")
+                lines.append("        return False")
+        return lines
+
+
+def generate_source(schema: dict, registry: Registry = None) -> str:
+    """
+    Generates the source of a Python module whose is_valid(data) function returns whether data is valid
+    against the schema, with the same result as the jsonschema validator of the schema.
+
+    Parameters:
+    - schema (dict): A JSON Schema (draft 6 or later) using the keywords type, enum (of strings), properties,
+      required, additionalProperties, items, oneOf, anyOf, allOf and $ref (on its own), plus annotations.
+    - registry (Registry, optional): Resources $refs are resolved against. Default is the shared schema_registry().
+
+    Returns:
+    - str: The source of the module.
+    - Raises an exception: UnsupportedSchema if the schema uses anything else.
+    """
+    if validators.validator_for(schema) not in _SUPPORTED_DRAFTS:
+        raise UnsupportedSchema("Only draft 6 and later schemas are supported")
+    registry = schema_registry() if registry is None else registry
+    generator = _CodeGenerator(registry.resolver(base_uri=schema.get("$id", "")))
+    entry = generator.check(schema, "data")
+    return (
+        "\n\n\n".join(
+            [
+                f"# Generated by utils/schema_codegen.py (schema {schema_hash(schema, registry)}). Do not edit.",
+                _PRELUDE.rstrip(),
+                "\n".join(generator.constants),
+                *generator.functions,
+                f"def is_valid(data):\n    return {entry}",
+            ]
+        )
+        + "\n"
+    )
+
+
+def _load_module(path: str, digest: str):
+    spec = importlib.util.spec_from_file_location(
+        f"_schema_validator_{digest[:16]}", path
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def build_validator(
+    schema: dict, cache_dir: str = None, registry: Registry = None
+) -> Callable[[object], bool]:
+    """
+    Returns the generated is_valid function of a schema, from the disk cache when it was generated before.
+
+    The module is stored in cache_dir as <schema hash>.py, so it is generated once per schema version and
+    reused (together with its bytecode) by later processes.
+
+    Parameters:
+    - schema (dict): The JSON Schema.
+    - cache_dir (str, optional): Directory of the generated modules. Default is SCHEMA_VALIDATOR_CACHE,
+      or .validator_cache in the project root.
+    - registry (Registry, optional): Resources $refs are resolved against. Default is the shared schema_registry().
+
+    Returns:
+    - Callable: is_valid(data) -> bool.
+    - Raises an exception: UnsupportedSchema if the schema cannot be compiled.
+    """
+    cache_dir = cache_dir or os.getenv("SCHEMA_VALIDATOR_CACHE", DEFAULT_CACHE_DIR)
+    registry = schema_registry() if registry is None else registry
+    digest = schema_hash(schema, registry)
+    path = os.path.join(cache_dir, f"{digest}.py")
+    if not os.path.exists(path):
+        source = generate_source(schema, registry)
+        os.makedirs(cache_dir, exist_ok=True)
+        temporary_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temporary_path, "w", encoding="utf-8") as module_file:
+            module_file.write(source)
+        os.replace(temporary_path, path)
+    return _load_module(path, digest).is_valid
+
+
+# Generated validators by id of the schema, kept with the schema like the jsonschema validators
+_compiled: Dict[int, Tuple[dict, Optional[Callable[[object], bool]]]] = {}
+_compiled_lock = threading.Lock()
+
+
+def get_compiled_validator(schema: dict) -> Optional[Callable[[object], bool]]:
+    """
+    Returns the generated is_valid function of a schema, or None if the schema cannot be compiled.
+    The function is built (or loaded from the disk cache) the first time a schema is seen in the process,
+    resolving $refs against the shared schema_registry().
+    """
+    cached = _compiled.get(id(schema))
+    if cached is not None and cached[0] is schema:
+        return cached[1]
+
+    with _compiled_lock:
+        cached = _compiled.get(id(schema))
+        if cached is None or cached[0] is not schema:
+            try:
+                is_valid = build_validator(schema)
+            except (UnsupportedSchema, OSError):
+                is_valid = None
+            cached = _compiled[id(schema)] = (schema, is_valid)
+    return cached[1]
+
+
+def main():
+    """
+    Build step: generates the validators of the project schemas into the cache directory.
+    """
+    from schemas.commits_schema import list_commits_schema
+    from schemas.repos_schema import list_repositories_schema
+    from schemas.user_schema import negative_response_schema, user_profile_schema
+
+    schemas = {
+        "user_profile": user_profile_schema(),
+        "negative_response": negative_response_schema(),
+        "list_repositories": list_repositories_schema(),
+        "list_commits": list_commits_schema(),
+    }
+    cache_dir = os.getenv("SCHEMA_VALIDATOR_CACHE", DEFAULT_CACHE_DIR)
+    for name, schema in schemas.items():
+        build_validator(schema, cache_dir)
+        print(f"{name}: {os.path.join(cache_dir, schema_hash(schema) + '.py')}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,71 +1,628 @@
-from dataclasses import is_dataclass
-from typing import TypeVar, Dict, Any, Type
+import os
+import random
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import MISSING, InitVar, dataclass, is_dataclass
+from sys import intern
+from typing import (
+    TypeVar,
+    Dict,
+    Any,
+    Iterable,
+    Iterator,
+    Type,
+    Tuple,
+    List,
+    Optional,
+    Callable,
+    ClassVar,
+    Union,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
 
-from jsonschema import validate, ValidationError
+import allure
+from jsonschema.exceptions import best_match
+from jsonschema.protocols import Validator
+from jsonschema.validators import validator_for
 
+from models.user_model import UserProfile
+from schemas.definitions import schema_registry
+from utils.schema_codegen import get_compiled_validator
 
-def validate_json_schema(json_data, schema):
+# Compiled validators by (id of the schema, whether formats are checked). The schema is kept alongside its
+# validator, so its id cannot be reused by another object while the entry exists.
+_validators: Dict[Tuple[int, bool], Tuple[dict, Validator]] = {}
+_validators_lock = threading.Lock()
+
+# Arrays with at least this many items are validated in chunks, reporting every invalid item
+PARALLEL_VALIDATION_THRESHOLD = 10_000
+DEFAULT_CHUNK_SIZE = 2_000
+MAX_REPORTED_ERRORS = 20
+
+# Keywords an array schema may have besides type and items to be validated chunk by chunk
+_ARRAY_ANNOTATIONS = {
+    "title",
+    "description",
+    "examples",
+    "$schema",
+    "$id",
+    "$comment",
+    "$defs",
+}
+
+
+def get_validator(schema: dict, check_formats: bool = False) -> Validator:
+    """
+    Returns the validator of a schema, checking the schema against its meta-schema and compiling it only
+    the first time it is seen in the process. Schemas are treated as immutable once validated. $refs are
+    resolved against the shared schema_registry(), so the shared definitions are crawled only once.
+
+    Parameters:
+    - schema (dict): The JSON Schema to validate against.
+    - check_formats (bool): Whether to check 'format' keywords (e.g. uri) with the shared format checker
+      of the validator class. Default is False, like jsonschema.validate.
+
+    Returns:
+    - Validator: A jsonschema validator instance, shared by every caller.
+    - Raises an exception: jsonschema.SchemaError if the schema itself is invalid.
+    """
+    key = (id(schema), check_formats)
+    cached = _validators.get(key)
+    if cached is not None and cached[0] is schema:
+        return cached[1]
+
+    with _validators_lock:
+        cached = _validators.get(key)
+        if cached is None or cached[0] is not schema:
+            validator_class = validator_for(schema)
+            validator_class.check_schema(schema)
+            format_checker = validator_class.FORMAT_CHECKER if check_formats else None
+            cached = _validators[key] = (
+                schema,
+                validator_class(
+                    schema, registry=schema_registry(), format_checker=format_checker
+                ),
+            )
+    return cached[1]
+
+
+@dataclass(frozen=True)
+class SamplingPolicy:
+    """
+    Which items of a large array are validated: the first items, the last items and a random sample of
+    the rest, drawn with a fixed seed so a failure can be reproduced.
+    """
+
+    first: int = 10
+    last: int = 10
+    random: int = 50
+    seed: int = 0
+
+    @classmethod
+    def parse(cls, value: str) -> "SamplingPolicy":
+        """
+        Parses 'FIRST,LAST,RANDOM[,SEED]', e.g. '10,10,50' or '10,10,50,42'.
+        """
+        numbers = [int(number) for number in value.split(",")]
+        if len(numbers) not in (3, 4) or any(number < 0 for number in numbers):
+            raise ValueError(f"Expected FIRST,LAST,RANDOM[,SEED], got '{value}'")
+        return cls(*numbers)
+
+    @property
+    def size(self) -> int:
+        return self.first + self.last + self.random
+
+    def indexes(self, length: int) -> List[int]:
+        """
+        Returns the sorted indexes of the items to validate in an array of the given length.
+        """
+        if length <= self.size:
+            return list(range(length))
+        middle = range(self.first, length - self.last)
+        sampled = random.Random(self.seed).sample(middle, self.random)
+        return (
+            list(range(self.first))
+            + sorted(sampled)
+            + list(range(length - self.last, length))
+        )
+
+
+# Sampling policy applied when validate_json_schema is not given one (None validates every item)
+_sampling_policy: Optional[SamplingPolicy] = None
+
+
+def set_sampling_policy(policy: Optional[SamplingPolicy]) -> Optional[SamplingPolicy]:
+    """
+    Sets the sampling policy of validate_json_schema for the whole process and returns the previous one.
+    """
+    global _sampling_policy
+    previous, _sampling_policy = _sampling_policy, policy
+    return previous
+
+
+@contextmanager
+def sampling(policy: Optional[SamplingPolicy]):
+    """
+    Applies a sampling policy (or None for full validation) for the duration of the block.
+    """
+    previous = set_sampling_policy(policy)
+    try:
+        yield policy
+    finally:
+        set_sampling_policy(previous)
+
+
+def validate_json_schema(json_data, schema, check_formats=False, sample=None):
     """
     Validates the provided JSON data against a given JSON Schema.
 
     Parameters:
     - json_data (dict): The JSON data (typically a dictionary) to validate.
     - schema (dict): The JSON Schema that the data should adhere to.
+    - check_formats (bool): Whether to also check 'format' keywords. Default is False.
+    - sample (SamplingPolicy, optional): Validate only a sample of the items of an array. Default is the
+      policy set with set_sampling_policy / sampling, which is None (every item) unless a test opts in.
 
     Returns:
     - bool: Returns True if the JSON data is valid according to the schema.
     - Raises an exception: If validation fails, raises a custom AssertionError with a descriptive message.
+      Arrays of PARALLEL_VALIDATION_THRESHOLD items or more are validated by validate_json_array, and
+      sampled arrays by validate_json_sample, whose messages list every invalid item.
     """
-    try:
-        # Use the 'jsonschema' library's 'validate' function to validate the data
-        validate(instance=json_data, schema=schema)
-        return True  # Return True if validation is successful
-    except ValidationError as e:
-        # Catch any validation errors and raise a custom assertion error with the validation message
-        raise AssertionError(f"JSON Schema validation failed: {e.message}")
+    if isinstance(json_data, list) and _is_chunkable(schema):
+        policy = sample or _sampling_policy
+        if policy is not None and len(json_data) > policy.size:
+            return validate_json_sample(json_data, schema, policy, check_formats)
+        if len(json_data) >= PARALLEL_VALIDATION_THRESHOLD:
+            return validate_json_array(json_data, schema, check_formats=check_formats)
+
+    # Valid data is checked with the code generated for the schema, when it can be compiled
+    if not check_formats:
+        is_valid = get_compiled_validator(schema)
+        if is_valid is not None and is_valid(json_data):
+            return True
+
+    # Same error as jsonschema.validate reports, with the validator compiled once per schema
+    error = best_match(get_validator(schema, check_formats).iter_errors(json_data))
+    if error is not None:
+        # Raise a custom assertion error with the validation message
+        raise AssertionError(f"JSON Schema validation failed: {error.message}")
+    return True  # Return True if validation is successful
+
+
+@dataclass
+class ItemError:
+    index: Optional[
+        int
+    ]  # index of the invalid item in the array, None for errors of the array itself
+    json_path: str
+    message: str
+
+
+def _is_chunkable(schema) -> bool:
+    """
+    Returns whether a schema only constrains the items of an array, so every chunk can be validated alone.
+    """
+    return (
+        isinstance(schema, dict)
+        and schema.get("type") == "array"
+        and isinstance(schema.get("items"), dict)
+        and set(schema) - _ARRAY_ANNOTATIONS <= {"type", "items"}
+    )
+
+
+def _item_errors(schema, index: int, item, check_formats: bool) -> List[ItemError]:
+    """
+    Returns every validation error of one item of an array, validated as a one-item array of the schema.
+    """
+    errors = []
+    for error in get_validator(schema, check_formats).iter_errors([item]):
+        path = list(error.absolute_path)[1:]
+        json_path = f"$[{index}]" + "".join(
+            f"[{part}]" if isinstance(part, int) else f".{part}" for part in path
+        )
+        errors.append(ItemError(index, json_path, error.message))
+    return errors
+
+
+def _chunk_errors(
+    schema, start: int, chunk: list, check_formats: bool
+) -> List[ItemError]:
+    """
+    Returns every validation error of a chunk of an array, with item indexes relative to the whole array.
+    With a generated validator, only the items it rejects are validated again with jsonschema.
+    """
+    is_valid = None if check_formats else get_compiled_validator(schema)
+    if is_valid is None:
+        return [
+            error
+            for offset, item in enumerate(chunk)
+            for error in _item_errors(schema, start + offset, item, check_formats)
+        ]
+    if is_valid(chunk):
+        return []
+    return [
+        error
+        for offset, item in enumerate(chunk)
+        if not is_valid([item])
+        for error in _item_errors(schema, start + offset, item, check_formats)
+    ]
+
+
+# Schema of the process pool workers, sent once per worker instead of with every chunk
+_worker_schema = None
+_worker_check_formats = False
+
+
+def _init_worker(schema, check_formats: bool):
+    global _worker_schema, _worker_check_formats
+    _worker_schema, _worker_check_formats = schema, check_formats
+
+
+def _worker_chunk_errors(start: int, chunk: list) -> List[ItemError]:
+    return _chunk_errors(_worker_schema, start, chunk, _worker_check_formats)
+
+
+def validate_json_array(
+    items: list,
+    schema: dict,
+    workers: int = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    check_formats: bool = False,
+):
+    """
+    Validates a large JSON array chunk by chunk on a process pool, reporting every invalid item.
+
+    Valid arrays are first checked in this process with the generated validator of the schema, and when it
+    rejects some items only those are validated again with jsonschema, all of which is faster than sending
+    the items to other processes. When formats are checked or the schema cannot be compiled, every item goes
+    through jsonschema, so the array is split in chunks validated on a pool of processes, and the errors of
+    all the chunks are collected.
+
+    Parameters:
+    - items (list): The JSON array to validate.
+    - schema (dict): JSON Schema of the array, with type 'array' and an items schema (and no other constraints).
+    - workers (int, optional): Number of processes for jsonschema validation. Default is the number of CPUs;
+      1 validates in this process.
+    - chunk_size (int): Number of items sent to a process at a time. Default is 2000.
+    - check_formats (bool): Whether to also check 'format' keywords. Default is False.
+
+    Returns:
+    - bool: Returns True if every item is valid.
+    - Raises an exception: AssertionError listing the index, JSON path and message of every error (the
+      first MAX_REPORTED_ERRORS of them in the message, all of them in its `errors` attribute).
+    """
+    if not _is_chunkable(schema):
+        raise ValueError(
+            "Only schemas of type 'array' with an items schema can be validated in chunks"
+        )
+    is_valid = None if check_formats else get_compiled_validator(schema)
+    if is_valid is not None and is_valid(items):
+        return True
+
+    starts = range(0, len(items), chunk_size)
+    chunks = (items[start : start + chunk_size] for start in starts)
+    workers = workers or os.cpu_count() or 1
+    if is_valid is not None or workers <= 1 or len(starts) <= 1:
+        results = [
+            _chunk_errors(schema, start, chunk, check_formats)
+            for start, chunk in zip(starts, chunks)
+        ]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(starts)),
+            initializer=_init_worker,
+            initargs=(schema, check_formats),
+        ) as pool:
+            results = list(pool.map(_worker_chunk_errors, starts, chunks))
+
+    errors = [error for chunk_errors in results for error in chunk_errors]
+    if errors:
+        _raise_item_errors(errors, f"{len(items)} items")
+    return True
+
+
+def validate_json_sample(
+    items: list, schema: dict, policy: SamplingPolicy, check_formats: bool = False
+):
+    """
+    Validates a sample of the items of a JSON array: the first, the last and a seeded random sample of the
+    others, as chosen by the policy. The indexes of the validated items are attached to the Allure report.
+
+    Parameters:
+    - items (list): The JSON array to validate.
+    - schema (dict): JSON Schema of the array, with type 'array' and an items schema (and no other constraints).
+    - policy (SamplingPolicy): Which items to validate.
+    - check_formats (bool): Whether to also check 'format' keywords. Default is False.
+
+    Returns:
+    - bool: Returns True if every sampled item is valid.
+    - Raises an exception: AssertionError listing the index, JSON path and message of every error found.
+    """
+    if not _is_chunkable(schema):
+        raise ValueError(
+            "Only schemas of type 'array' with an items schema can be validated by sampling"
+        )
+    indexes = policy.indexes(len(items))
+    allure.attach(
+        f"Validated {len(indexes)} of {len(items)} items (first {policy.first}, last {policy.last}, "
+        f"{policy.random} random with seed {policy.seed}):\n{indexes}",
+        name="Validated Items",
+        attachment_type=allure.attachment_type.TEXT,
+    )
+
+    is_valid = None if check_formats else get_compiled_validator(schema)
+    if is_valid is not None and is_valid([items[index] for index in indexes]):
+        return True
+    errors = [
+        error
+        for index in indexes
+        if is_valid is None or not is_valid([items[index]])
+        for error in _item_errors(schema, index, items[index], check_formats)
+    ]
+    if errors:
+        _raise_item_errors(errors, f"{len(indexes)} sampled items")
+    return True
+
+
+def _raise_item_errors(errors: List[ItemError], checked: str):
+    invalid_items = len({error.index for error in errors})
+    lines = [
+        f"{error.json_path}: {error.message}" for error in errors[:MAX_REPORTED_ERRORS]
+    ]
+    if len(errors) > MAX_REPORTED_ERRORS:
+        lines.append(f"... and {len(errors) - MAX_REPORTED_ERRORS} more errors")
+    assertion = AssertionError(
+        f"JSON Schema validation failed for {invalid_items} of {checked}:\n"
+        + "\n".join(lines)
+    )
+    assertion.errors = errors
+    raise assertion
 
 
 T = TypeVar("T")
 
+# Conversion plans (converter functions) by dataclass type, built once per type and process
+_converters: Dict[type, Callable[[Any], Any]] = {}
+_converters_lock = threading.Lock()
+
+
+def _field_converter(field_type, building: Dict[type, Callable]) -> Optional[Callable]:
+    """
+    Returns the function converting a value of a field of the given type, or None if it is kept as is.
+    Dataclasses, List[dataclass] and Optional of either are converted; an empty object in an Optional
+    dataclass field (e.g. the author of a commit without a GitHub account) becomes None.
+    """
+    origin, args = get_origin(field_type), get_args(field_type)
+    if is_dataclass(field_type):
+        return _build_converter(field_type, building)
+
+    if origin is list and len(args) == 1:
+        convert_item = _field_converter(args[0], building)
+        if convert_item is None:
+            return None
+
+        def convert_list(value, identities):
+            if not isinstance(value, list):
+                return value
+            return [convert_item(item, identities) for item in value]
+
+        return convert_list
+
+    if origin is Union and len(args) == 2 and type(None) in args:
+        inner_type = args[0] if args[1] is type(None) else args[1]
+        convert_inner = _field_converter(inner_type, building)
+        if convert_inner is None:
+            return None
+        if is_dataclass(inner_type):
+            return lambda value, identities: (
+                None
+                if value is None or value == {}
+                else convert_inner(value, identities)
+            )
+        return lambda value, identities: (
+            None if value is None else convert_inner(value, identities)
+        )
+    return None
+
+
+def _build_converter(dataclass_type: type, building: Dict[type, Callable]) -> Callable:
+    converter = _converters.get(dataclass_type) or building.get(dataclass_type)
+    if converter is not None:
+        return converter
+
+    hints = get_type_hints(dataclass_type)
+    # The parameters of __init__: the fields with init=True and the InitVar pseudo-fields
+    parameters = [
+        field
+        for name, field in dataclass_type.__dataclass_fields__.items()
+        if field.init and get_origin(hints.get(name)) is not ClassVar
+    ]
+    names = frozenset(field.name for field in parameters)
+    required = frozenset(
+        field.name
+        for field in parameters
+        if field.default is MISSING and field.default_factory is MISSING
+    )
+
+    # The converter calls the constructor with one keyword argument per parameter, spelled out in generated
+    # code: its keyword names are interned constants that __init__ matches by identity, while the keys of
+    # decoded JSON would be compared character by character against every parameter name
+    namespace = {"_class": dataclass_type, "_names": names, "_required": required}
+    # Registered first, so that fields of the same (self-referencing) dataclass resolve to it
+    building[dataclass_type] = lambda data, identities=None: namespace["converter"](
+        data, identities
+    )
+    arguments = []
+    for index, field in enumerate(parameters):
+        hint = hints.get(field.name, field.type)
+        convert = None
+        if not isinstance(hint, InitVar):
+            convert = _field_converter(hint, building)
+        value = f"data[{field.name!r}]"
+        if convert is not None:
+            namespace[f"_convert_{index}"] = convert
+            value = f"_convert_{index}({value}, identities)"
+        if field.default is not MISSING:
+            namespace[f"_default_{index}"] = field.default
+            value = f"{value} if {field.name!r} in data else _default_{index}"
+        elif field.default_factory is not MISSING:
+            namespace[f"_factory_{index}"] = field.default_factory
+            value = f"{value} if {field.name!r} in data else _factory_{index}()"
+        arguments.append(f"        {field.name}={value},")
+
+    source = "\n".join(
+        [
+            "def construct(data, identities):",
+            "    return _class(",
+            *arguments,
+            "    )",
+            "",
+            "def converter(data, identities=None):",
+            "    if not isinstance(data, dict):",
+            "        return data",
+            "    if not (_names.issuperset(data) and _required.issubset(data)):",
+            "        # Unknown or missing fields: let the constructor raise its TypeError",
+            "        return _class(**data)",
+            "    if identities is not None and identities.interns(_class):",
+            "        return identities.instance(_class, data, construct)",
+            "    return construct(data, identities)",
+        ]
+    )
+    exec(
+        compile(source, f"<converter of {dataclass_type.__qualname__}>", "exec"),
+        namespace,
+    )
+    converter = building[dataclass_type] = namespace["converter"]
+    return converter
 
-def from_dict(data: Dict[str, Any], dataclass_type: Type[T]) -> T:
+
+def get_converter(dataclass_type: Type[T]) -> Callable[..., T]:
+    """
+    Returns the function converting a dictionary into an instance of a dataclass, converter(data, identities=None)
+    where identities is an optional IdentityMap. Its conversion plan (the resolved type hints of the fields and
+    the converters of nested dataclasses) is built the first time a dataclass is seen in the process.
+    """
+    converter = _converters.get(dataclass_type)
+    if converter is not None:
+        return converter
+
+    with _converters_lock:
+        converter = _converters.get(dataclass_type)
+        if converter is None:
+            building: Dict[type, Callable] = {}
+            converter = _build_converter(dataclass_type, building)
+            _converters.update(building)
+    return converter
+
+
+class IdentityMap:
+    """
+    Interns the instances built by a conversion: dictionaries of an interned type (UserProfile by default) with
+    the same id and the same contents convert to a single shared instance, whose strings (login, URLs, ...) are
+    interned with sys.intern. Every distinct version of an object seen under the same id (e.g. a user profile
+    before and after an update) is kept, so alternating between them does not rebuild the instances. Shared
+    instances must be treated as immutable.
+    """
+
+    def __init__(self, types: Tuple[type, ...] = (UserProfile,), key: str = "id"):
+        self.types = tuple(types)
+        self.key = key
+        # (type, id) -> [(the dictionary with interned strings, the instance built from it), ...]
+        self._instances: Dict[Tuple[type, Any], List[Tuple[dict, Any]]] = {}
+        self._interned_types: Dict[type, bool] = {}
+
+    def __len__(self) -> int:
+        return sum(len(versions) for versions in self._instances.values())
+
+    def interns(self, dataclass_type: type) -> bool:
+        interned = self._interned_types.get(dataclass_type)
+        if interned is None:
+            interned = self._interned_types[dataclass_type] = issubclass(
+                dataclass_type, self.types
+            )
+        return interned
+
+    def instance(self, dataclass_type: type, data: dict, construct: Callable):
+        """
+        Returns the instance of an equal dictionary seen before, or builds it with construct(data, self).
+        """
+        versions = self._instances.setdefault((dataclass_type, data.get(self.key)), [])
+        for seen, instance in versions:
+            if seen == data:
+                return instance
+        data = {
+            name: intern(value) if type(value) is str else value
+            for name, value in data.items()
+        }
+        instance = construct(data, self)
+        versions.append((data, instance))
+        return instance
+
+
+def from_dict(
+    data: Dict[str, Any], dataclass_type: Type[T], identities: IdentityMap = None
+) -> T:
     """
     Recursively converts a dictionary into a dataclass instance.
 
     Parameters:
-    - data (Dict[str, Any]): The dictionary data to convert into a dataclass.
-    - dataclass_type (Type[T]): The target dataclass type to convert the data into.
+    - data (Dict[str, Any]): The dictionary data to convert into a dataclass. It is not modified.
+    - dataclass_type (Type[T]): The target dataclass type to convert the data into. Fields that are
+      dataclasses, lists of dataclasses or Optional of either are converted too.
+    - identities (IdentityMap, optional): Share the instances of repeated users with earlier conversions.
+      Default is None, every call builds new instances.
 
     Returns:
     - T: The converted dataclass instance.
     """
-    # If data is not a dictionary, return the data as is (base case for recursion)
-    if not isinstance(data, dict):
-        return data
-
-    # Extract field names and types from the dataclass
-    field_types = {f.name: f.type for f in dataclass_type.__dataclass_fields__.values()}
-
-    # Iterate through the dictionary and convert the values to the corresponding dataclass types
-    for key, value in data.items():
-        if key in field_types:
-            field_type = field_types[key]
-
-            # If the value is a list and the dataclass field is a list, handle that separately
-            if (
-                isinstance(value, list)
-                and hasattr(field_type, "__origin__")
-                and field_type.__origin__ == list
-            ):
-                inner_type = field_type.__args__[
-                    0
-                ]  # Get the type of the elements in the list
-                if is_dataclass(inner_type):  # If the list contains dataclass instances
-                    data[key] = [from_dict(item, inner_type) for item in value]
-
-            # If the field type is a dataclass, recursively convert it to the appropriate dataclass
-            elif is_dataclass(field_type):
-                data[key] = from_dict(value, field_type)
-
-    # Return an instance of the dataclass with the updated data
-    return dataclass_type(**data)
+    return get_converter(dataclass_type)(data, identities)
+
+
+def from_dict_many(
+    items: Iterable[Dict[str, Any]],
+    dataclass_type: Type[T],
+    identities: IdentityMap = None,
+) -> List[T]:
+    """
+    Converts a list of dictionaries (e.g. a decoded response body) into dataclass instances, looking up the
+    conversion plan once for the whole batch. The dictionaries are not modified, so the same decoded body
+    can be shared by several callers.
+
+    Parameters:
+    - items (Iterable[Dict[str, Any]]): The dictionaries to convert.
+    - dataclass_type (Type[T]): The target dataclass type.
+    - identities (IdentityMap, optional): Share the instances of repeated users, e.g. so the owner of every
+      repository of a listing is a single instance. Default is None, every item gets its own instances.
+
+    Returns:
+    - List[T]: The converted instances, in the order of the items.
+    """
+    convert = get_converter(dataclass_type)
+    return [convert(item, identities) for item in items]
+
+
+def iter_from_dict(
+    items: Iterable[Dict[str, Any]],
+    dataclass_type: Type[T],
+    identities: IdentityMap = None,
+) -> Iterator[T]:
+    """
+    Streaming form of from_dict_many: yields the converted instances one at a time, e.g. while paginating,
+    without keeping the whole batch in memory. The dictionaries are not modified.
+
+    Parameters:
+    - items (Iterable[Dict[str, Any]]): The dictionaries to convert.
+    - dataclass_type (Type[T]): The target dataclass type.
+    - identities (IdentityMap, optional): Share the instances of repeated users. Default is None, every item
+      gets its own instances.
+
+    Returns:
+    - Iterator[T]: The converted instances, in the order of the items.
+    """
+    convert = get_converter(dataclass_type)
+    for item in items:
+        yield convert(item, identities)
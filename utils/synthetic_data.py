@@ -0,0 +1,429 @@
+import argparse
+import json
+import os
+import random
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, Iterator, List, Optional
+
+from schemas.commits_schema import list_commits_schema
+from schemas.repos_schema import list_repositories_schema
+from schemas.user_schema import user_profile_schema
+from utils.local_api_data import (
+    API_URL,
+    Dataset,
+    commit,
+    fake_sha,
+    public_profile,
+    repository,
+    simple_user,
+    user_profile,
+)
+from utils.schema_validator import validate_json_schema
+
+TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+DEFAULT_START = "2012-01-01T00:00:00Z"
+DEFAULT_END = "2025-01-01T00:00:00Z"
+
+_WORDS = """
+api app atlas beacon bridge cache cli cloud core data deploy docs engine flow forge gateway graph
+hub kit lab lens lite map mesh monitor nexus orbit parser pilot pipeline portal pulse query radar
+relay scout server shell signal spark stack stream studio sync toolkit tracker vault vision web
+worker
+""".split()
+_FIRST_NAMES = """
+Ada Alan Anita Barbara Dennis Donald Edsger Frances Grace Guido Hedy Ken Linus Margaret Radia Shafi
+Sophie Tim Yukihiro Zhang
+""".split()
+_LAST_NAMES = """
+Allen Berners-Lee Hamilton Hopper Kernighan Knuth Lamarr Liskov Lovelace Matsumoto Perlman Ritchie
+Rossum Thompson Torvalds Turing Wilson Yao
+""".split()
+_LANGUAGES = (
+    "Python",
+    "JavaScript",
+    "TypeScript",
+    "Go",
+    "Rust",
+    "Java",
+    "C",
+    "C++",
+    "Ruby",
+    None,
+)
+_COMPANIES = ("@github", "Acme", "Bizerba", "Globex", "Initech", "Umbrella", None)
+_LOCATIONS = (
+    "Badalona",
+    "Barcelona",
+    "Berlin",
+    "Lisbon",
+    "London",
+    "San Francisco",
+    "Tokyo",
+    None,
+)
+_MESSAGES = (
+    "Fix {word} handling",
+    "Add {word} support",
+    "Refactor {word} module",
+    "Update {word} documentation",
+    "Bump {word} dependency",
+    "Remove unused {word} code",
+    "Improve {word} performance",
+    "Test {word} edge cases",
+)
+
+
+def _timestamp(value: datetime) -> str:
+    return value.strftime(TIMESTAMP_FORMAT)
+
+
+def _parse(value: str) -> datetime:
+    return datetime.strptime(value, TIMESTAMP_FORMAT).replace(tzinfo=timezone.utc)
+
+
+class SyntheticDataGenerator:
+    """
+    Generates reproducible, schema-valid GitHub users, repositories and commits at any scale.
+
+    Objects are built with the payload builders of the local API (utils/local_api_data.py), so they have
+    exactly the fields of the user profile, repositories and commits schemas and of the
+    models, with random but plausible values. Every stream (users, the repositories of an owner, the commits
+    of a repository) has its own random generator derived from the seed, so a stream is identical whatever
+    else was generated before it, and the items are yielded one by one to keep memory flat.
+
+    Commit histories are generated newest first, like the commits endpoint returns them: every commit has
+    the next one as first parent, a merge_ratio share of them also merge an older commit, and dates go back
+    in time with random gaps.
+
+    Parameters:
+    - seed (int): Seed of the generated data. Default is 0.
+    - start (str): Earliest creation date of the generated objects. Default is 2012-01-01T00:00:00Z.
+    - end (str): Latest update date of the generated objects. Default is 2025-01-01T00:00:00Z.
+    - api_url (str): Base URL of the URLs in the payloads. Default is https://api.github.com.
+    """
+
+    def __init__(
+        self,
+        seed: int = 0,
+        start: str = DEFAULT_START,
+        end: str = DEFAULT_END,
+        api_url: str = API_URL,
+    ):
+        self.seed = seed
+        self.start = _parse(start)
+        self.end = _parse(end)
+        self.api_url = api_url
+
+    def _random(self, *stream) -> random.Random:
+        return random.Random(":".join(str(part) for part in (self.seed,) + stream))
+
+    def _date_between(
+        self, rng: random.Random, start: datetime, end: datetime
+    ) -> datetime:
+        return start + timedelta(
+            seconds=rng.randint(0, max(0, int((end - start).total_seconds())))
+        )
+
+    def user(self, index: int, login: str = None, type: str = "User") -> dict:
+        """
+        Returns the full (private) profile of the index-th synthetic user.
+        """
+        rng = self._random("user", index)
+        login = (
+            login or f"{rng.choice(_WORDS)}-{rng.choice(_LAST_NAMES).lower()}-{index}"
+        )
+        created_at = self._date_between(rng, self.start, self.end)
+        return user_profile(
+            login,
+            10_000_000 + index,
+            _timestamp(created_at),
+            _timestamp(self._date_between(rng, created_at, self.end)),
+            name=f"{rng.choice(_FIRST_NAMES)} {rng.choice(_LAST_NAMES)}",
+            company=rng.choice(_COMPANIES),
+            blog=rng.choice(("", f"https://{login}.dev")),
+            location=rng.choice(_LOCATIONS),
+            hireable=rng.choice((True, None)),
+            bio=rng.choice((None, f"Working on {rng.choice(_WORDS)} things")),
+            public_repos=rng.randint(0, 200),
+            public_gists=rng.randint(0, 50),
+            followers=int(rng.paretovariate(1.2)) - 1,
+            following=rng.randint(0, 100),
+            type=type,
+            api_url=self.api_url,
+        )
+
+    def users(self, count: int) -> Iterator[dict]:
+        """
+        Yields the public profiles of count synthetic users (indexes 1 to count, 0 is kept for an account).
+        """
+        for index in range(1, count + 1):
+            yield public_profile(self.user(index))
+
+    def repositories(
+        self, owner: dict, count: int, private_ratio: float = 0.3
+    ) -> Iterator[dict]:
+        """
+        Yields count repositories of an owner.
+
+        Parameters:
+        - owner (dict): Profile or simple-user object of the owner.
+        - count (int): Number of repositories.
+        - private_ratio (float): Share of private repositories. Default is 0.3.
+        """
+        rng = self._random("repositories", owner["login"])
+        owner_user = simple_user(
+            owner["login"], owner["id"], type=owner["type"], api_url=self.api_url
+        )
+        width = len(str(count))
+        for index in range(count):
+            created_at = self._date_between(rng, self.start, self.end)
+            updated_at = self._date_between(rng, created_at, self.end)
+            stars = int(rng.paretovariate(1.1)) - 1
+            yield repository(
+                owner_user,
+                f"{rng.choice(_WORDS)}-{rng.choice(_WORDS)}-{index:0{width}d}",
+                20_000_000 + index + owner["id"] * 100_000,
+                _timestamp(created_at),
+                _timestamp(updated_at),
+                _timestamp(self._date_between(rng, created_at, updated_at)),
+                private=rng.random() < private_ratio,
+                description=rng.choice(
+                    (None, f"A {rng.choice(_WORDS)} for {rng.choice(_WORDS)}")
+                ),
+                size=rng.randint(0, 500_000),
+                stargazers_count=stars,
+                language=rng.choice(_LANGUAGES),
+                forks_count=stars // 10,
+                open_issues_count=rng.randint(0, 50),
+                topics=rng.sample(_WORDS, rng.randint(0, 3)),
+                api_url=self.api_url,
+            )
+
+    def contributors(self, repo: dict, count: int) -> List[dict]:
+        """
+        Returns the simple-user objects of the people committing to a repository, the owner first.
+        """
+        owner = repo["owner"]
+        people = [
+            simple_user(owner["login"], owner["id"], type="User", api_url=self.api_url)
+        ]
+        rng = self._random("contributors", repo["full_name"])
+        for _ in range(count - 1):
+            profile = self.user(rng.randrange(1_000_000))
+            people.append(
+                simple_user(profile["login"], profile["id"], api_url=self.api_url)
+            )
+        return people
+
+    def commits(
+        self,
+        repo: dict,
+        count: int,
+        contributors: int = 8,
+        merge_ratio: float = 0.05,
+    ) -> Iterator[dict]:
+        """
+        Yields the count commits of a repository, newest first.
+
+        Parameters:
+        - repo (dict): The repository (see repositories).
+        - count (int): Number of commits.
+        - contributors (int): Number of distinct authors. Default is 8.
+        - merge_ratio (float): Share of merge commits. Default is 0.05.
+        """
+        rng = self._random("commits", repo["full_name"])
+        people = self.contributors(repo, contributors)
+        signatures = [
+            {
+                "name": person["login"],
+                "email": f"{person['login']}@users.noreply.github.com",
+            }
+            for person in people
+        ]
+        shas = lambda number: fake_sha(self.seed, repo["full_name"], number)
+        date, created_at = _parse(repo["pushed_at"]), _parse(repo["created_at"])
+        # Average gap between commits so the history spans (most of) the life of the repository
+        mean_gap = max(1.0, 0.9 * (date - created_at).total_seconds() / max(count, 1))
+
+        for number in range(count):
+            parents = [shas(number + 1)] if number + 1 < count else []
+            if parents and number + 2 < count and rng.random() < merge_ratio:
+                parents.append(
+                    shas(min(count - 1, number + 2 + int(rng.expovariate(0.2))))
+                )
+            author_index = min(int(rng.expovariate(0.5)), len(people) - 1)
+            committed = _timestamp(date)
+            authored = _timestamp(date - timedelta(seconds=rng.randint(0, 3600)))
+            item = commit(
+                repo["full_name"],
+                shas(number),
+                rng.choice(_MESSAGES).format(word=rng.choice(_WORDS)),
+                dict(signatures[author_index], date=authored),
+                dict(signatures[author_index], date=committed),
+                people[author_index],
+                people[author_index],
+                parents=parents,
+                api_url=self.api_url,
+            )
+            yield item
+            date = max(
+                created_at, date - timedelta(seconds=rng.expovariate(1 / mean_gap))
+            )
+
+
+def write_ndjson(path: str, items: Iterable[dict]) -> int:
+    """
+    Streams items to an NDJSON file, one JSON object per line, and returns how many were written.
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    count = 0
+    with open(path, "w", encoding="utf-8") as output:
+        for item in items:
+            output.write(json.dumps(item, ensure_ascii=False, separators=(",", ":")))
+            output.write("\n")
+            count += 1
+    return count
+
+
+def read_ndjson(path: str) -> Iterator[dict]:
+    """
+    Streams the objects of an NDJSON file.
+    """
+    with open(path, encoding="utf-8") as ndjson_file:
+        for line in ndjson_file:
+            if line.strip():
+                yield json.loads(line)
+
+
+def commits_path(directory: str, full_name: str) -> str:
+    owner, name = full_name.split("/")
+    return os.path.join(directory, "commits", owner, f"{name}.ndjson")
+
+
+def generate(
+    directory: str,
+    seed: int = 0,
+    users: int = 100,
+    repositories: int = 100,
+    commits: int = 1000,
+    repositories_with_commits: int = 1,
+    login: str = "synthetic-account",
+    validate: bool = True,
+) -> dict:
+    """
+    Writes a synthetic dataset to a directory, streaming every file:
+    - account.json: Full profile of the account owning the repositories.
+    - users.ndjson: Public profiles of other users.
+    - repositories.ndjson: Repositories of the account.
+    - commits/{owner}/{repo}.ndjson: Commits of the first repositories_with_commits repositories, newest first.
+
+    Parameters:
+    - directory (str): Output directory.
+    - seed (int): Seed of the generated data. Default is 0.
+    - users (int): Number of users. Default is 100.
+    - repositories (int): Number of repositories of the account. Default is 100.
+    - commits (int): Number of commits of each repository with commits. Default is 1000.
+    - repositories_with_commits (int): Number of repositories that get commits. Default is 1.
+    - login (str): Login of the account. Default is 'synthetic-account'.
+    - validate (bool): Whether to validate the first item of every file against the project schemas. Default is True.
+
+    Returns:
+    - dict: Number of items written to every file, by relative path.
+    """
+    generator = SyntheticDataGenerator(seed)
+    account = generator.user(0, login=login)
+    written = {}
+
+    def checked(items: Iterator[dict], schema: dict) -> Iterator[dict]:
+        for index, item in enumerate(items):
+            if validate and index == 0:
+                validate_json_schema(
+                    [item] if schema.get("type") == "array" else item, schema
+                )
+            yield item
+
+    os.makedirs(directory, exist_ok=True)
+    with open(os.path.join(directory, "account.json"), "w", encoding="utf-8") as output:
+        if validate:
+            validate_json_schema(account, user_profile_schema())
+        json.dump(account, output, ensure_ascii=False)
+    written["account.json"] = 1
+    written["users.ndjson"] = write_ndjson(
+        os.path.join(directory, "users.ndjson"),
+        checked(generator.users(users), user_profile_schema()),
+    )
+
+    with_commits = []
+
+    def repositories_stream():
+        for repo in generator.repositories(account, repositories):
+            if len(with_commits) < repositories_with_commits:
+                with_commits.append(repo)
+            yield repo
+
+    written["repositories.ndjson"] = write_ndjson(
+        os.path.join(directory, "repositories.ndjson"),
+        checked(repositories_stream(), list_repositories_schema()),
+    )
+    for repo in with_commits:
+        path = commits_path(directory, repo["full_name"])
+        written[os.path.relpath(path, directory)] = write_ndjson(
+            path, checked(generator.commits(repo, commits), list_commits_schema())
+        )
+    return written
+
+
+def load_dataset(directory: str, token: str = None) -> Dataset:
+    """
+    Loads a generated directory into a Dataset for the local API server. The whole dataset is held in
+    memory, so keep commit histories to a few hundred thousand commits.
+
+    Parameters:
+    - directory (str): Directory written by generate().
+    - token (str, optional): Token authenticating as the account. Default is GITHUB_TOKEN, or 'local-token'.
+    """
+    dataset = Dataset()
+    with open(
+        os.path.join(directory, "account.json"), encoding="utf-8"
+    ) as account_file:
+        account = json.load(account_file)
+    dataset.add_user(account, token=token or os.getenv("GITHUB_TOKEN") or "local-token")
+    for profile in read_ndjson(os.path.join(directory, "users.ndjson")):
+        dataset.add_user(profile)
+    for repo in read_ndjson(os.path.join(directory, "repositories.ndjson")):
+        dataset.add_repository(repo)
+        path = commits_path(directory, repo["full_name"])
+        if os.path.exists(path):
+            for item in read_ndjson(path):
+                dataset.add_commit(repo["full_name"], item)
+    return dataset
+
+
+def main(arguments: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Generate a synthetic GitHub dataset")
+    parser.add_argument("directory")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--repositories", type=int, default=10_000)
+    parser.add_argument("--commits", type=int, default=1_000_000)
+    parser.add_argument("--repositories-with-commits", type=int, default=1)
+    parser.add_argument("--login", default="synthetic-account")
+    args = parser.parse_args(arguments)
+
+    written = generate(
+        args.directory,
+        seed=args.seed,
+        users=args.users,
+        repositories=args.repositories,
+        commits=args.commits,
+        repositories_with_commits=args.repositories_with_commits,
+        login=args.login,
+    )
+    for path, count in written.items():
+        print(f"{path}: {count}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,228 @@
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from models.commit_model import CommitDetail
+from models.repo_model import Repository
+from utils.schema_validator import IdentityMap, get_converter
+from utils.timestamps import datetime64_column
+
+
+def _login(user: Optional[dict]) -> Optional[str]:
+    # Users without a GitHub account come as null or as an empty object
+    return user.get("login") if user else None
+
+
+class _Table:
+    """
+    A struct-of-arrays collection over the items of a list response: every column is a NumPy array with one
+    value per item, and rows are converted to their model only when accessed.
+    """
+
+    model: type
+    # Column name -> (dtype, function reading its value from an item). Other dtypes than numbers, booleans and
+    # datetime64 are kept as object arrays
+    COLUMNS: Dict[str, Tuple[Any, Callable[[dict], Any]]]
+
+    def __init__(
+        self,
+        items: Sequence[dict],
+        columns: Dict[str, np.ndarray] = None,
+        rows: List[Any] = None,
+        identities: IdentityMap = None,
+    ):
+        """
+        Parameters:
+        - items (Sequence[dict]): The decoded items of the response. They are not modified.
+        - columns, rows, identities: Used by the operations deriving a table from another one.
+        """
+        self._items = list(items)
+        self._rows = rows if rows is not None else [None] * len(self._items)
+        self._identities = IdentityMap() if identities is None else identities
+        self._indexes: Dict[str, Dict[Any, np.ndarray]] = {}
+        if columns is None:
+            columns = {}
+            for name, (dtype, read) in self.COLUMNS.items():
+                values = [read(item) for item in self._items]
+                if dtype == "datetime64[s]":
+                    columns[name] = datetime64_column(values)
+                else:
+                    columns[name] = np.array(values, dtype=dtype)
+        self.columns = columns
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __getitem__(self, position: int):
+        return self.row(position)
+
+    def __iter__(self) -> Iterator:
+        return (self.row(position) for position in range(len(self)))
+
+    def row(self, position: int):
+        """
+        Returns the model of the item at a position, converting it the first time it is accessed.
+        """
+        row = self._rows[position]
+        if row is None:
+            row = self._rows[position] = get_converter(self.model)(
+                self._items[position], self._identities
+            )
+        return row
+
+    def column(self, name: str) -> np.ndarray:
+        return self.columns[name]
+
+    def take(self, positions) -> "_Table":
+        """
+        Returns a table with the rows at the given positions (an array of integers), in that order.
+        """
+        positions = np.asarray(positions, dtype=np.intp)
+        return type(self)(
+            [self._items[position] for position in positions],
+            {name: column[positions] for name, column in self.columns.items()},
+            [self._rows[position] for position in positions],
+            self._identities,
+        )
+
+    def where(self, mask: np.ndarray) -> "_Table":
+        """
+        Returns the rows where a boolean array built from the columns is True, e.g.
+        table.where(table.column("stargazers_count") > 10).
+        """
+        return self.take(np.flatnonzero(mask))
+
+    def sort(self, name: str, descending: bool = False) -> "_Table":
+        """
+        Returns the table sorted by a column. The sort is stable, so rows with equal values keep their order.
+        """
+        column = self.columns[name]
+        if column.dtype == object:
+            keys = [(value is None, value) for value in column]
+            positions = sorted(
+                range(len(keys)), key=keys.__getitem__, reverse=descending
+            )
+        elif descending:
+            # Stable descending order: reverse the ascending order of the reversed column
+            positions = len(column) - 1 - np.argsort(column[::-1], kind="stable")[::-1]
+        else:
+            positions = np.argsort(column, kind="stable")
+        return self.take(positions)
+
+    def index(self, name: str) -> Dict[Any, np.ndarray]:
+        """
+        Returns the hash index of a column: every value mapped to the positions of the rows holding it.
+        """
+        index = self._indexes.get(name)
+        if index is None:
+            positions: Dict[Any, List[int]] = {}
+            for position, value in enumerate(self.columns[name].tolist()):
+                positions.setdefault(value, []).append(position)
+            index = self._indexes[name] = {
+                value: np.array(found, dtype=np.intp)
+                for value, found in positions.items()
+            }
+        return index
+
+    def find(self, name: str, value) -> "_Table":
+        """
+        Returns the rows whose column holds a value, through the hash index of the column.
+        """
+        return self.take(self.index(name).get(value, np.empty(0, dtype=np.intp)))
+
+    def first(self, name: str, value):
+        """
+        Returns the model of the first row whose column holds a value.
+
+        Raises an exception: KeyError if there is none.
+        """
+        positions = self.index(name).get(value)
+        if positions is None:
+            raise KeyError(f"No row with {name} {value!r}")
+        return self.row(int(positions[0]))
+
+    def group_by(self, name: str) -> Dict[Any, "_Table"]:
+        """
+        Returns the rows grouped by the values of a column, in the order each value first appears.
+        """
+        return {
+            value: self.take(positions) for value, positions in self.index(name).items()
+        }
+
+
+class RepositoryTable(_Table):
+    """
+    Columnar collection of the repositories of a list response, indexed by id, name and owner login.
+    """
+
+    model = Repository
+    COLUMNS = {
+        "id": (np.int64, lambda repo: repo["id"]),
+        "name": (object, lambda repo: repo["name"]),
+        "full_name": (object, lambda repo: repo["full_name"]),
+        "owner": (object, lambda repo: _login(repo["owner"])),
+        "language": (object, lambda repo: repo["language"]),
+        "visibility": (object, lambda repo: repo["visibility"]),
+        "size": (np.int64, lambda repo: repo["size"]),
+        "stargazers_count": (np.int64, lambda repo: repo["stargazers_count"]),
+        "forks_count": (np.int64, lambda repo: repo["forks_count"]),
+        "open_issues_count": (np.int64, lambda repo: repo["open_issues_count"]),
+        "private": (np.bool_, lambda repo: repo["private"]),
+        "fork": (np.bool_, lambda repo: repo["fork"]),
+        "archived": (np.bool_, lambda repo: repo["archived"]),
+        "created_at": ("datetime64[s]", lambda repo: repo["created_at"]),
+        "updated_at": ("datetime64[s]", lambda repo: repo["updated_at"]),
+        "pushed_at": ("datetime64[s]", lambda repo: repo["pushed_at"]),
+    }
+
+    def by_id(self, id: int) -> Repository:
+        return self.first("id", id)
+
+    def by_name(self, name: str) -> Repository:
+        """
+        Returns the first repository with a name, e.g. the one of a listing of a single owner.
+        """
+        return self.first("name", name)
+
+    def by_owner(self, login: str) -> "RepositoryTable":
+        return self.find("owner", login)
+
+
+class CommitTable(_Table):
+    """
+    Columnar collection of the commits of a list response, indexed by sha and author login.
+    """
+
+    model = CommitDetail
+    COLUMNS = {
+        "sha": (object, lambda commit: commit["sha"]),
+        "author": (object, lambda commit: _login(commit["author"])),
+        "committer": (object, lambda commit: _login(commit["committer"])),
+        "author_name": (
+            object,
+            lambda commit: (commit["commit"]["author"] or {}).get("name"),
+        ),
+        "authored_at": (
+            "datetime64[s]",
+            lambda commit: (commit["commit"]["author"] or {}).get("date"),
+        ),
+        "committed_at": (
+            "datetime64[s]",
+            lambda commit: (commit["commit"]["committer"] or {}).get("date"),
+        ),
+        "comment_count": (np.int64, lambda commit: commit["commit"]["comment_count"]),
+        "parents": (np.int64, lambda commit: len(commit["parents"])),
+        "verified": (
+            np.bool_,
+            lambda commit: commit["commit"]["verification"]["verified"],
+        ),
+    }
+
+    def by_sha(self, sha: str) -> CommitDetail:
+        return self.first("sha", sha)
+
+    def by_author(self, login: str) -> "CommitTable":
+        return self.find("author", login)
+
+    def merges(self) -> "CommitTable":
+        return self.where(self.column("parents") > 1)
@@ -0,0 +1,28 @@
+from typing import TYPE_CHECKING, Iterable, Optional
+
+from models.timestamps import parse_epoch
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+def datetime64_column(values: Iterable[Optional[str]]) -> "np.ndarray":
+    """
+    Parses a whole column of ISO 8601 timestamps at once into a datetime64[s] array, with NaT for None.
+    Its astype("int64") gives the seconds since the epoch.
+
+    Raises an exception: ValueError if a value is not a valid timestamp.
+    """
+    import numpy as np
+
+    values = list(values)
+    if all(value is None or value[-1:] == "Z" for value in values):
+        try:
+            # NumPy parses UTC timestamps in C, once the "Z" its datetime64 does not accept is dropped
+            return np.array(
+                [value[:-1] if value else "NaT" for value in values],
+                dtype="datetime64[s]",
+            )
+        except ValueError:
+            pass
+    return np.array([parse_epoch(value) for value in values], dtype="datetime64[s]")